@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 import logging
 
 from sanruum.config import BaseConfig
+from sanruum.intent_system.intent_artifact import shared_compiled_intents
 
 logger = logging.getLogger(__name__)
 
@@ -13,10 +13,10 @@ DEFAULT_INTENTS: dict = {}
 INTENTS_FILE = BaseConfig.INTENTS_FILE
 
 try:
-    with open(INTENTS_FILE, encoding='utf-8') as f:
-        INTENTS = json.load(f)
+    # Shares the parse (and the compiled matcher) with IntentHandler.
+    INTENTS = shared_compiled_intents(INTENTS_FILE).document
     logger.info('✅ Responses JSON Loaded Successfully!')
-except json.JSONDecodeError as e:
+except ValueError as e:
     logger.error(f'❌ Failed to Decode Responses JSON: {e}')
     INTENTS = DEFAULT_INTENTS
 except FileNotFoundError as e:
@@ -25,3 +25,9 @@ except FileNotFoundError as e:
 except Exception as e:
     logger.error(f'❌ Unexpected Error: {e}')
     INTENTS = DEFAULT_INTENTS
+
+
+def set_intents(document: dict) -> None:
+    """Swap in a reloaded intents document; read it as ``ai_config.INTENTS``."""
+    global INTENTS
+    INTENTS = document
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sanruum.config.base import BaseConfig
+from sanruum.utils.base.logger import logger
+
+
+def fast_cpu_enabled() -> bool:
+    """True when fast CPU inference is switched on and no GPU is available."""
+    if not BaseConfig.FAST_CPU_INFERENCE:
+        return False
+    import torch
+    return not torch.cuda.is_available()
+
+
+def configure_threads(
+        num_threads: int | None = None, interop_threads: int | None = None,
+) -> None:
+    """
+    Set torch's intra-op and inter-op thread pools.
+
+    The inter-op pool can only be sized before torch runs its first parallel
+    work; later attempts are logged and ignored.
+    """
+    import torch
+    if num_threads:
+        torch.set_num_threads(num_threads)
+    if interop_threads:
+        try:
+            torch.set_num_interop_threads(interop_threads)
+        except RuntimeError as e:
+            logger.warning(f'⚠️ Inter-op threads already fixed: {e}')
+
+
+def quantizable_layers(module: Any) -> int:
+    """Number of exact ``nn.Linear`` layers ``quantize_dynamic`` would convert."""
+    import torch
+    return sum(type(child) is torch.nn.Linear for child in module.modules())
+
+
+def quantize_dynamic(module: Any, inplace: bool = False) -> Any:
+    """
+    Dynamic int8 quantisation of the ``nn.Linear`` layers of ``module``.
+
+    Weights are stored as int8 and activations quantised on the fly, which
+    shrinks the weights and speeds up the matrix multiplications that
+    dominate transformer inference on CPU. Only exact ``nn.Linear``
+    instances are replaced; subclasses such as Whisper's ``Linear`` keep
+    their own forward and stay in float32. Unless ``inplace`` is set the
+    module is deep-copied first. Returns the quantised module.
+    """
+    import torch
+    quantized = torch.ao.quantization.quantize_dynamic(  # type: ignore[no-untyped-call]
+        module, {torch.nn.Linear}, dtype=torch.qint8, inplace=inplace,
+    )
+    return quantized
+
+
+def prepare_for_cpu(model: Any, name: str) -> Any:
+    """
+    Apply fast CPU inference settings to a freshly loaded torch model.
+
+    The model is quantised in place; one without eligible layers (Whisper)
+    is returned as is, so it costs neither a copy nor extra memory.
+    """
+    if not fast_cpu_enabled():
+        return model
+    configure_threads(BaseConfig.TORCH_NUM_THREADS, BaseConfig.TORCH_INTEROP_THREADS)
+    model.eval()
+    layers = quantizable_layers(model)
+    if not layers:
+        logger.info(f'{name} has no nn.Linear layers to quantise; kept in float32.')
+        return model
+    quantized = quantize_dynamic(model, inplace=True)
+    logger.info(f'⚡ Quantised {layers} {name} layers to int8 for CPU inference.')
+    return quantized
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from sanruum.ai_core.embedding_service import EmbeddingService
+from sanruum.ai_core.model_registry import EMBEDDER
+from sanruum.ai_core.model_registry import models
+from sanruum.config.base import BaseConfig
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonical form used for cache keys.
+
+    The default model is uncased, so case and runs of whitespace do not
+    change the embedding.
+    """
+    return ' '.join(unicodedata.normalize('NFC', text).split()).casefold()
+
+
+def text_key(text: str) -> bytes:
+    """Content hash of the normalised text."""
+    return hashlib.blake2b(
+        normalize_text(text).encode('utf-8'), digest_size=16,
+    ).digest()
+
+
+class EmbeddingCache:
+    """
+    Bounded LRU cache in front of a sentence embedder.
+
+    Texts that normalise to the same string share one entry, so repeated
+    phrases and the same text passing through several components are only
+    encoded once. Cached vectors are float32 and read-only.
+    """
+
+    def __init__(self, embedder: Any, maxsize: int = 4096) -> None:
+        self.embedder = embedder
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: bytes) -> np.ndarray | None:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def _insert(self, key: bytes, vector: Any) -> np.ndarray:
+        stored = np.array(vector, dtype=np.float32)
+        stored.setflags(write=False)
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return stored
+
+    def encode(self, text: str) -> np.ndarray:
+        """Return the embedding of ``text``, encoding it only on a miss."""
+        key = text_key(text)
+        vector = self._lookup(key)
+        if vector is None:
+            vector = self._insert(key, self.embedder.encode(text))
+        return vector
+
+    def encode_many(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed several texts, encoding all misses in a single batch."""
+        keys = [text_key(text) for text in texts]
+        found: dict[bytes, np.ndarray] = {}
+        missing: dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key in found or key in missing:
+                continue
+            vector = self._lookup(key)
+            if vector is None:
+                missing[key] = text
+            else:
+                found[key] = vector
+        if missing:
+            encoded = np.atleast_2d(self.embedder.encode(list(missing.values())))
+            for key, vector in zip(missing, encoded):
+                found[key] = self._insert(key, vector)
+        if not keys:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([found[key] for key in keys])
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Counters for monitoring how much encoding the cache saves."""
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached vector and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+_shared_caches: dict[str, EmbeddingCache] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_embedding_cache(model_name: str = EMBEDDER) -> EmbeddingCache:
+    """
+    Process-wide cache for the registry model ``model_name``.
+
+    Every memory instance, including per-user ``PersistentAIMemory`` objects,
+    gets the same cache and model this way. Cache misses go through a shared
+    ``EmbeddingService`` unless ``EMBEDDING_BATCH_SIZE`` is 1.
+    """
+    with _shared_lock:
+        cache = _shared_caches.get(model_name)
+        if cache is None:
+            embedder: Any = models.get(model_name)
+            if BaseConfig.EMBEDDING_BATCH_SIZE > 1:
+                embedder = EmbeddingService(
+                    embedder,
+                    max_batch_size=BaseConfig.EMBEDDING_BATCH_SIZE,
+                    max_wait_ms=BaseConfig.EMBEDDING_BATCH_WINDOW_MS,
+                )
+            cache = EmbeddingCache(embedder, maxsize=BaseConfig.EMBEDDING_CACHE_SIZE)
+            _shared_caches[model_name] = cache
+        return cache
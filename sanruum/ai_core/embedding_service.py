@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from sanruum.ai_core.micro_batcher import MicroBatcher
+
+
+class EmbeddingService:
+    """
+    Shared embedding worker that batches ``encode`` calls across callers.
+
+    Exposes the same ``encode`` signature as the sentence transformer it
+    wraps, so it can stand in for the model anywhere. Single sentences from
+    concurrent sessions are merged into one batched forward pass.
+    """
+
+    def __init__(
+            self, model: Any, max_batch_size: int = 32, max_wait_ms: float = 5.0,
+    ) -> None:
+        self.model = model
+        self.batcher: MicroBatcher[str, np.ndarray] = MicroBatcher(
+            self._encode_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            name='embedding-batcher',
+        )
+
+    def _encode_batch(self, texts: list[str]) -> list[np.ndarray]:
+        vectors = np.atleast_2d(self.model.encode(texts, batch_size=len(texts)))
+        return list(vectors)
+
+    def encode(self, sentences: str | list[str], **kwargs: Any) -> np.ndarray:
+        """
+        Embed one sentence (1-D result) or a list of sentences (2-D result).
+
+        Keyword arguments other than the defaults cannot be shared with other
+        callers' requests, so those calls go straight to the model.
+        """
+        if kwargs:
+            return np.asarray(self.model.encode(sentences, **kwargs))
+        if isinstance(sentences, str):
+            return self.batcher(sentences)
+        if not sentences:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack(self.batcher.map(sentences))
+
+    def stats(self) -> dict[str, Any]:
+        """Batch-size and queue-wait histograms of the worker."""
+        return self.batcher.stats()
+
+    def close(self) -> None:
+        self.batcher.close()
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import os
+import struct
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+from typing import IO
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+MAGIC = b'SNRVEC1\0'
+HEADER = struct.Struct('<8sII')  # magic, float width in bits, dimension
+DTYPES = {16: np.float16, 32: np.float32}
+
+
+class EmbeddingStore:
+    """
+    Append-only binary file of embeddings, memory-mapped for reads.
+
+    Each record is an int64 vector id followed by the vector as raw
+    float16/float32. Ids only ever grow, so the file stays sorted by id and
+    lookups are a binary search over the memory-mapped id column. Callers
+    keep the id next to their text and metadata instead of the floats.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], dtype: str = 'float32') -> None:
+        self.path = Path(path)
+        self.dtype = np.dtype(dtype)
+        if self.dtype.itemsize * 8 not in DTYPES:
+            raise ValueError(f'Unsupported embedding dtype: {dtype}')
+        self.dim: int | None = None
+        self._record: np.dtype | None = None
+        self._view: np.memmap | None = None
+        self._count = 0
+        self._next_id = 0
+        self._file: IO[bytes] | None = None
+        self._lock = threading.RLock()
+        self._open_existing()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def next_id(self) -> int:
+        return self._next_id
+
+    def _set_layout(self, dim: int) -> None:
+        self.dim = dim
+        self._record = np.dtype([('id', '<i8'), ('vector', self.dtype, (dim,))])
+
+    def _open_existing(self) -> None:
+        if not self.path.exists() or self.path.stat().st_size < HEADER.size:
+            return
+        with self.path.open('rb') as f:
+            magic, bits, dim = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or bits not in DTYPES:
+            raise ValueError(f'{self.path} is not an embedding store')
+        # Vectors keep the precision they were written with.
+        self.dtype = np.dtype(DTYPES[bits])
+        self._set_layout(dim)
+        assert self._record is not None
+        # A torn record at the end (crash mid-append) is ignored and later
+        # overwritten.
+        self._count = (self.path.stat().st_size - HEADER.size) // self._record.itemsize
+        ids = self._ids()
+        self._next_id = int(ids[-1]) + 1 if len(ids) else 0
+
+    def _records(self) -> np.ndarray:
+        if self._count == 0 or self._record is None:
+            return np.empty(0, dtype=self._record or np.dtype([('id', '<i8')]))
+        if self._view is None or self._view.shape[0] != self._count:
+            if self._file is not None:
+                self._file.flush()
+            with self.path.open('rb') as f:
+                self._view = np.memmap(
+                    f, dtype=self._record, mode='r',
+                    offset=HEADER.size, shape=(self._count,),
+                )
+        return self._view
+
+    def _ids(self) -> np.ndarray:
+        records = self._records()
+        return records['id'] if len(records) else np.empty(0, dtype=np.int64)
+
+    def _writer(self) -> IO[bytes]:
+        if self._file is None:
+            assert self._record is not None and self.dim is not None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if not self.path.exists() or self.path.stat().st_size < HEADER.size:
+                with self.path.open('wb') as f:
+                    f.write(HEADER.pack(MAGIC, self.dtype.itemsize * 8, self.dim))
+            self._file = self.path.open('r+b')
+            self._file.truncate(HEADER.size + self._count * self._record.itemsize)
+            self._file.seek(0, os.SEEK_END)
+        return self._file
+
+    def add(self, vector: ArrayLike) -> int:
+        """Append one vector and return its id."""
+        return self.add_many(np.atleast_2d(vector))[0]
+
+    def add_many(self, vectors: ArrayLike) -> list[int]:
+        """Append several vectors (one per row) and return their ids."""
+        rows = np.atleast_2d(np.asarray(vectors))
+        if not rows.shape[0]:
+            return []
+        with self._lock:
+            if self.dim is None:
+                self._set_layout(rows.shape[1])
+            elif rows.shape[1] != self.dim:
+                raise ValueError(
+                    f'Expected vectors of dimension {self.dim}, got {rows.shape[1]}',
+                )
+            assert self._record is not None
+            ids = list(range(self._next_id, self._next_id + rows.shape[0]))
+            block = np.empty(rows.shape[0], dtype=self._record)
+            block['id'] = ids
+            block['vector'] = rows
+            writer = self._writer()
+            writer.write(block.tobytes())
+            writer.flush()
+            self._count += rows.shape[0]
+            self._next_id += rows.shape[0]
+            return ids
+
+    def get_many(self, vector_ids: Iterable[int]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Look up vectors by id.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: A float32 matrix with one row per
+             requested id and a boolean mask of which ids were found.
+        """
+        wanted = np.fromiter(vector_ids, dtype=np.int64)
+        with self._lock:
+            records = self._records()
+            dim = self.dim or 0
+            if not len(records) or not len(wanted):
+                return (
+                    np.zeros((len(wanted), dim), dtype=np.float32),
+                    np.zeros(len(wanted), dtype=bool),
+                )
+            ids = records['id']
+            rows = np.clip(np.searchsorted(ids, wanted), 0, len(ids) - 1)
+            found = ids[rows] == wanted
+            vectors = np.zeros((len(wanted), dim), dtype=np.float32)
+            vectors[found] = records['vector'][rows[found]]
+            return vectors, found
+
+    def get(self, vector_id: int) -> np.ndarray | None:
+        """Return a single vector, or None if the id is unknown."""
+        vectors, found = self.get_many([vector_id])
+        return vectors[0] if found[0] else None
+
+    def compact(self, live_ids: Iterable[int], keep_from: int | None = None) -> int:
+        """
+        Rewrite the file keeping only ``live_ids`` and any id at or above
+        ``keep_from`` (vectors appended after the caller took its snapshot).
+
+        Returns:
+            int: The number of vectors dropped.
+        """
+        live = np.fromiter(live_ids, dtype=np.int64)
+        with self._lock:
+            records = self._records()
+            if not len(records):
+                return 0
+            keep = np.isin(records['id'], live)
+            if keep_from is not None:
+                keep |= records['id'] >= keep_from
+            dropped = int(len(records) - keep.sum())
+            if not dropped:
+                return 0
+
+            assert self.dim is not None
+            # Windows cannot replace a file that is still mapped, so copy the
+            # kept rows into RAM and drop every view of the old file first.
+            kept = np.array(records[keep])
+            del records
+            self.close()
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            with tmp_path.open('wb') as f:
+                f.write(HEADER.pack(MAGIC, self.dtype.itemsize * 8, self.dim))
+                f.write(kept.tobytes())
+            os.replace(tmp_path, self.path)
+            self._count -= dropped
+            return dropped
+
+    def clear(self) -> None:
+        """Delete every vector; ids keep increasing afterwards."""
+        with self._lock:
+            self.close()
+            self.path.unlink(missing_ok=True)
+            self._count = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._view = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def move_inline_vectors(memory: dict[str, Any], store: EmbeddingStore) -> int:
+    """
+    Move the ``vector`` lists that older memory dicts kept on each item into
+    ``store``, replacing them with a ``vector_id``. Empty lists are dropped.
+
+    Returns:
+        int: The number of items that carried an inline vector.
+    """
+    items = [
+        item for topic_items in memory.values() if isinstance(topic_items, list)
+        for item in topic_items if isinstance(item, dict) and 'vector' in item
+    ]
+    with_vectors = [item for item in items if item['vector']]
+    if with_vectors:
+        vector_ids = store.add_many(
+            np.array([item['vector'] for item in with_vectors], dtype=np.float32),
+        )
+        for item, vector_id in zip(with_vectors, vector_ids):
+            item['vector_id'] = vector_id
+    for item in items:
+        del item['vector']
+    return len(items)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Sequence
+from typing import Any
+from typing import NamedTuple
+
+import numpy as np
+
+from sanruum.ai_core.vector_index import normalize_rows
+from sanruum.ai_core.vector_index import top_k
+from sanruum.monitor.metrics import Histogram
+
+LATENCY_MS_BUCKETS = (0.1, 0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Ranks ``labels`` for ``text``, best first (the zero-shot pipeline's output).
+ZeroShot = Callable[[str, list[str]], list[str]]
+
+
+class IntentPrediction(NamedTuple):
+    labels: list[str]  # Best first
+    scores: list[float]
+
+    @property
+    def confidence(self) -> float:
+        return self.scores[0] if self.scores else 0.0
+
+
+class CentroidIntentClassifier:
+    """
+    Nearest-centroid intent classifier over sentence embeddings.
+
+    Each intent is represented by the normalised mean embedding of its
+    patterns, so a prediction costs one embedding (usually already cached by
+    ``AIMemory``) and one small matrix-vector product. Scores are cosine
+    similarities.
+    """
+
+    def __init__(self, encoder: Any) -> None:
+        self.encoder = encoder  # EmbeddingCache or anything with encode/encode_many
+        self.labels: list[str] = []
+        self.centroids = np.empty((0, 0), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def fit(self, intents: Sequence[dict[str, Any]]) -> CentroidIntentClassifier:
+        """Build one centroid per named intent from its patterns."""
+        labels: list[str] = []
+        patterns: list[str] = []
+        owners: list[int] = []
+        for intent in intents:
+            name, examples = intent.get('name'), intent.get('patterns', [])
+            if not name or not examples:
+                continue
+            owners.extend([len(labels)] * len(examples))
+            patterns.extend(examples)
+            labels.append(name)
+        if not labels:
+            self.labels, self.centroids = [], np.empty((0, 0), dtype=np.float32)
+            return self
+
+        vectors = normalize_rows(self.encoder.encode_many(patterns))
+        sums = np.zeros((len(labels), vectors.shape[1]), dtype=np.float32)
+        np.add.at(sums, np.asarray(owners), vectors)
+        self.labels, self.centroids = labels, normalize_rows(sums)
+        return self
+
+    def predict(self, text: str, k: int | None = None) -> IntentPrediction:
+        if not self.labels:
+            return IntentPrediction([], [])
+        scores = self.centroids @ normalize_rows(self.encoder.encode(text))[0]
+        order = top_k(scores, k or len(self.labels))
+        return IntentPrediction(
+            [self.labels[i] for i in order], [float(scores[i]) for i in order],
+        )
+
+
+class IntentClassifier:
+    """
+    Two-stage intent classification: the centroid classifier answers when
+    its confidence reaches ``threshold``, otherwise the zero-shot model is
+    consulted. Only the winning label is returned, so callers never act on
+    an intent that merely ranked somewhere below it.
+
+    Latency is recorded per stage. Whenever both stages ran on the same text
+    (every fallback, plus a ``shadow_rate`` share of confident predictions)
+    their top labels are compared, so the agreement rate shows whether the
+    threshold can be lowered.
+    """
+
+    def __init__(
+            self,
+            fast: CentroidIntentClassifier,
+            zero_shot: ZeroShot,
+            threshold: float = 0.6,
+            shadow_rate: float = 0.0,
+    ) -> None:
+        self.fast = fast
+        self.zero_shot = zero_shot
+        self.threshold = threshold
+        self.shadow_rate = shadow_rate
+        self.fast_latency_ms = Histogram(LATENCY_MS_BUCKETS)
+        self.zero_shot_latency_ms = Histogram(LATENCY_MS_BUCKETS)
+        self.fast_answers = 0
+        self.fallbacks = 0
+        self.compared = 0
+        self.agreed = 0
+        self._lock = threading.Lock()
+
+    def _run_zero_shot(self, text: str, labels: list[str]) -> list[str]:
+        start = time.perf_counter()
+        ranked = self.zero_shot(text, labels)
+        self.zero_shot_latency_ms.observe((time.perf_counter() - start) * 1000)
+        return ranked
+
+    def _compare(self, fast: IntentPrediction, ranked: list[str]) -> None:
+        with self._lock:
+            self.compared += 1
+            self.agreed += bool(fast.labels and ranked and fast.labels[0] == ranked[0])
+
+    def classify(self, text: str) -> list[str]:
+        """
+        The intent of ``text`` as a one-item list: the centroid classifier's
+        label when confident, else the zero-shot model's best label. Empty
+        when neither has a label.
+        """
+        start = time.perf_counter()
+        prediction = self.fast.predict(text)
+        self.fast_latency_ms.observe((time.perf_counter() - start) * 1000)
+
+        if prediction.labels and prediction.confidence >= self.threshold:
+            with self._lock:
+                self.fast_answers += 1
+            if self.shadow_rate and random.random() < self.shadow_rate:
+                self._compare(prediction, self._run_zero_shot(text, self.fast.labels))
+            return prediction.labels[:1]
+
+        with self._lock:
+            self.fallbacks += 1
+        ranked = self._run_zero_shot(text, self.fast.labels)
+        self._compare(prediction, ranked)
+        return ranked[:1]
+
+    @property
+    def agreement_rate(self) -> float:
+        return self.agreed / self.compared if self.compared else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Answer counts, agreement and per-stage latency histograms."""
+        return {
+            'fast_answers': self.fast_answers,
+            'fallbacks': self.fallbacks,
+            'compared': self.compared,
+            'agreement_rate': self.agreement_rate,
+            'fast_latency_ms': self.fast_latency_ms.snapshot(),
+            'zero_shot_latency_ms': self.zero_shot_latency_ms.snapshot(),
+        }
@@ -1,18 +1,112 @@
 # sanruum/ai_core/memory.py
 from __future__ import annotations
 
+import copy
 import json
 import os.path
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable
+from collections.abc import Iterator
 from typing import Any
+from typing import overload
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 
+from sanruum.ai_core.embedding_cache import EmbeddingCache
+from sanruum.ai_core.embedding_cache import shared_embedding_cache
+from sanruum.ai_core.embedding_store import EmbeddingStore
+from sanruum.ai_core.embedding_store import move_inline_vectors
+from sanruum.ai_core.memory_journal import MemoryJournal
+from sanruum.ai_core.vector_index import create_vector_index
+from sanruum.ai_core.vector_index import KnowledgeMatch
+from sanruum.ai_core.vector_index import load_vector_index
+from sanruum.ai_core.vector_index import normalize_rows
+from sanruum.ai_core.vector_index import VectorIndex
 from sanruum.config.base import BaseConfig
 from sanruum.utils.base.logger import logger
 
 MEMORY_FILE = BaseConfig.MEMORY_FILE
+MEMORY_INDEX_FILE = BaseConfig.MEMORY_INDEX_FILE
+MEMORY_JOURNAL_FILE = BaseConfig.MEMORY_JOURNAL_FILE
+MEMORY_VECTORS_FILE = BaseConfig.MEMORY_VECTORS_FILE
+RELEVANCE_THRESHOLD = 0.3
+# Snapshot key holding the sequence number of the last folded-in journal record
+JOURNAL_SEQ_KEY = '_journal_seq'
+# Evicting down to this share of a limit leaves room before the next sweep
+EVICTION_LOW_WATERMARK = 0.9
+TTL_SWEEP_INTERVAL = 60.0
+
+
+def _item_text(item: Any) -> Any:
+    return item['data'] if isinstance(item, dict) and 'data' in item else item
+
+
+def _last_used(item: Any) -> float:
+    """When a knowledge item was last returned by a search, or stored."""
+    if not isinstance(item, dict):
+        return 0.0
+    return float(item.get('last_hit') or item.get('created') or 0.0)
+
+
+def stamp_unstamped_knowledge(memory: dict[str, Any], now: float) -> int:
+    """
+    Give knowledge items stored before timestamps existed a ``created`` time
+    of ``now``, so eviction treats them as fresh rather than as the oldest.
+
+    Returns:
+        int: The number of stamped items.
+    """
+    stamped = 0
+    for topic, items in memory.items():
+        if topic == 'history' or not isinstance(items, list):
+            continue
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                items[position] = item = {'data': item}
+            if not _last_used(item):
+                item['created'] = now
+                stamped += 1
+    return stamped
+
+
+def _pick(change: dict[str, Any], *keys: str) -> dict[str, Any]:
+    # Journals written before binary vector storage carry inline 'vector' lists.
+    return {
+        key: change[key] for key in (*keys, 'vector_id', 'vector') if key in change
+    }
+
+
+def apply_memory_change(memory: dict[str, Any], change: dict[str, Any]) -> int:
+    """
+    Apply a single journal record to a memory dict.
+
+    Returns:
+        int: The number of knowledge items removed by a ``forget`` record.
+    """
+    op = change['op']
+    if op == 'message':
+        memory.setdefault('history', []).append(_pick(change, 'role', 'message'))
+    elif op == 'knowledge':
+        memory.setdefault(change['topic'], []).append(_pick(change, 'data', 'created'))
+    elif op == 'forget':
+        topic, data = change['topic'], change.get('data')
+        items = memory.get(topic)
+        if topic == 'history' or not isinstance(items, list):
+            return 0
+        kept = [
+            item for item in items
+            if data is not None and _item_text(item) != data
+        ]
+        if kept:
+            memory[topic] = kept
+        else:
+            del memory[topic]
+        return len(items) - len(kept)
+    else:
+        logger.warning(f'⚠️ Unknown memory journal operation: {op}')
+    return 0
 
 
 class AIMemory:
@@ -24,92 +118,318 @@ class AIMemory:
             memory_limit (int): The number of messages to store in memory.
         """
         self.memory_limit = memory_limit
-        self.memory: dict[str, Any] = self.load_memory()
+        self.compact_every = BaseConfig.MEMORY_COMPACT_EVERY
+        self.dedup_threshold = BaseConfig.KNOWLEDGE_DEDUP_THRESHOLD
+        self.dedup_scope = BaseConfig.KNOWLEDGE_DEDUP_SCOPE
+        self.max_items_per_topic = BaseConfig.KNOWLEDGE_MAX_PER_TOPIC
+        self.max_knowledge_items = BaseConfig.KNOWLEDGE_MAX_ITEMS
+        self.knowledge_ttl = BaseConfig.KNOWLEDGE_TTL_SECONDS
+        self._next_ttl_sweep = 0.0
+        self._knowledge_version = 0
+        self._journal_seq = 0
+        # Held while the memory dict changes together with its journal record,
+        # and while a snapshot is taken. Reentrant for eviction during a store.
+        self._journal_lock = threading.RLock()
+        self._snapshot_lock = threading.Lock()
+        self._compaction: threading.Thread | None = None
         self.last_intent: str | None = None
         self.reminders: list[str] = []
 
+        self.embeddings: EmbeddingCache | None
         try:
-            self.embedder = SentenceTransformer('all-MiniLM-L6-v2')
+            self.embeddings = shared_embedding_cache()
         except Exception as e:
             logger.error(f'❌ Failed to load SentenceTransformer: {e}')
-            self.embedder = None
+            self.embeddings = None
+
+        self.knowledge_index: VectorIndex = create_vector_index(
+            BaseConfig.VECTOR_INDEX_BACKEND, **BaseConfig.VECTOR_INDEX_PARAMS,
+        )
+        self._index_dirty = False
+        self.memory: dict[str, Any] = {'history': []}
+        self.index_file: str | os.PathLike[str] = MEMORY_INDEX_FILE
+        self.open_storage()
+
+    def open_storage(self) -> None:
+        """
+        Open the shared journal, embedding store and index, and load the
+        memory from them. Subclasses that keep memory elsewhere override this
+        so the shared memory is never read for them.
+        """
+        self.journal = MemoryJournal(
+            MEMORY_JOURNAL_FILE, fsync=BaseConfig.MEMORY_JOURNAL_FSYNC,
+        )
+        self.vectors = EmbeddingStore(
+            MEMORY_VECTORS_FILE, dtype=BaseConfig.EMBEDDING_DTYPE,
+        )
+        self.memory = self.load_memory()
+        migrated = self.move_vectors_to_store(self.memory)
+        self.load_knowledge_index()
+        if migrated:
+            # Without a snapshot the inline vectors would be re-added next start.
+            self.save_memory()
+
+    def close(self) -> None:
+        """Release the journal and embedding file handles; both reopen on use."""
+        self.journal.close()
+        self.vectors.close()
+
+    @property
+    def knowledge_version(self) -> int:
+        """Counter bumped whenever stored knowledge changes."""
+        return self._knowledge_version
+
+    @property
+    def embedder(self) -> Any:
+        """The sentence embedder behind the embedding cache, if one loaded."""
+        return self.embeddings.embedder if self.embeddings is not None else None
+
+    @embedder.setter
+    def embedder(self, embedder: Any) -> None:
+        # Cached vectors belong to one model, so a new embedder gets its own cache.
+        self.embeddings = (
+            EmbeddingCache(embedder, maxsize=BaseConfig.EMBEDDING_CACHE_SIZE)
+            if embedder is not None else None
+        )
 
     def store_message(self, role: str, message: str) -> None:
         """Store a message while keeping the latest ones."""
-        if self.embedder:
-            vector = self.embedder.encode(message).tolist()
-        else:
-            vector = []
-        self.memory.setdefault('history', []).append(
-            {'role': role, 'message': message, 'vector': vector},
-        )
-        self.memory['history'] = self.memory['history'][-self.memory_limit:]
-        self.save_memory()
+        change: dict[str, Any] = {'op': 'message', 'role': role, 'message': message}
+        if self.embeddings is not None:
+            change['vector_id'] = self.vectors.add(self.embeddings.encode(message))
+        with self._journal_lock:
+            apply_memory_change(self.memory, change)
+            self.memory['history'] = self.memory['history'][-self.memory_limit:]
+            self.append_to_journal(change)
 
-    @staticmethod
-    def load_memory() -> dict[str, Any]:
-        """Load AI memory from file."""
+    def load_memory(self) -> dict[str, Any]:
+        """Load the memory snapshot and replay journal records written after it."""
+        memory: dict[str, Any] = {'history': []}
+        self._journal_seq = 0
         if os.path.exists(MEMORY_FILE):
             try:
                 with open(MEMORY_FILE, encoding='utf-8') as f:
                     data = json.load(f)
-                    return {'history': data.get('history', [])}
+                    memory = {
+                        topic: items for topic, items in data.items()
+                        if topic != 'history' and isinstance(items, list)
+                    }
+                    memory['history'] = data.get('history', [])
+                    self._journal_seq = int(data.get(JOURNAL_SEQ_KEY, 0))
             except json.JSONDecodeError:
                 logger.error('❌ Memory file corrupted, resetting memory')
-        return {'history': []}
+
+        replayed = 0
+        for change in self.journal.records():
+            seq = change.get('seq', 0)
+            if isinstance(seq, int) and seq > self._journal_seq:
+                apply_memory_change(memory, change)
+                self._journal_seq = seq
+                replayed += 1
+        if replayed:
+            logger.info(f'✅ Replayed {replayed} memory journal records.')
+        memory['history'] = memory['history'][-self.memory_limit:]
+        stamp_unstamped_knowledge(memory, time.time())
+        return memory
+
+    def move_vectors_to_store(self, memory: dict[str, Any]) -> int:
+        """
+        Move inline ``vector`` lists from older memory files into the store.
+
+        Returns:
+            int: The number of items that carried an inline vector.
+        """
+        moved = move_inline_vectors(memory, self.vectors)
+        if moved:
+            logger.info(f'✅ Moved {moved} embeddings to binary storage.')
+        return moved
+
+    def live_vector_ids(self) -> set[int]:
+        """Ids of every stored vector still referenced from memory."""
+        return {
+            item['vector_id']
+            for items in self.memory.values() if isinstance(items, list)
+            for item in items if isinstance(item, dict) and 'vector_id' in item
+        }
+
+    def compact_vectors(self, live_ids: set[int], keep_from: int) -> None:
+        """Drop unreferenced vectors once they outnumber the live ones."""
+        if len(self.vectors) <= 2 * len(live_ids):
+            return
+        try:
+            dropped = self.vectors.compact(live_ids, keep_from=keep_from)
+            logger.debug(f'Dropped {dropped} unreferenced embeddings.')
+        except Exception as e:
+            logger.error(f'❌ Failed to compact embedding store: {e}')
+
+    def append_to_journal(self, change: dict[str, Any]) -> None:
+        """Persist a single change by appending it to the memory journal."""
+        with self._journal_lock:
+            self._journal_seq += 1
+            change['seq'] = self._journal_seq
+            try:
+                self.journal.append(change)
+            except Exception as e:
+                logger.error(f'❌ Failed to write memory journal: {e}')
+                return
+        if self.journal.records_written >= self.compact_every:
+            self.compact_in_background()
+
+    def compact_in_background(self) -> None:
+        """Fold the journal into a new snapshot on a background thread."""
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+        self._compaction = threading.Thread(
+            target=self.save_memory, name='memory-compaction', daemon=True,
+        )
+        self._compaction.start()
 
     def save_memory(self) -> None:
-        """Save AI memory to file."""
+        """Write a full memory snapshot and drop the journal records it covers."""
+        with self._snapshot_lock:
+            with self._journal_lock:
+                # Items are copied too: hits stamp them while the file is written.
+                snapshot: dict[str, Any] = copy.deepcopy(self.memory)
+                snapshot[JOURNAL_SEQ_KEY] = self._journal_seq
+                live_ids = self.live_vector_ids()
+                vectors_watermark = self.vectors.next_id
+                self.journal.rotate()
+            try:
+                tmp_file = f'{MEMORY_FILE}.tmp'
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f)
+                os.replace(tmp_file, MEMORY_FILE)
+                self.journal.discard_rotated()
+            except Exception as e:
+                logger.error(f'❌ Failed to save memory: {e}')
+                return
+            self.compact_vectors(live_ids, vectors_watermark)
+            self.save_knowledge_index()
+
+    def save_knowledge_index(self) -> None:
+        """Write the similarity index next to the memory file if it changed."""
+        if not self._index_dirty:
+            return
         try:
-            with open(MEMORY_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.memory, f, indent=4)
+            self.knowledge_index.save(self.index_file)
+            self._index_dirty = False
         except Exception as e:
-            logger.error(f'❌ Failed to save memory: {e}')
+            logger.error(f'❌ Failed to save knowledge index: {e}')
+
+    def load_knowledge_index(self) -> None:
+        """Restore the saved similarity index, rebuilding it when stale."""
+        if os.path.exists(self.index_file):
+            try:
+                index = load_vector_index(self.index_file)
+                stored = Counter(
+                    (topic, str(_item_text(item)))
+                    for topic, item in self._iter_knowledge_items()
+                )
+                if (
+                        index.backend == self.knowledge_index.backend
+                        and Counter(index.items()) == stored
+                ):
+                    self.knowledge_index = index
+                    self._index_dirty = False
+                    return
+                logger.debug('Saved knowledge index is stale, rebuilding.')
+            except Exception as e:
+                logger.error(f'❌ Failed to load knowledge index: {e}')
+        self.rebuild_knowledge_index()
+
+    def _iter_knowledge_items(self) -> Iterator[tuple[str, Any]]:
+        """Yield ``(topic, item)`` for every stored knowledge item."""
+        for topic, items in self.memory.items():
+            if topic != 'history' and isinstance(items, list):
+                for item in items:
+                    yield topic, item
+
+    def rebuild_knowledge_index(self) -> None:
+        """Rebuild the similarity index from the knowledge held in memory."""
+        self.knowledge_index.clear()
+        self._index_dirty = True
+        if self.embeddings is None:
+            return
 
+        topics: list[str] = []
+        texts: list[str] = []
+        vector_ids: list[int] = []
+        for topic, item in self._iter_knowledge_items():
+            topics.append(topic)
+            texts.append(str(_item_text(item)))
+            vector_ids.append(
+                item.get('vector_id', -1) if isinstance(item, dict) else -1,
+            )
+        if not topics:
+            return
+
+        vectors, found = self.vectors.get_many(vector_ids)
+        # Items stored without an embedding are encoded in one batch.
+        missing = np.flatnonzero(~found)
+        if missing.size:
+            encoded = self.embeddings.encode_many([texts[i] for i in missing])
+            if vectors.shape[1] != encoded.shape[1]:
+                vectors = np.zeros((len(topics), encoded.shape[1]), dtype=np.float32)
+            vectors[missing] = encoded
+        self.knowledge_index.add_many(topics, texts, vectors)
+        logger.debug(f'Knowledge index rebuilt with {len(self.knowledge_index)} items.')
+
+    @overload
     def find_relevant_knowledge(self, query: str) -> str | None:
-        """Find the most relevant stored knowledge based on similarity."""
-        if not self.embedder:
-            logger.error('No embedder available for computing query vector.')
-            return None
+        ...
 
-        query_vector = self.embedder.encode(query).reshape(1, -1)
+    @overload
+    def find_relevant_knowledge(self, query: str, k: int) -> list[KnowledgeMatch]:
+        ...
 
-        best_match = None
-        best_score = -1
+    def find_relevant_knowledge(
+            self, query: str, k: int | None = None,
+    ) -> str | list[KnowledgeMatch] | None:
+        """
+        Find the most relevant stored knowledge based on similarity.
 
-        knowledge = self.get_all_knowledge()
-        if not knowledge:
-            logger.debug('No stored knowledge!')
-            return None
+        Parameters:
+            query (str): The text to look up.
+            k (int | None): When given, return up to ``k`` scored matches
+             above the relevance threshold instead of the best text only;
+             ``k <= 0`` returns no matches.
+        """
+        if k is not None and k <= 0:
+            return []
+        if self.embeddings is None:
+            logger.error('No embedder available for computing query vector.')
+            return None if k is None else []
 
-        for topic, items in knowledge.items():
-            for item in items:
-                # Use cached embedding if available
-                if isinstance(item, dict) and 'vector' in item:
-                    candidate_text = item['data']
-                    candidate_vector = np.array(item['vector']).reshape(1, -1)
-                else:
-                    candidate_text = item
-                    candidate_vector = self.embedder.encode(
-                        candidate_text,
-                    ).reshape(1, -1)
-
-                similarity = cosine_similarity(query_vector, candidate_vector)[0][0]
-                logger.debug(
-                    f"Comparing '{query}' to"
-                    f" '{candidate_text}' → similarity: {similarity}",
-                )
+        if not len(self.knowledge_index):
+            logger.debug('No stored knowledge!')
+            return None if k is None else []
 
-                if similarity > best_score:
-                    best_match = candidate_text
-                    best_score = similarity
+        query_vector = self.embeddings.encode(query)
+        limit = 1 if k is None else k
+        matches = [
+            match for match in self.knowledge_index.search(query_vector, limit)
+            if match.score >= RELEVANCE_THRESHOLD
+        ]
+        self.record_knowledge_hits(matches)
+        if k is not None:
+            return matches
 
-        if best_match is None or best_score < 0.3:
-            logger.debug(f'No relevant match found (best_score: {best_score:.4f}).')
+        if not matches:
+            logger.debug(f"No relevant match found for '{query}'.")
             return None
 
-        logger.debug(f'✅ Best match found: {best_match} (Score: {best_score:.4f})')
-        return best_match
+        best = matches[0]
+        logger.debug(f'✅ Best match found: {best.text} (Score: {best.score:.4f})')
+        return best.text
+
+    def approximate_size(self) -> int:
+        """Rough number of bytes held in RAM by the stored texts and the index."""
+        with self._journal_lock:
+            text_bytes = sum(
+                len(str(item)) for items in self.memory.values()
+                if isinstance(items, list) for item in items
+            )
+            return text_bytes + self.knowledge_index.nbytes
 
     def get_last_message(self) -> str | None:
         """Return the last message in history."""
@@ -119,25 +439,162 @@ class AIMemory:
                 return last_message
         return None
 
-    def store_knowledge(self, topic: str, data: str) -> None:
-        """Store new information under a topic, caching its embedding."""
-        if self.embedder:
-            vector = self.embedder.encode(data).tolist()
-        else:
-            vector = []
-        knowledge_item = {'data': data, 'vector': vector}
-        self.memory.setdefault(topic.lower(), []).append(knowledge_item)
-        self.save_memory()
+    def record_knowledge_hits(self, matches: Iterable[KnowledgeMatch]) -> None:
+        """
+        Stamp matched items with the current time for LRU eviction. The stamp
+        is not journaled; it reaches disk with the next snapshot.
+        """
+        now = time.time()
+        with self._journal_lock:
+            for match in matches:
+                for item in self.memory.get(match.topic, []):
+                    if isinstance(item, dict) and item.get('data') == match.text:
+                        item['last_hit'] = now
+
+    def is_duplicate_knowledge(
+            self, topic: str, data: str, vector: np.ndarray | None = None,
+    ) -> bool:
+        """Whether ``data`` (nearly) repeats knowledge that is already stored."""
+        if self.dedup_threshold is None:
+            return False
+        items = self.memory.get(topic, [])
+        if any(_item_text(item) == data for item in items):
+            return True
+        if vector is None:
+            return False
+
+        if self.dedup_scope == 'global':
+            matches = self.knowledge_index.search(vector, 1)
+            return bool(matches) and matches[0].score >= self.dedup_threshold
+        vector_ids = [
+            item['vector_id'] for item in items
+            if isinstance(item, dict) and 'vector_id' in item
+        ]
+        stored, found = self.vectors.get_many(vector_ids)
+        if not found.any():
+            return False
+        scores = normalize_rows(stored[found]) @ normalize_rows(vector)[0]
+        return float(scores.max()) >= self.dedup_threshold
+
+    def store_knowledge(self, topic: str, data: str) -> bool:
+        """
+        Store new information under a topic, caching its embedding.
+
+        Returns:
+            bool: False when the item was rejected as a near-duplicate.
+        """
+        topic = topic.lower()
+        change: dict[str, Any] = {
+            'op': 'knowledge', 'topic': topic, 'data': data, 'created': time.time(),
+        }
+        vector = self.embeddings.encode(data) if self.embeddings is not None else None
+        with self._journal_lock:
+            if self.is_duplicate_knowledge(topic, data, vector):
+                logger.debug(f'Skipping duplicate knowledge for {topic}: {data}')
+                return False
+            if vector is not None:
+                change['vector_id'] = self.vectors.add(vector)
+                self.knowledge_index.add(topic, data, vector)
+                self._index_dirty = True
+            apply_memory_change(self.memory, change)
+            self._knowledge_version += 1
+            self.append_to_journal(change)
+        self.evict_knowledge(topic)
+        return True
+
+    def evict_knowledge(self, topic: str | None = None) -> int:
+        """
+        Apply the eviction policy: the per-topic limit (for ``topic``, or every
+        topic), the global limit and, at most once a minute, the TTL. Least
+        recently hit items go first.
+
+        Returns:
+            int: The number of evicted items.
+        """
+        with self._journal_lock:
+            victims: dict[int, tuple[str, Any]] = {}  # id(item) -> (topic, item)
+
+            def evict_oldest(candidates: list[tuple[str, Any]], count: int) -> None:
+                fresh = [pair for pair in candidates if id(pair[1]) not in victims]
+                fresh.sort(key=lambda pair: _last_used(pair[1]))
+                for name, item in fresh[:max(count, 0)]:
+                    victims[id(item)] = (name, item)
+
+            now = time.time()
+            if self.knowledge_ttl is not None and now >= self._next_ttl_sweep:
+                self._next_ttl_sweep = now + TTL_SWEEP_INTERVAL
+                for name, item in self._iter_knowledge_items():
+                    if now - _last_used(item) > self.knowledge_ttl:
+                        victims[id(item)] = (name, item)
+
+            if self.max_items_per_topic is not None:
+                limit = self.max_items_per_topic
+                topics = [topic] if topic is not None else [
+                    name for name, items in self.memory.items()
+                    if name != 'history' and isinstance(items, list)
+                ]
+                for name in topics:
+                    items = self.memory.get(name, [])
+                    if len(items) > limit:
+                        keep = max(1, int(limit * EVICTION_LOW_WATERMARK))
+                        evict_oldest(
+                            [(name, item) for item in items], len(items) - keep,
+                        )
+
+            if self.max_knowledge_items is not None:
+                limit = self.max_knowledge_items
+                total = sum(
+                    len(items) for name, items in self.memory.items()
+                    if name != 'history' and isinstance(items, list)
+                )
+                if total - len(victims) > limit:
+                    keep = max(1, int(limit * EVICTION_LOW_WATERMARK))
+                    evict_oldest(
+                        list(self._iter_knowledge_items()),
+                        total - len(victims) - keep,
+                    )
+
+            evicted = 0
+            forgotten: set[tuple[str, str]] = set()
+            for name, item in victims.values():
+                key = (name, str(_item_text(item)))
+                if key not in forgotten:
+                    forgotten.add(key)
+                    evicted += self.forget_knowledge(name, key[1])
+            if evicted:
+                logger.debug(f'Evicted {evicted} knowledge items.')
+            return evicted
+
+    def forget_knowledge(self, topic: str, data: str | None = None) -> int:
+        """
+        Delete knowledge stored under a topic.
+
+        Parameters:
+            topic (str): The topic to delete from.
+            data (str | None): Only delete items with this text; when omitted
+             the whole topic is removed.
+
+        Returns:
+            int: The number of deleted items.
+        """
+        change = {'op': 'forget', 'topic': topic.lower(), 'data': data}
+        with self._journal_lock:
+            removed = apply_memory_change(self.memory, change)
+            if not removed:
+                return 0
+
+            for item_id in self.knowledge_index.find_ids(topic.lower(), data):
+                self.knowledge_index.remove(item_id)
+            self._index_dirty = True
+            self._knowledge_version += 1
+            self.append_to_journal(change)
+            return removed
 
     def retrieve_knowledge(self, topic: str) -> list[str] | None:
         """Retrieve stored knowledge about a topic."""
         data = self.memory.get(topic.lower(), None)
         if isinstance(data, list):
-            return [
-                item['data']
-                if isinstance(item, dict) and 'data' in item
-                else item for item in data
-            ]
+            return [_item_text(item) for item in data]
         return None
 
     def get_all_knowledge(self) -> dict[str, list[str]]:
@@ -145,11 +602,7 @@ class AIMemory:
         result = {}
         for k, v in self.memory.items():
             if k != 'history' and isinstance(v, list):
-                result[k] = [
-                    item['data'] if isinstance(
-                        item, dict,
-                    ) and 'data' in item else item for item in v
-                ]
+                result[k] = [_item_text(item) for item in v]
         return result
 
     def get_last_intent(self) -> str | None:
@@ -170,7 +623,12 @@ class AIMemory:
 
     def reset_memory(self) -> None:
         """Clears the memory, reminders, and last intent."""
-        self.memory = {'history': []}
+        with self._journal_lock:
+            self.memory = {'history': []}
+            self.knowledge_index.clear()
+            self._index_dirty = True
+            self._knowledge_version += 1
+            self.vectors.clear()
         self.reminders.clear()
         self.last_intent = None
         self.save_memory()
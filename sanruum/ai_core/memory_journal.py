@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from typing import IO
+
+from sanruum.utils.base.logger import logger
+
+
+class MemoryJournal:
+    """
+    Append-only log of memory changes, one JSON record per line.
+
+    Appends cost the same regardless of how much memory has accumulated.
+    ``rotate`` moves the current log aside so a snapshot can be written
+    while new records keep arriving in a fresh file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], fsync: bool = False) -> None:
+        self.path = Path(path)
+        self.rotated_path = self.path.with_name(self.path.name + '.1')
+        self.fsync = fsync
+        self.records_written = 0
+        self._file: IO[str] | None = None
+        self._lock = threading.Lock()
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Write a single record and flush it to the operating system."""
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self.records_written += 1
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """Yield the rotated log followed by the live log, oldest first."""
+        for path in (self.rotated_path, self.path):
+            if not path.exists():
+                continue
+            with open(path, encoding='utf-8') as f:
+                for line_number, line in enumerate(f, start=1):
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line is expected after a crash mid-write.
+                        logger.warning(
+                            '⚠️ Skipping unreadable journal record '
+                            f'{path}:{line_number}',
+                        )
+                        continue
+                    if isinstance(record, dict) and 'op' in record:
+                        yield record
+
+    def rotate(self) -> None:
+        """Move the live log aside; later appends start a new file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self.path.exists():
+                if self.rotated_path.exists():
+                    # An earlier compaction did not finish; keep both logs.
+                    with open(self.rotated_path, 'a', encoding='utf-8') as rotated:
+                        rotated.write(self.path.read_text(encoding='utf-8'))
+                    self.path.unlink()
+                else:
+                    os.replace(self.path, self.rotated_path)
+            self.records_written = 0
+
+    def discard_rotated(self) -> None:
+        """Delete the rotated log once its records are in a snapshot."""
+        self.rotated_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
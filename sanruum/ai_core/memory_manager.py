@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from sanruum.ai_core.persistent_memory import PersistentAIMemory
+from sanruum.config.base import BaseConfig
+from sanruum.utils.base.logger import logger
+
+
+def _managed_memory(user_id: str) -> PersistentAIMemory:
+    return PersistentAIMemory(user_id, write_through=False)
+
+
+class MemoryManager:
+    """
+    Keeps the memories of recently active users in RAM.
+
+    Memories are handed out from an LRU keyed by user id, so a hot user is a
+    dict lookup and only ``max_users`` memories (or ``ram_budget_bytes`` worth
+    of them) are ever resident, however many user files exist on disk.
+    Changes only mark a memory dirty; a background thread writes dirty
+    memories back every ``flush_interval`` seconds and eviction flushes the
+    evicted memory first. A user is never loaded while it is being loaded by
+    another thread or its evicted memory is still being written back, so a
+    load always sees the latest saved state.
+    """
+
+    def __init__(
+            self,
+            max_users: int = BaseConfig.MEMORY_MANAGER_MAX_USERS,
+            ram_budget_bytes: int | None = BaseConfig.MEMORY_MANAGER_RAM_BUDGET,
+            flush_interval: float | None = BaseConfig.MEMORY_FLUSH_INTERVAL,
+            factory: Callable[[str], PersistentAIMemory] = _managed_memory,
+    ) -> None:
+        if max_users < 1:
+            raise ValueError('max_users must be at least 1')
+        self.max_users = max_users
+        self.ram_budget_bytes = ram_budget_bytes
+        self.flush_interval = flush_interval
+        self.factory = factory
+        self.loads = 0
+        self.evictions = 0
+        self._memories: OrderedDict[str, PersistentAIMemory] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Signalled whenever a load finishes or an evicted memory is written.
+        self._settled = threading.Condition(self._lock)
+        self._loading: set[str] = set()
+        self._flushing: dict[str, PersistentAIMemory] = {}
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if flush_interval:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name='memory-flusher', daemon=True,
+            )
+            self._flusher.start()
+
+    def __len__(self) -> int:
+        return len(self._memories)
+
+    def __contains__(self, user_id: object) -> bool:
+        return user_id in self._memories
+
+    def get(self, user_id: str) -> PersistentAIMemory:
+        """Return the user's memory, loading it from disk on a miss."""
+        with self._lock:
+            while user_id in self._loading or user_id in self._flushing:
+                self._settled.wait()
+            memory = self._memories.get(user_id)
+            if memory is not None:
+                self._memories.move_to_end(user_id)
+                return memory
+            self._loading.add(user_id)
+
+        # Disk work happens outside the lock so one cold user does not stall
+        # lookups for the hot ones.
+        try:
+            loaded = self.factory(user_id)
+        except BaseException:
+            with self._lock:
+                self._loading.discard(user_id)
+                self._settled.notify_all()
+            raise
+        with self._lock:
+            self._loading.discard(user_id)
+            self._settled.notify_all()
+            self._memories[user_id] = loaded
+            self._sizes[user_id] = loaded.approximate_size()
+            self.loads += 1
+            victims = self._pop_victims(keep=user_id)
+        self._write_back(victims)
+        return loaded
+
+    def _resident_bytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def _over_budget(self) -> bool:
+        if len(self._memories) > self.max_users:
+            return True
+        return (
+            self.ram_budget_bytes is not None
+            and self._resident_bytes() > self.ram_budget_bytes
+        )
+
+    def _pop(self, user_id: str) -> PersistentAIMemory | None:
+        """Move a resident memory to the flushing set (lock held)."""
+        memory = self._memories.pop(user_id, None)
+        self._sizes.pop(user_id, None)
+        if memory is not None:
+            self._flushing[user_id] = memory
+            self.evictions += 1
+        return memory
+
+    def _pop_victims(self, keep: str | None = None) -> list[PersistentAIMemory]:
+        """Remove least recently used memories until within limits (lock held)."""
+        victims = []
+        for user_id in list(self._memories):
+            if not self._over_budget():
+                break
+            if user_id != keep and (memory := self._pop(user_id)) is not None:
+                victims.append(memory)
+        return victims
+
+    def _write_back(self, victims: list[PersistentAIMemory]) -> None:
+        for memory in victims:
+            try:
+                # Callers may still hold a reference; from now on it saves directly.
+                memory.write_through = True
+                if not memory.flush():
+                    logger.error(
+                        f'❌ Evicted memory for user {memory.user_id} '
+                        'has unsaved changes.',
+                    )
+                memory.close()
+            finally:
+                with self._lock:
+                    self._flushing.pop(memory.user_id, None)
+                    self._settled.notify_all()
+
+    def evict(self, user_id: str) -> bool:
+        """
+        Flush and drop a user's memory from RAM.
+
+        Returns:
+            bool: False when the user was not resident.
+        """
+        with self._lock:
+            memory = self._pop(user_id)
+        if memory is None:
+            return False
+        self._write_back([memory])
+        return True
+
+    def flush(self, user_id: str | None = None) -> int:
+        """
+        Write back dirty memories (one user, or all resident users).
+
+        Returns:
+            int: The number of memories written.
+        """
+        with self._lock:
+            if user_id is None:
+                targets = list(self._memories.items())
+            elif user_id in self._memories:
+                targets = [(user_id, self._memories[user_id])]
+            else:
+                targets = []
+        written = 0
+        for uid, memory in targets:
+            if not memory.dirty:
+                continue
+            if memory.flush():
+                written += 1
+            with self._lock:
+                if uid in self._sizes:
+                    self._sizes[uid] = memory.approximate_size()
+        if written:
+            with self._lock:
+                victims = self._pop_victims()
+            self._write_back(victims)
+        return written
+
+    def _flush_periodically(self) -> None:
+        assert self.flush_interval
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f'❌ Background memory flush failed: {e}')
+
+    def stats(self) -> dict[str, Any]:
+        """Residency, estimated RAM use and load/eviction counters."""
+        with self._lock:
+            return {
+                'resident': len(self._memories),
+                'dirty': sum(memory.dirty for memory in self._memories.values()),
+                'resident_bytes': self._resident_bytes(),
+                'loads': self.loads,
+                'evictions': self.evictions,
+            }
+
+    def close(self) -> None:
+        """Stop the background writer and flush every resident memory."""
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+from concurrent.futures import Future
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+from sanruum.monitor.metrics import Histogram
+from sanruum.utils.base.logger import logger
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+QUEUE_WAIT_MS_BUCKETS = (0.5, 1, 2, 5, 10, 20, 50, 100, 250, 1000)
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesce single-item requests from concurrent callers into batches.
+
+    A worker thread waits for the first request, then keeps collecting for
+    up to ``max_wait_ms`` or until ``max_batch_size`` requests are queued,
+    runs ``process_batch`` once and resolves every caller's future. Models
+    that are much faster per item in batches (transformers on CPU) benefit
+    as soon as more than one caller is active.
+    """
+
+    def __init__(
+            self,
+            process_batch: Callable[[list[T]], Sequence[R]],
+            max_batch_size: int = 32,
+            max_wait_ms: float = 5.0,
+            name: str = 'micro-batcher',
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError('max_batch_size must be at least 1')
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.name = name
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_wait_ms = Histogram(QUEUE_WAIT_MS_BUCKETS)
+        self._queue: queue.Queue[tuple[T, Future[R], float] | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, item: T) -> Future[R]:
+        """Queue one item; the future resolves once its batch has run."""
+        future: Future[R] = Future()
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name=self.name, daemon=True,
+                )
+                self._worker.start()
+            self._queue.put((item, future, time.perf_counter()))
+        return future
+
+    def __call__(self, item: T) -> R:
+        """Process one item, blocking until its batch completes."""
+        return self.submit(item).result()
+
+    def map(self, items: Iterable[T]) -> list[R]:
+        """Process several items, sharing batches with other callers."""
+        return [future.result() for future in [self.submit(item) for item in items]]
+
+    def _collect(self) -> list[tuple[T, Future[R], float]] | None:
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                request = (
+                    self._queue.get(timeout=timeout) if timeout > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if request is None:
+                # Finish this batch first, then stop.
+                self._queue.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def _run(self) -> None:
+        while (batch := self._collect()) is not None:
+            started = time.perf_counter()
+            self.batch_sizes.observe(len(batch))
+            for _, _, enqueued in batch:
+                self.queue_wait_ms.observe((started - enqueued) * 1000)
+            live = [
+                (item, future) for item, future, _ in batch
+                if future.set_running_or_notify_cancel()
+            ]
+            if not live:
+                continue
+            try:
+                results = self.process_batch([item for item, _ in live])
+                if len(results) != len(live):
+                    raise RuntimeError(
+                        f'{self.name} returned {len(results)} results '
+                        f'for {len(live)} items',
+                    )
+            except Exception as e:
+                logger.error(f'❌ {self.name} batch failed: {e}')
+                for _, future in live:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(live, results):
+                future.set_result(result)
+
+    def stats(self) -> dict[str, Any]:
+        """Batch-size and queue-wait histograms."""
+        return {
+            'pending': self._queue.qsize(),
+            'batch_size': self.batch_sizes.snapshot(),
+            'queue_wait_ms': self.queue_wait_ms.snapshot(),
+        }
+
+    def close(self) -> None:
+        """Stop the worker after the requests already queued are served."""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                self._queue.put(None)
+                self._worker.join()
+            self._worker = None
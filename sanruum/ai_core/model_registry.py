@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+
+import psutil
+
+from sanruum.config.base import BaseConfig
+from sanruum.utils.base.logger import logger
+
+EMBEDDER = 'embedder'
+ZERO_SHOT = 'zero-shot'
+WHISPER = 'whisper'
+SENTIMENT = 'sentiment'
+
+
+@dataclass
+class ModelStats:
+    """How long a model took to load and how much memory it added."""
+    name: str
+    load_seconds: float
+    rss_delta_bytes: int
+    loaded_at: float
+    uses: int = 0
+
+
+class ModelRegistry:
+    """
+    Process-wide registry that loads each model once, on first use.
+
+    Callers ask for a model by name and share the returned instance, so the
+    number of loaded models no longer grows with the number of users or
+    sessions. Loaders are plain callables and do their own (heavy) imports.
+    """
+
+    def __init__(self) -> None:
+        self._loaders: dict[str, Callable[[], Any]] = {}
+        self._models: dict[str, Any] = {}
+        self._stats: dict[str, ModelStats] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        """Register (or replace) the loader for ``name``; nothing is loaded yet."""
+        with self._lock:
+            self._loaders[name] = loader
+            self._locks.setdefault(name, threading.Lock())
+            self._models.pop(name, None)
+            self._stats.pop(name, None)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def get(self, name: str) -> Any:
+        """Return the shared instance of ``name``, loading it if needed."""
+        model = self._models.get(name)
+        if model is None:
+            with self._lock:
+                if name not in self._loaders:
+                    raise KeyError(f'Unknown model: {name}')
+                lock = self._locks[name]
+            # Only callers of the same model wait for its load.
+            with lock:
+                model = self._models.get(name)
+                if model is None:
+                    model = self._load(name)
+        stats = self._stats.get(name)
+        if stats is not None:
+            stats.uses += 1
+        return model
+
+    def _load(self, name: str) -> Any:
+        process = psutil.Process()
+        rss_before = process.memory_info().rss
+        start = time.perf_counter()
+        model = self._loaders[name]()
+        elapsed = time.perf_counter() - start
+        stats = ModelStats(
+            name=name,
+            load_seconds=elapsed,
+            rss_delta_bytes=process.memory_info().rss - rss_before,
+            loaded_at=time.time(),
+        )
+        self._stats[name] = stats
+        self._models[name] = model
+        logger.info(
+            f'✅ Loaded model {name} in {elapsed:.2f}s '
+            f'(+{stats.rss_delta_bytes / 2 ** 20:.0f} MiB RSS)',
+        )
+        return model
+
+    def warm_up(self, *names: str) -> dict[str, dict[str, Any]]:
+        """
+        Load the given models (all registered ones by default) ahead of the
+        first request. Models that fail to load are logged and skipped.
+        """
+        for name in names or tuple(self._loaders):
+            try:
+                self.get(name)
+            except Exception as e:
+                logger.error(f'❌ Failed to warm up model {name}: {e}')
+        return self.stats()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Load time, resident-memory growth and use count per loaded model."""
+        return {name: asdict(stats) for name, stats in self._stats.items()}
+
+    def unload(self, name: str) -> None:
+        """Drop the shared reference; the next ``get`` loads it again."""
+        with self._lock:
+            self._models.pop(name, None)
+            self._stats.pop(name, None)
+
+
+def _load_embedder() -> Any:
+    from sentence_transformers import SentenceTransformer
+
+    from sanruum.ai_core.cpu_inference import fast_cpu_enabled
+    from sanruum.ai_core.cpu_inference import prepare_for_cpu
+    if fast_cpu_enabled():
+        model = SentenceTransformer(BaseConfig.EMBEDDING_MODEL, device='cpu')
+        return prepare_for_cpu(model, EMBEDDER)
+    return SentenceTransformer(BaseConfig.EMBEDDING_MODEL)
+
+
+def _load_zero_shot() -> Any:
+    import torch
+    from transformers import pipeline
+
+    from sanruum.ai_core.cpu_inference import prepare_for_cpu
+    classifier = pipeline(
+        'zero-shot-classification',
+        model=BaseConfig.ZERO_SHOT_MODEL,
+        device=0 if torch.cuda.is_available() else -1,
+    )
+    classifier.model = prepare_for_cpu(classifier.model, ZERO_SHOT)
+    return classifier
+
+
+def _load_sentiment() -> Any:
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
+
+
+def _load_whisper() -> Any:
+    import whisper
+
+    from sanruum.ai_core.cpu_inference import fast_cpu_enabled
+    from sanruum.ai_core.cpu_inference import prepare_for_cpu
+    if fast_cpu_enabled():
+        model = whisper.load_model(BaseConfig.WHISPER_MODEL, device='cpu')
+        return prepare_for_cpu(model, WHISPER)
+    return whisper.load_model(BaseConfig.WHISPER_MODEL)
+
+
+models = ModelRegistry()
+models.register(EMBEDDER, _load_embedder)
+models.register(ZERO_SHOT, _load_zero_shot)
+models.register(WHISPER, _load_whisper)
+models.register(SENTIMENT, _load_sentiment)
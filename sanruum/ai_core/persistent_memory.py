@@ -3,8 +3,15 @@ from __future__ import annotations
 
 import os
 import pickle
+import sqlite3
+import time
+from typing import Any
 
+from sanruum.ai_core.embedding_store import EmbeddingStore
 from sanruum.ai_core.memory import AIMemory
+from sanruum.ai_core.memory import stamp_unstamped_knowledge
+from sanruum.ai_core.user_memory_store import open_user_memory_store
+from sanruum.ai_core.user_memory_store import user_vectors_path
 from sanruum.config import BaseConfig
 from sanruum.utils.base.logger import logger
 
@@ -12,51 +19,102 @@ USER_MEMORY_DIR = BaseConfig.USER_MEMORY_DIR
 
 
 class PersistentAIMemory(AIMemory):
-    def __init__(self, user_id: str) -> None:
-        """Initialize PersistentAIMemory for a specific user."""
-        super().__init__()
+    def __init__(self, user_id: str, write_through: bool = True) -> None:
+        """
+        Initialize PersistentAIMemory for a specific user.
+
+        Parameters:
+            user_id (str): The user whose memory file to use.
+            write_through (bool): Persist after every change. When False,
+             changes only mark the memory dirty and the owner (usually a
+             ``MemoryManager``) calls ``flush``.
+        """
         self.user_id = user_id
+        self.write_through = write_through
+        self.dirty = False
+        super().__init__()
+
+    def open_storage(self) -> None:
+        """Open this user's store and embeddings; the shared memory is not read."""
+        self.store = open_user_memory_store(
+            BaseConfig.USER_MEMORY_BACKEND, USER_MEMORY_DIR,
+        )
+        # Only used by the "pickle" backend.
         self.memory_file = os.path.join(USER_MEMORY_DIR, f'memory_{self.user_id}.pkl')
+        self.index_file = os.path.join(
+            USER_MEMORY_DIR, f'memory_{self.user_id}.index.npz',
+        )
+        self.vectors = EmbeddingStore(
+            user_vectors_path(USER_MEMORY_DIR, self.user_id),
+            dtype=BaseConfig.EMBEDDING_DTYPE,
+        )
         self.load_user_memory()
 
+    def close(self) -> None:
+        """Release the embedding file handle; the user store is shared."""
+        self.vectors.close()
+
     def load_user_memory(self) -> None:
-        """Load memory from a file for the specific user."""
+        """Load memory from the user memory store for the specific user."""
         try:
-            if os.path.exists(self.memory_file):
-                with open(self.memory_file, 'rb') as file:
-                    self.memory, self.last_intent = pickle.load(file)
-                    if not isinstance(self.memory, dict):
-                        self.memory = {'history': []}  # Ensure it's a dictionary
-        except (FileNotFoundError, pickle.UnpicklingError) as e:
+            stored = self.store.load(self.user_id)
+            if stored is not None:
+                self.memory, self.last_intent = stored
+                if not isinstance(self.memory, dict):
+                    self.memory = {'history': []}  # Ensure it's a dictionary
+        except (OSError, pickle.UnpicklingError, sqlite3.Error) as e:
             self.memory = {'history': []}  # Default to empty history
             self.last_intent = None
             logger.error(f'❌ Failed to load user memory for {self.user_id}: {e}')
+        stamp_unstamped_knowledge(self.memory, time.time())
+        migrated = self.move_vectors_to_store(self.memory)
+        self.load_knowledge_index()
+        if migrated:
+            self.persist_memory()
 
-    def store_message(self, role: str, message: str) -> None:
-        """Store a message while keeping the latest ones."""
-        vector = self.embedder.encode(message).tolist() if self.embedder else []
+    def append_to_journal(self, change: dict[str, Any]) -> None:
+        """User memory is kept in its own file rather than the shared journal."""
+        if self.write_through:
+            self.persist_memory()
+        else:
+            self.dirty = True
 
-        self.memory.setdefault('history', []).append(
-            {'role': role, 'message': message, 'vector': vector},
-        )
+    def flush(self) -> bool:
+        """
+        Write the memory file if there are unsaved changes.
 
-        # Keep only the latest messages
-        self.memory['history'] = self.memory['history'][-self.memory_limit:]
+        Returns:
+            bool: True when the memory is clean afterwards.
+        """
+        # The lock keeps request threads from changing the memory mid-write.
+        with self._journal_lock:
+            if self.dirty:
+                self.persist_memory()
+            return not self.dirty
+
+    def save_memory(self) -> None:
+        """Save user memory to its own file."""
         self.persist_memory()
 
     def persist_memory(self) -> None:
-        """Persist the AI's memory and last detected intent to a file."""
-        os.makedirs(USER_MEMORY_DIR, exist_ok=True)  # Ensure directory exists
-        try:
-            with open(self.memory_file, 'wb+') as file:
-                pickle.dump((self.memory, self.last_intent), file)
-        except Exception as e:
-            logger.error(f'❌ Failed to persist memory for user {self.user_id}: {e}')
+        """Persist the AI's memory and last detected intent to the store."""
+        with self._journal_lock:
+            try:
+                self.store.save(self.user_id, self.memory, self.last_intent)
+            except Exception as e:
+                logger.error(
+                    f'❌ Failed to persist memory for user {self.user_id}: {e}',
+                )
+                return
+            self.dirty = False
+            self.compact_vectors(self.live_vector_ids(), self.vectors.next_id)
+            self.save_knowledge_index()
 
     def reset_memory(self) -> None:
         """Clears all memory, including persistent storage."""
         super().reset_memory()
         self.memory = {'history': []}  # Default to empty history
-        if os.path.exists(self.memory_file):
-            os.remove(self.memory_file)
+        self.store.delete(self.user_id)
+        if os.path.exists(self.index_file):
+            os.remove(self.index_file)
         logger.info(f'✅ Memory reset for user {self.user_id}.')
@@ -2,45 +2,132 @@ from __future__ import annotations
 
 import random
 import time
+from typing import Any
 
-import torch
-from transformers import pipeline
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-
-from sanruum.ai_core.ai_config import INTENTS
+from sanruum.ai_core import ai_config
+from sanruum.ai_core.embedding_cache import normalize_text
+from sanruum.ai_core.intent_classifier import CentroidIntentClassifier
+from sanruum.ai_core.intent_classifier import IntentClassifier
 from sanruum.ai_core.memory import AIMemory
+from sanruum.ai_core.model_registry import models
+from sanruum.ai_core.model_registry import SENTIMENT
+from sanruum.ai_core.model_registry import ZERO_SHOT
+from sanruum.ai_core.sentiment import cache_stats as sentiment_cache_stats
+from sanruum.ai_core.sentiment import polarity_scores
+from sanruum.ai_core.sentiment import sentiment_label
+from sanruum.ai_core.zero_shot_service import shared_zero_shot
+from sanruum.ai_core.zero_shot_service import zero_shot_stats
 from sanruum.config import BaseConfig
-from sanruum.nlp.utils.preprocessing import preprocess_text
+from sanruum.utils.base.cache import LRUCache
 from sanruum.utils.base.logger import logger
 
 PERSONALITY_MODE = BaseConfig.PERSONALITY_MODE
 
-# Initialize Device
-device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-logger.info(f'Using device: {device}')
-
-# Load AI Models
-analyzer = SentimentIntensityAnalyzer()
-classifier = pipeline(
-    'zero-shot-classification',
-    model='facebook/bart-large-mnli',
-    device=0 if device.type == 'cuda' else -1,
+# Rankings keyed by (normalised text, labels); editing intents.json changes
+# the labels and so the keys, leaving stale rankings to age out.
+zero_shot_cache: LRUCache[tuple[str, tuple[str, ...]], list[str]] = LRUCache(
+    maxsize=BaseConfig.ZERO_SHOT_CACHE_SIZE, ttl=BaseConfig.ZERO_SHOT_CACHE_TTL,
 )
 
 
+def warm_up(zero_shot: bool = True) -> dict[str, dict[str, Any]]:
+    """
+    Import the preprocessing stack and load the sentiment (and zero-shot)
+    models ahead of the first request. Nothing heavy happens at import time.
+
+    Returns:
+        dict: Load statistics of the loaded models.
+    """
+    try:
+        from sanruum.nlp.utils.preprocessing import get_pipeline
+        get_pipeline('intent-matching')
+    except Exception as e:
+        logger.error(f'❌ Failed to warm up preprocessing: {e}')
+    names = (SENTIMENT, ZERO_SHOT) if zero_shot else (SENTIMENT,)
+    return models.warm_up(*names)
+
+
+def intent_labels() -> list[str]:
+    """Names of the intents in intents.json, the candidate labels."""
+    names = [
+        intent['name'] for intent in ai_config.INTENTS.get('intents', [])
+        if isinstance(intent, dict) and intent.get('name')
+    ]
+    return names or list(ai_config.INTENTS.keys())
+
+
+def zero_shot_rank(text: str, labels: list[str]) -> list[str]:
+    """Rank ``labels`` for ``text`` with the zero-shot model, best first."""
+    key = (normalize_text(text), tuple(labels))
+    cached = zero_shot_cache.get(key)
+    if cached is not None:
+        return list(cached)
+    # The zero-shot model is loaded on first use and shared process-wide;
+    # concurrent callers are batched into one pipeline call.
+    result = shared_zero_shot()(text, candidate_labels=labels)
+    intents = result['labels']
+    ranked = intents if isinstance(intents, list) else [str(intents)]
+    zero_shot_cache.set(key, ranked)
+    return list(ranked)
+
+
 class AIProcessor:
     def __init__(self, memory: AIMemory) -> None:
         self.memory = memory
         # Reserved for future use: managing conversation context
         self.context: list[str] = []
+        self._intent_classifier: IntentClassifier | None = None
+
+    @property
+    def intent_classifier(self) -> IntentClassifier | None:
+        """
+        Centroid classifier in front of the zero-shot model, fitted on the
+        intent patterns on first use; None when no embedder is available.
+        """
+        if self._intent_classifier is None:
+            embeddings = getattr(self.memory, 'embeddings', None)
+            if embeddings is None:
+                return None
+            fast = CentroidIntentClassifier(embeddings).fit(
+                ai_config.INTENTS.get('intents', []),
+            )
+            if not fast.labels:
+                return None
+            self._intent_classifier = IntentClassifier(
+                fast,
+                zero_shot_rank,
+                threshold=BaseConfig.INTENT_CLASSIFIER_THRESHOLD,
+                shadow_rate=BaseConfig.INTENT_CLASSIFIER_SHADOW_RATE,
+            )
+        return self._intent_classifier
+
+    def reset_intent_classifier(self) -> None:
+        """Refit the intent classifier on next use, e.g. after intents.json changed."""
+        self._intent_classifier = None
+
+    def stats(self) -> dict[str, Any]:
+        """Intent classifier answer counts, agreement, latencies and batching."""
+        classifier = self._intent_classifier
+        return {
+            'intent_classifier': classifier.stats() if classifier else {},
+            'zero_shot_batcher': zero_shot_stats(),
+            'zero_shot_cache': zero_shot_cache.stats(),
+            'sentiment_cache': sentiment_cache_stats(),
+        }
 
     def process_input(self, user_input: str) -> str:
         """Processes user input and determines AI response."""
         start_time = time.perf_counter()
 
+        # nltk and its corpora take seconds to import; see warm_up.
+        from sanruum.nlp.utils.preprocessing import get_pipeline
+
         original_input = user_input
-        # Preprocess input and ensure it's a string
-        processed_input = preprocess_text(user_input, return_string=True)
+        # Clean the input without stemming: the intent classifier and the
+        # knowledge search embed it, and stems read poorly to those models.
+        processed_input = get_pipeline('intent-matching')(
+            user_input, return_string=True,
+        )
         if isinstance(processed_input, list):
             processed_input = ' '.join(processed_input)
         user_input = processed_input
@@ -100,15 +187,13 @@ class AIProcessor:
             f'Analyzed sentiment: {sentiment}'
             f' (Time: {time.perf_counter() - sentiment_start:.4f}s)',
         )
-        sentiment_scores = analyzer.polarity_scores(user_input)
-        logger.debug(f'Sentiment scores: {sentiment_scores}')
 
         if sentiment == 'negative':
             response = "I'm sorry you're feeling that way. How can I help?"
         elif sentiment == 'positive':
             response = 'Glad to hear that! How can I assist you today?'
         else:
-            fallback_responses = INTENTS.get(PERSONALITY_MODE, {}).get(
+            fallback_responses = ai_config.INTENTS.get(PERSONALITY_MODE, {}).get(
                 'fallback', ['Can you clarify?'],
             )
             response = random.choice(fallback_responses)
@@ -118,32 +203,26 @@ class AIProcessor:
                 )
 
         logger.debug(f'Process time: {time.perf_counter() - start_time:.4f}s')
+        embeddings = getattr(self.memory, 'embeddings', None)
+        if embeddings is not None:
+            logger.debug(f'Embedding cache: {embeddings.stats()}')
         if isinstance(response, dict):
             response = response.get(PERSONALITY_MODE, next(iter(response.values())))
         return response
 
-    @staticmethod
-    def extract_intents(text: str) -> list[str]:
+    def extract_intents(self, text: str) -> list[str]:
+        """The detected intent as a one-item list, or empty when there is none."""
         try:
-            result = classifier(
-                text,
-                candidate_labels=list(INTENTS.keys()),
-            )
-            intents = result['labels']
-            if isinstance(intents, list):
-                return intents
-            return [str(intents)]
+            classifier = self.intent_classifier
+            if classifier is not None:
+                return classifier.classify(text)
+            return zero_shot_rank(text, intent_labels())[:1]
         except Exception as e:
             logger.error(f'Error extracting intents: {str(e)}')
             return []
 
     @staticmethod
     def analyze_sentiment(text: str) -> str:
-        scores = analyzer.polarity_scores(text)
+        scores = polarity_scores(text)
         logger.debug(f'Sentiment scores: {scores}')
-        if scores['compound'] > 0.0:
-            return 'positive'
-        elif scores['compound'] < 0.0:
-            return 'negative'
-        else:
-            return 'neutral'
+        return sentiment_label(scores)
@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import os
 import time
 import traceback
+from collections.abc import MutableMapping
+from typing import Any
 
-from sanruum.ai_core.ai_config import INTENTS
+import numpy as np
+
+from sanruum.ai_core import ai_config
+from sanruum.ai_core import processor
 from sanruum.ai_core.memory import AIMemory
+from sanruum.ai_core.model_registry import EMBEDDER
+from sanruum.ai_core.model_registry import models
 from sanruum.ai_core.processor import AIProcessor
+from sanruum.ai_core.semantic_cache import SemanticCache
 from sanruum.config import BaseConfig
+from sanruum.intent_system.intent_artifact import CompiledIntents
 from sanruum.intent_system.intent_handler import IntentHandler
+from sanruum.utils.base.cache import LRUCache
 from sanruum.utils.base.logger import logger
 
 PERSONALITY_MODE = BaseConfig.PERSONALITY_MODE
+INTENTS_FILE = BaseConfig.INTENTS_FILE
 
 
 def apply_personality(response: str, personality: str) -> str:
@@ -38,14 +50,98 @@ class AIResponse:
     memory: AIMemory
     processor: AIProcessor
     intent_handler: IntentHandler
-    response_cache: dict[str, str]
+    response_cache: MutableMapping[str, str]
 
     def __init__(self, personality: str = PERSONALITY_MODE) -> None:
         self.personality = personality
         self.memory = AIMemory()
         self.processor = AIProcessor(self.memory)
-        self.intent_handler = IntentHandler()
-        self.response_cache = {}
+        self.intent_handler = IntentHandler(on_reload=self._on_intents_reloaded)
+        self.response_cache = LRUCache(
+            maxsize=BaseConfig.RESPONSE_CACHE_SIZE,
+            max_bytes=BaseConfig.RESPONSE_CACHE_MAX_BYTES,
+            ttl=BaseConfig.RESPONSE_CACHE_TTL,
+        )
+        self.semantic_cache: SemanticCache | None = None
+        if BaseConfig.SEMANTIC_CACHE_SIZE > 0:
+            self.semantic_cache = SemanticCache(
+                maxsize=BaseConfig.SEMANTIC_CACHE_SIZE,
+                threshold=BaseConfig.SEMANTIC_CACHE_THRESHOLD,
+            )
+        self._cache_token: tuple[Any, Any] | None = None
+
+    def close(self) -> None:
+        """Stop the intents watcher and release the memory's file handles."""
+        self.intent_handler.close()
+        self.memory.close()
+
+    def _on_intents_reloaded(self, compiled: CompiledIntents) -> None:
+        """Point the shared intents and the intent classifier at a reload."""
+        ai_config.set_intents(compiled.document)
+        self.processor.reset_intent_classifier()
+
+    def _current_cache_token(self) -> tuple[Any, Any]:
+        try:
+            intents_mtime: int | None = os.stat(INTENTS_FILE).st_mtime_ns
+        except OSError:
+            intents_mtime = None
+        return intents_mtime, self.memory.knowledge_version
+
+    def validate_response_cache(self) -> None:
+        """Drop cached responses once intents.json or stored knowledge changed."""
+        token = self._current_cache_token()
+        if self._cache_token is not None and token != self._cache_token:
+            self.response_cache.clear()
+            if self.semantic_cache is not None:
+                self.semantic_cache.clear()
+            logger.debug('🧹 Response cache invalidated.')
+        self._cache_token = token
+
+    def _embed_query(self, user_input: str) -> np.ndarray | None:
+        """Embedding of the input for the semantic tier, or None without one."""
+        embeddings = getattr(self.memory, 'embeddings', None)
+        if self.semantic_cache is None or embeddings is None:
+            return None
+        try:
+            vector: np.ndarray = embeddings.encode(user_input)
+        except Exception as e:
+            logger.warning(f'⚠️ Semantic cache skipped: {e}')
+            return None
+        return vector
+
+    def _cache_response(
+            self, user_input: str, response: str, vector: np.ndarray | None = None,
+    ) -> None:
+        self.response_cache[user_input] = response
+        if self.semantic_cache is not None and vector is not None:
+            self.semantic_cache.add(user_input, vector, response)
+        # Knowledge stored for this response must not invalidate it.
+        self._cache_token = self._current_cache_token()
+
+    @staticmethod
+    def warm_up(zero_shot: bool = True) -> dict[str, dict[str, Any]]:
+        """
+        Load every model a request may need, so the first user does not pay
+        for it. Call once at service start-up; imports stay cheap.
+        """
+        models.warm_up(EMBEDDER)
+        return processor.warm_up(zero_shot=zero_shot)
+
+    def stats(self) -> dict[str, Any]:
+        """Cache counters for monitoring."""
+        cache = self.response_cache
+        embeddings = getattr(self.memory, 'embeddings', None)
+        return {
+            'response_cache': (
+                cache.stats() if isinstance(cache, LRUCache) else {'size': len(cache)}
+            ),
+            'semantic_cache': (
+                self.semantic_cache.stats() if self.semantic_cache is not None else {}
+            ),
+            'embedding_cache': embeddings.stats() if embeddings is not None else {},
+            **self.processor.stats(),
+            'models': models.stats(),
+        }
 
     def get_response(self, user_input: str | list) -> str:
         try:
@@ -61,14 +157,27 @@ class AIResponse:
             user_input = user_input.strip().lower()
             logger.info(f'📝 User Input: {user_input}')
 
-            if user_input in self.response_cache:
-                cached_response = self.response_cache[user_input]
+            self.validate_response_cache()
+            cached_response = self.response_cache.get(user_input)
+            if cached_response is not None:
                 logger.debug(f'✅ Cached response found: {cached_response}')
                 return cached_response
 
+            # Embedded once here; the embedding cache serves later lookups of
+            # the same text in memory.
+            query_vector = self._embed_query(user_input)
+            if self.semantic_cache is not None and query_vector is not None:
+                if hit := self.semantic_cache.lookup(query_vector):
+                    logger.debug(
+                        f'✅ Semantic cache hit ({hit.score:.2f}) '
+                        f'for "{hit.query}": {hit.response}',
+                    )
+                    self.response_cache[user_input] = hit.response
+                    return hit.response
+
             if known_info := self.memory.find_relevant_knowledge(user_input):
                 logger.debug(f'📚 Memory response found: {known_info}')
-                self.response_cache[user_input] = known_info
+                self._cache_response(user_input, known_info, query_vector)
                 return known_info
 
             # Check Intents instead
@@ -83,7 +192,7 @@ class AIResponse:
                     intent_response = selected
 
                 self.memory.store_knowledge(user_input, intent_response)
-                self.response_cache[user_input] = intent_response
+                self._cache_response(user_input, intent_response, query_vector)
                 return intent_response
 
             ai_response = self.processor.process_input(user_input)
@@ -95,11 +204,12 @@ class AIResponse:
                 logger.debug(f'Selected processor response: {selected}')
                 ai_response = selected
 
-            fallbacks = INTENTS.get(PERSONALITY_MODE, {}).get('fallback', [])
+            intents = ai_config.INTENTS
+            fallbacks = intents.get(PERSONALITY_MODE, {}).get('fallback', [])
             if ai_response and ai_response not in fallbacks:
                 if not self.memory.find_relevant_knowledge(ai_response):
                     self.memory.store_knowledge(user_input, ai_response)
-                    self.response_cache[user_input] = ai_response
+                    self._cache_response(user_input, ai_response, query_vector)
 
             logger.debug(
                 f'⏱️ Response time: {(time.perf_counter() - start_time) * 1000:.2f}ms',
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from sanruum.ai_core.vector_index import normalize_rows
+
+
+class SemanticHit(NamedTuple):
+    query: str
+    response: str
+    score: float
+
+
+class SemanticCache:
+    """
+    Bounded cache of responses keyed by the embedding of the query.
+
+    A lookup returns the response of the most similar cached query when the
+    cosine similarity reaches ``threshold``, so paraphrased repeats of a
+    question are answered without running intents or the classifier again.
+    Queries live as rows of one preallocated, L2-normalised float32 matrix
+    and a lookup is a single matrix-vector product. When full, the least
+    recently used row is overwritten.
+    """
+
+    def __init__(self, maxsize: int = 512, threshold: float = 0.92) -> None:
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._vectors: np.ndarray | None = None  # Allocated on the first add
+        self._queries: list[str] = []
+        self._responses: list[str] = []
+        self._row_of: dict[str, int] = {}
+        self._last_used = np.zeros(maxsize, dtype=np.int64)
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def _touch(self, row: int) -> None:
+        self._clock += 1
+        self._last_used[row] = self._clock
+
+    def lookup(self, vector: ArrayLike) -> SemanticHit | None:
+        """Return the closest cached query at or above the threshold."""
+        query = normalize_rows(vector)[0]
+        with self._lock:
+            size = len(self._queries)
+            if self._vectors is None or not size:
+                self.misses += 1
+                return None
+            if query.shape[0] != self._vectors.shape[1]:
+                raise ValueError(
+                    f'Expected a {self._vectors.shape[1]}-d vector, '
+                    f'got {query.shape[0]}-d',
+                )
+            scores = self._vectors[:size] @ query
+            row = int(np.argmax(scores))
+            score = float(scores[row])
+            if score < self.threshold:
+                self.misses += 1
+                return None
+            self._touch(row)
+            self.hits += 1
+            return SemanticHit(self._queries[row], self._responses[row], score)
+
+    def add(self, query: str, vector: ArrayLike, response: str) -> None:
+        """Cache ``response`` for ``query``, replacing an older entry if full."""
+        normalized = normalize_rows(vector)[0]
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.empty(
+                    (self.maxsize, normalized.shape[0]), dtype=np.float32,
+                )
+            row = self._row_of.get(query)
+            if row is None:
+                if len(self._queries) < self.maxsize:
+                    row = len(self._queries)
+                    self._queries.append(query)
+                    self._responses.append(response)
+                else:
+                    row = int(np.argmin(self._last_used))
+                    del self._row_of[self._queries[row]]
+                    self._queries[row] = query
+                    self.evictions += 1
+                self._row_of[query] = row
+            self._vectors[row] = normalized
+            self._responses[row] = response
+            self._touch(row)
+
+    def clear(self) -> None:
+        """Drop every entry; the counters keep running."""
+        with self._lock:
+            self._queries.clear()
+            self._responses.clear()
+            self._row_of.clear()
+            self._last_used[:] = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Size and hit/miss/eviction counters."""
+        return {
+            'size': len(self._queries),
+            'maxsize': self.maxsize,
+            'threshold': self.threshold,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'evictions': self.evictions,
+        }
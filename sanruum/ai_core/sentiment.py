@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import hashlib
+import math
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+
+from sanruum.ai_core.model_registry import models
+from sanruum.ai_core.model_registry import SENTIMENT
+from sanruum.config.base import BaseConfig
+from sanruum.nlp.utils.parallel import chunked
+from sanruum.nlp.utils.parallel import resolve_jobs
+from sanruum.utils.base.cache import LRUCache
+
+Scores = dict[str, float]  # VADER's neg, neu, pos and compound
+
+# Keyed by a hash of the raw text: VADER reads case and punctuation, so the
+# text is not normalised like embedding cache keys are.
+score_cache: LRUCache[bytes, Scores] = LRUCache(
+    maxsize=BaseConfig.SENTIMENT_CACHE_SIZE,
+)
+
+
+def _text_hash(text: str) -> bytes:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+def polarity_scores(text: str) -> Scores:
+    """VADER scores of ``text``, memoised across requests."""
+    key = _text_hash(text)
+    scores = score_cache.get(key)
+    if scores is None:
+        scores = models.get(SENTIMENT).polarity_scores(text)
+        score_cache.set(key, scores)
+    return dict(scores)
+
+
+def sentiment_label(scores: Scores) -> str:
+    """'positive', 'negative' or 'neutral' by the sign of the compound score."""
+    if scores['compound'] > 0.0:
+        return 'positive'
+    if scores['compound'] < 0.0:
+        return 'negative'
+    return 'neutral'
+
+
+def _score_chunk(texts: list[str]) -> list[float]:
+    # Runs in pool workers, each of which loads its own analyzer.
+    analyzer = models.get(SENTIMENT)
+    return [analyzer.polarity_scores(text)['compound'] for text in texts]
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def compound_scores(
+        texts: Iterable[Any],
+        n_jobs: int | None = None,
+        chunksize: int = 500,
+        parallel_min: int | None = None,
+) -> np.ndarray:
+    """
+    Compound scores of many texts, such as ``MoodLog.notes`` rows.
+
+    Accepts any iterable, including a pandas Series, and returns a float64
+    array in input order; missing values (None or NaN) score NaN. Duplicate
+    texts are scored once, and inputs with at least ``parallel_min`` distinct
+    texts are spread over ``n_jobs`` worker processes (None or -1 for all
+    cores) in chunks of ``chunksize``. The per-request cache is left alone so
+    a nightly batch does not evict live entries.
+    """
+    values = list(texts)
+    result = np.full(len(values), np.nan, dtype=np.float64)
+    positions: dict[str, list[int]] = {}
+    for position, value in enumerate(values):
+        if not _is_missing(value):
+            positions.setdefault(str(value), []).append(position)
+    unique = list(positions)
+    if not unique:
+        return result
+
+    if parallel_min is None:
+        parallel_min = BaseConfig.SENTIMENT_PARALLEL_MIN
+    workers = resolve_jobs(n_jobs)
+    if workers > 1 and len(unique) >= parallel_min:
+        chunks = list(chunked(unique, chunksize))
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            scored = pool.map(_score_chunk, chunks)
+            scores = [score for chunk in scored for score in chunk]
+    else:
+        scores = _score_chunk(unique)
+
+    for text, score in zip(unique, scores):
+        result[positions[text]] = score
+    return result
+
+
+def cache_stats() -> dict[str, Any]:
+    """Hit and eviction counters of the per-request score cache."""
+    return score_cache.stats()
@@ -1,9 +1,12 @@
 # sanruum/ai_core/speech/speech_recognition.py
 from __future__ import annotations
 
+from typing import Any
+
 import speech_recognition as sr
-import whisper
 
+from sanruum.ai_core.model_registry import models
+from sanruum.ai_core.model_registry import WHISPER
 from sanruum.utils.base.logger import logger
 
 # Workaround for recognize_google issue
@@ -35,8 +38,10 @@ class SpeechRecognition:
                 logger.error('No default input device available: %s', e)
                 raise e
 
-        if self.engine == 'whisper':
-            self.model = whisper.load_model('base')
+    @property
+    def model(self) -> Any:
+        """The shared Whisper model, loaded on the first transcription."""
+        return models.get(WHISPER)
 
     def recognize_speech(self) -> str:
         """
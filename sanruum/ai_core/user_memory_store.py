@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Iterable
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from sanruum.ai_core.embedding_store import EmbeddingStore
+from sanruum.ai_core.embedding_store import move_inline_vectors
+from sanruum.config.base import BaseConfig
+from sanruum.utils.base.logger import logger
+
+UserMemory = tuple[dict[str, Any], str | None]  # (memory dict, last intent)
+
+SQLITE_FILE_NAME = 'memory.sqlite3'
+PICKLE_PREFIX = 'memory_'
+PICKLE_SUFFIX = '.pkl'
+VECTORS_SUFFIX = '.vectors'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id TEXT PRIMARY KEY,
+    last_intent TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history (
+    user_id TEXT NOT NULL REFERENCES users(user_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    role TEXT,
+    message TEXT,
+    vector_id INTEGER,
+    PRIMARY KEY (user_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS knowledge (
+    user_id TEXT NOT NULL REFERENCES users(user_id) ON DELETE CASCADE,
+    topic TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT,
+    vector_id INTEGER,
+    created REAL,
+    last_hit REAL,
+    PRIMARY KEY (user_id, topic, position)
+) WITHOUT ROWID;
+"""
+
+
+def user_vectors_path(directory: str | os.PathLike[str], user_id: str) -> Path:
+    """The user's embedding store; every backend keeps vectors in this file."""
+    return Path(directory, f'{PICKLE_PREFIX}{user_id}{VECTORS_SUFFIX}')
+
+
+class UserMemoryStore(ABC):
+    """Where ``PersistentAIMemory`` keeps each user's memory and last intent."""
+
+    backend: str
+
+    @abstractmethod
+    def load(self, user_id: str) -> UserMemory | None:
+        """Return the stored memory, or None for an unknown user."""
+
+    @abstractmethod
+    def save(
+            self, user_id: str, memory: dict[str, Any], last_intent: str | None,
+    ) -> None:
+        """Replace the user's stored memory."""
+
+    def save_many(self, records: Iterable[tuple[str, UserMemory]]) -> int:
+        """Save several users; returns how many were written."""
+        count = 0
+        for user_id, (memory, last_intent) in records:
+            self.save(user_id, memory, last_intent)
+            count += 1
+        return count
+
+    @abstractmethod
+    def delete(self, user_id: str) -> None:
+        """Forget everything stored for the user."""
+
+    @abstractmethod
+    def user_ids(self) -> Iterator[str]:
+        """Every user with stored memory."""
+
+
+class PickleUserMemoryStore(UserMemoryStore):
+    """One ``memory_{user_id}.pkl`` file per user."""
+
+    backend = 'pickle'
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = Path(directory)
+
+    def path_for(self, user_id: str) -> Path:
+        return self.directory / f'{PICKLE_PREFIX}{user_id}{PICKLE_SUFFIX}'
+
+    def load(self, user_id: str) -> UserMemory | None:
+        path = self.path_for(user_id)
+        if not path.exists():
+            return None
+        with open(path, 'rb') as file:
+            memory, last_intent = pickle.load(file)
+        return memory, last_intent
+
+    def save(
+            self, user_id: str, memory: dict[str, Any], last_intent: str | None,
+    ) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(user_id)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as file:
+            pickle.dump((memory, last_intent), file)
+        os.replace(tmp_path, path)
+
+    def delete(self, user_id: str) -> None:
+        self.path_for(user_id).unlink(missing_ok=True)
+
+    def user_ids(self) -> Iterator[str]:
+        for path in self.directory.glob(f'{PICKLE_PREFIX}*{PICKLE_SUFFIX}'):
+            yield path.name[len(PICKLE_PREFIX):-len(PICKLE_SUFFIX)]
+
+
+class SQLiteUserMemoryStore(UserMemoryStore):
+    """
+    Every user in one SQLite database in WAL mode.
+
+    History and knowledge items are rows keyed by user, so loading a user is
+    an indexed range scan and a save replaces that user's rows in a single
+    transaction. Readers never block the writer.
+    """
+
+    backend = 'sqlite'
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None,
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            # With WAL, NORMAL only risks the last commits on power loss.
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('PRAGMA foreign_keys=ON')
+            self._conn.executescript(SCHEMA)
+
+    def load(self, user_id: str) -> UserMemory | None:
+        with self._lock:
+            user = self._conn.execute(
+                'SELECT last_intent FROM users WHERE user_id = ?', (user_id,),
+            ).fetchone()
+            if user is None:
+                return None
+            history = self._conn.execute(
+                'SELECT role, message, vector_id FROM history '
+                'WHERE user_id = ? ORDER BY position', (user_id,),
+            ).fetchall()
+            knowledge = self._conn.execute(
+                'SELECT topic, data, vector_id, created, last_hit FROM knowledge '
+                'WHERE user_id = ? ORDER BY topic, position', (user_id,),
+            ).fetchall()
+
+        memory: dict[str, Any] = {'history': []}
+        for role, message, vector_id in history:
+            item = {'role': role, 'message': message}
+            if vector_id is not None:
+                item['vector_id'] = vector_id
+            memory['history'].append(item)
+        for topic, data, *optional in knowledge:
+            item = {'data': data}
+            for key, value in zip(('vector_id', 'created', 'last_hit'), optional):
+                if value is not None:
+                    item[key] = value
+            memory.setdefault(topic, []).append(item)
+        return memory, user[0]
+
+    @staticmethod
+    def _rows(
+            user_id: str, memory: dict[str, Any],
+    ) -> tuple[list[tuple[Any, ...]], list[tuple[Any, ...]]]:
+        history = [
+            (
+                user_id, position, item.get('role'), item.get('message'),
+                item.get('vector_id'),
+            )
+            for position, item in enumerate(memory.get('history', []))
+            if isinstance(item, dict)
+        ]
+        knowledge = []
+        for topic, items in memory.items():
+            if topic == 'history' or not isinstance(items, list):
+                continue
+            for position, item in enumerate(items):
+                if not isinstance(item, dict):
+                    item = {'data': item}
+                knowledge.append((
+                    user_id, topic, position, str(item.get('data')),
+                    item.get('vector_id'), item.get('created'), item.get('last_hit'),
+                ))
+        return history, knowledge
+
+    def _write(
+            self, user_id: str, memory: dict[str, Any], last_intent: str | None,
+    ) -> None:
+        history, knowledge = self._rows(user_id, memory)
+        self._conn.execute(
+            'INSERT INTO users (user_id, last_intent, updated_at) VALUES (?, ?, ?) '
+            'ON CONFLICT (user_id) DO UPDATE SET '
+            'last_intent = excluded.last_intent, updated_at = excluded.updated_at',
+            (user_id, last_intent, time.time()),
+        )
+        self._conn.execute('DELETE FROM history WHERE user_id = ?', (user_id,))
+        self._conn.execute('DELETE FROM knowledge WHERE user_id = ?', (user_id,))
+        self._conn.executemany(
+            'INSERT INTO history (user_id, position, role, message, vector_id) '
+            'VALUES (?, ?, ?, ?, ?)', history,
+        )
+        self._conn.executemany(
+            'INSERT INTO knowledge '
+            '(user_id, topic, position, data, vector_id, created, last_hit) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)', knowledge,
+        )
+
+    def save(
+            self, user_id: str, memory: dict[str, Any], last_intent: str | None,
+    ) -> None:
+        self.save_many([(user_id, (memory, last_intent))])
+
+    def save_many(self, records: Iterable[tuple[str, UserMemory]]) -> int:
+        """Save several users in one transaction."""
+        count = 0
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                for user_id, (memory, last_intent) in records:
+                    self._write(user_id, memory, last_intent)
+                    count += 1
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+        return count
+
+    def delete(self, user_id: str) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM users WHERE user_id = ?', (user_id,))
+
+    def user_ids(self) -> Iterator[str]:
+        with self._lock:
+            rows = self._conn.execute('SELECT user_id FROM users').fetchall()
+        for (user_id,) in rows:
+            yield user_id
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_sqlite_stores: dict[Path, SQLiteUserMemoryStore] = {}
+_sqlite_lock = threading.Lock()
+
+
+def open_user_memory_store(
+        backend: str, directory: str | os.PathLike[str],
+) -> UserMemoryStore:
+    """
+    Return the store for ``backend`` ("pickle" or "sqlite") in ``directory``.
+
+    SQLite stores are shared per database file, so all users in the process
+    go through one connection.
+    """
+    if backend == PickleUserMemoryStore.backend:
+        return PickleUserMemoryStore(directory)
+    if backend == SQLiteUserMemoryStore.backend:
+        path = Path(directory, SQLITE_FILE_NAME).resolve()
+        with _sqlite_lock:
+            store = _sqlite_stores.get(path)
+            if store is None:
+                store = _sqlite_stores[path] = SQLiteUserMemoryStore(path)
+            return store
+    raise ValueError(f'Unknown user memory backend: {backend}')
+
+
+def migrate_pickles_to_sqlite(
+        directory: str | os.PathLike[str],
+        batch_size: int = 500,
+        remove_pickles: bool = False,
+) -> int:
+    """
+    Copy every ``memory_{user_id}.pkl`` in ``directory`` into the SQLite store.
+
+    Users are written in batches of ``batch_size`` per transaction. Inline
+    ``vector`` lists from older files are moved into the user's embedding
+    store first, since the SQLite rows only hold vector ids. Files that
+    cannot be read are logged and left in place.
+
+    Returns:
+        int: The number of migrated users.
+    """
+    source = PickleUserMemoryStore(directory)
+    target = open_user_memory_store(SQLiteUserMemoryStore.backend, directory)
+    migrated = 0
+    batch: list[tuple[str, UserMemory]] = []
+
+    def write_batch() -> None:
+        nonlocal migrated
+        migrated += target.save_many(batch)
+        if remove_pickles:
+            for user_id, _ in batch:
+                source.delete(user_id)
+        batch.clear()
+
+    for user_id in source.user_ids():
+        try:
+            record = source.load(user_id)
+        except (OSError, pickle.UnpicklingError, ValueError, EOFError) as e:
+            logger.error(f'❌ Skipping unreadable memory file for {user_id}: {e}')
+            continue
+        if record is None or not isinstance(record[0], dict):
+            continue
+        try:
+            vectors = EmbeddingStore(
+                user_vectors_path(directory, user_id),
+                dtype=BaseConfig.EMBEDDING_DTYPE,
+            )
+            try:
+                move_inline_vectors(record[0], vectors)
+            finally:
+                vectors.close()
+        except (OSError, ValueError) as e:
+            logger.error(f'❌ Skipping {user_id}, embeddings not migrated: {e}')
+            continue
+        batch.append((user_id, record))
+        if len(batch) >= batch_size:
+            write_batch()
+    if batch:
+        write_batch()
+    logger.info(f'✅ Migrated {migrated} user memories to {SQLITE_FILE_NAME}.')
+    return migrated
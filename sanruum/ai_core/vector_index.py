@@ -0,0 +1,550 @@
+from __future__ import annotations
+
+import heapq
+import os
+from abc import ABC
+from abc import abstractmethod
+from typing import Any
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+def _pack_strings(strings: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenated UTF-8 bytes and end offsets of ``strings``. Unlike a ``<U``
+    array this costs the total text length, not count times the longest.
+    """
+    encoded = [string.encode('utf-8') for string in strings]
+    data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    ends = np.cumsum([len(item) for item in encoded], dtype=np.int64)
+    return data, ends
+
+
+def _unpack_strings(data: np.ndarray, ends: np.ndarray) -> list[str]:
+    raw = data.tobytes()
+    starts = [0, *ends[:-1].tolist()]
+    return [
+        raw[start:end].decode('utf-8') for start, end in zip(starts, ends.tolist())
+    ]
+
+
+def _load_strings(state: Any, name: str) -> list[str]:
+    if f'{name}_data' in state:
+        return _unpack_strings(state[f'{name}_data'], state[f'{name}_ends'])
+    # Indexes saved before the packed layout hold a fixed-width string array.
+    return [str(item) for item in state[name]]
+
+
+class KnowledgeMatch(NamedTuple):
+    topic: str
+    text: str
+    score: float
+    item_id: int = -1
+
+
+def normalize_rows(vectors: ArrayLike) -> np.ndarray:
+    """Return float32 copies of the given vectors scaled to unit L2 norm."""
+    rows = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    normalized: np.ndarray = rows / norms
+    return normalized
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return the positions of the ``k`` highest scores, best first."""
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < scores.shape[0]:
+        top = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top = np.arange(scores.shape[0])
+    ordered: np.ndarray = top[np.argsort(-scores[top], kind='stable')]
+    return ordered
+
+
+class _FlatStore:
+    """
+    Contiguous, L2-normalised float32 matrix with parallel id/topic/text
+    arrays. Removal swaps the last row into the freed slot, so the matrix
+    never has holes.
+    """
+
+    def __init__(self, dim: int, initial_capacity: int = 1024) -> None:
+        self.dim = dim
+        self.topics: list[str] = []
+        self.texts: list[str] = []
+        self._vectors = np.empty((max(1, initial_capacity), dim), dtype=np.float32)
+        self._ids = np.empty(max(1, initial_capacity), dtype=np.int64)
+        self._row_of: dict[int, int] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._vectors[:self._size]
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids[:self._size]
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        capacity = self._vectors.shape[0]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        vectors = np.empty((capacity, self.dim), dtype=np.float32)
+        vectors[:self._size] = self.vectors
+        ids = np.empty(capacity, dtype=np.int64)
+        ids[:self._size] = self.ids
+        self._vectors, self._ids = vectors, ids
+
+    def append(
+            self,
+            ids: list[int],
+            topics: list[str],
+            texts: list[str],
+            rows: np.ndarray,
+    ) -> None:
+        """Append already-normalised rows."""
+        self._reserve(len(ids))
+        end = self._size + len(ids)
+        self._vectors[self._size:end] = rows
+        self._ids[self._size:end] = ids
+        for offset, item_id in enumerate(ids):
+            self._row_of[item_id] = self._size + offset
+        self.topics.extend(topics)
+        self.texts.extend(texts)
+        self._size = end
+
+    def remove(self, item_id: int) -> bool:
+        row = self._row_of.pop(item_id, None)
+        if row is None:
+            return False
+        last = self._size - 1
+        if row != last:
+            self._vectors[row] = self._vectors[last]
+            moved = int(self._ids[last])
+            self._ids[row] = moved
+            self._row_of[moved] = row
+            self.topics[row] = self.topics[last]
+            self.texts[row] = self.texts[last]
+        self.topics.pop()
+        self.texts.pop()
+        self._size = last
+        return True
+
+    def search(self, query: np.ndarray, k: int) -> list[KnowledgeMatch]:
+        if not self._size:
+            return []
+        scores = self.vectors @ query
+        return [
+            KnowledgeMatch(
+                self.topics[i], self.texts[i], float(scores[i]), int(self._ids[i]),
+            )
+            for i in top_k(scores, k)
+        ]
+
+
+class VectorIndex(ABC):
+    """
+    Base class for cosine similarity indexes over knowledge embeddings.
+
+    Items are identified by the integer id returned from ``add``; vectors are
+    L2-normalised on insert so scores are cosine similarities.
+    """
+
+    backend: str = ''
+
+    def __init__(self) -> None:
+        self.dim: int | None = None
+        self._next_id = 0
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def _insert(
+            self,
+            ids: list[int],
+            topics: list[str],
+            texts: list[str],
+            rows: np.ndarray,
+    ) -> None:
+        ...
+
+    @abstractmethod
+    def _stores(self) -> list[_FlatStore]:
+        ...
+
+    @abstractmethod
+    def remove(self, item_id: int) -> bool:
+        """Delete an item; returns False when the id is unknown."""
+
+    @abstractmethod
+    def search(self, query_vector: ArrayLike, k: int = 1) -> list[KnowledgeMatch]:
+        """Return up to ``k`` of the most similar items, best match first."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every item from the index."""
+
+    def add(self, topic: str, text: str, vector: ArrayLike) -> int:
+        """Insert a single item and return its id."""
+        return self.add_many([topic], [text], np.atleast_2d(vector))[0]
+
+    def add_many(
+            self,
+            topics: list[str],
+            texts: list[str],
+            vectors: ArrayLike,
+    ) -> list[int]:
+        """Insert several items at once; ``vectors`` has one row per item."""
+        if not topics:
+            return []
+        rows = normalize_rows(vectors)
+        if not len(topics) == len(texts) == rows.shape[0]:
+            raise ValueError('topics, texts and vectors must have the same length')
+        if self.dim is None:
+            self.dim = rows.shape[1]
+        elif rows.shape[1] != self.dim:
+            raise ValueError(
+                f'Expected vectors of dimension {self.dim}, got {rows.shape[1]}',
+            )
+        ids = list(range(self._next_id, self._next_id + len(topics)))
+        self._next_id += len(topics)
+        self._insert(ids, list(topics), list(texts), rows)
+        return ids
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for vectors and ids, including spare capacity."""
+        return sum(
+            store._vectors.nbytes + store._ids.nbytes for store in self._stores()
+        )
+
+    def find_ids(self, topic: str, text: str | None = None) -> list[int]:
+        """Return the ids of items stored under ``topic`` (and ``text``)."""
+        found = []
+        for store in self._stores():
+            for row, stored_topic in enumerate(store.topics):
+                if stored_topic == topic and text in (None, store.texts[row]):
+                    found.append(int(store.ids[row]))
+        return found
+
+    def items(self) -> list[tuple[str, str]]:
+        """Return the ``(topic, text)`` pair of every stored item."""
+        return [
+            pair for store in self._stores()
+            for pair in zip(store.topics, store.texts)
+        ]
+
+    def _state(self) -> dict[str, np.ndarray]:
+        """Extra arrays a backend needs to restore itself."""
+        return {}
+
+    def _restore(self, state: Any) -> None:
+        """Restore backend parameters from ``_state`` output."""
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Atomically write the index, vectors included, to ``path``."""
+        stores = [store for store in self._stores() if len(store)]
+        dim = self.dim or 0
+        topics_data, topics_ends = _pack_strings(
+            [t for store in stores for t in store.topics],
+        )
+        texts_data, texts_ends = _pack_strings(
+            [t for store in stores for t in store.texts],
+        )
+        arrays = {
+            'backend': np.array(self.backend),
+            'next_id': np.array(self._next_id),
+            'dim': np.array(dim),
+            'ids': np.concatenate(
+                [store.ids for store in stores] or [np.empty(0, np.int64)],
+            ),
+            'topics_data': topics_data,
+            'topics_ends': topics_ends,
+            'texts_data': texts_data,
+            'texts_ends': texts_ends,
+            'vectors': np.concatenate(
+                [store.vectors for store in stores]
+                or [np.empty((0, dim), np.float32)],
+            ),
+            **self._state(),
+        }
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, allow_pickle=False, **arrays)
+        os.replace(tmp_path, path)
+
+
+class ExactVectorIndex(VectorIndex):
+    """
+    Brute-force index: one contiguous matrix answered with a single
+    matrix-vector product and an ``argpartition`` top-k.
+    """
+
+    backend = 'exact'
+
+    def __init__(self, initial_capacity: int = 1024) -> None:
+        super().__init__()
+        self.initial_capacity = initial_capacity
+        self._store: _FlatStore | None = None
+
+    def __len__(self) -> int:
+        return len(self._store) if self._store else 0
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """The normalised embedding matrix, one row per stored item."""
+        if self._store is None:
+            return np.empty((0, self.dim or 0), dtype=np.float32)
+        return self._store.vectors
+
+    def _stores(self) -> list[_FlatStore]:
+        return [self._store] if self._store else []
+
+    def _insert(
+            self,
+            ids: list[int],
+            topics: list[str],
+            texts: list[str],
+            rows: np.ndarray,
+    ) -> None:
+        if self._store is None:
+            self._store = _FlatStore(
+                rows.shape[1], max(self.initial_capacity, len(ids)),
+            )
+        self._store.append(ids, topics, texts, rows)
+
+    def remove(self, item_id: int) -> bool:
+        return self._store.remove(item_id) if self._store else False
+
+    def search(self, query_vector: ArrayLike, k: int = 1) -> list[KnowledgeMatch]:
+        if self._store is None or k <= 0:
+            return []
+        return self._store.search(normalize_rows(query_vector)[0], k)
+
+    def clear(self) -> None:
+        self._store = None
+        self.dim = None
+
+
+class IVFFlatVectorIndex(VectorIndex):
+    """
+    Inverted-file index: vectors are bucketed under the nearest of ``nlist``
+    k-means centroids and a query scans only the ``nprobe`` closest buckets.
+
+    Until ``train_threshold`` items have been added (or ``train`` is called)
+    everything lives in a single bucket and search is exact. Raising
+    ``nprobe`` trades latency for recall and may be changed at any time.
+    """
+
+    backend = 'ivf'
+
+    def __init__(
+            self,
+            nlist: int = 256,
+            nprobe: int = 8,
+            train_threshold: int | None = None,
+            kmeans_iterations: int = 10,
+            seed: int = 0,
+    ) -> None:
+        super().__init__()
+        self.nlist = nlist
+        self.nprobe = nprobe
+        # Roughly 39 points per centroid is the usual minimum for stable k-means.
+        self.train_threshold = train_threshold or nlist * 39
+        self.kmeans_iterations = kmeans_iterations
+        self.seed = seed
+        self.centroids: np.ndarray | None = None
+        self._lists: list[_FlatStore] = []
+        self._list_of: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._list_of)
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def _stores(self) -> list[_FlatStore]:
+        return self._lists
+
+    def _assign(self, rows: np.ndarray, chunk_size: int = 65536) -> np.ndarray:
+        if self.centroids is None:
+            return np.zeros(rows.shape[0], dtype=np.intp)
+        assignments = np.empty(rows.shape[0], dtype=np.intp)
+        for start in range(0, rows.shape[0], chunk_size):
+            chunk = rows[start:start + chunk_size]
+            assignments[start:start + chunk_size] = np.argmax(
+                chunk @ self.centroids.T, axis=1,
+            )
+        return assignments
+
+    def _distribute(
+            self,
+            ids: list[int],
+            topics: list[str],
+            texts: list[str],
+            rows: np.ndarray,
+            assignments: np.ndarray | None = None,
+    ) -> None:
+        assert self.dim is not None
+        if assignments is None:
+            assignments = self._assign(rows)
+        if not self._lists:
+            count = self.centroids.shape[0] if self.centroids is not None else 1
+            self._lists = [_FlatStore(self.dim, 16) for _ in range(count)]
+        order = np.argsort(assignments, kind='stable')
+        boundaries = np.flatnonzero(np.diff(assignments[order])) + 1
+        for group in np.split(order, boundaries):
+            list_no = int(assignments[group[0]])
+            self._lists[list_no].append(
+                [ids[i] for i in group],
+                [topics[i] for i in group],
+                [texts[i] for i in group],
+                rows[group],
+            )
+            for i in group:
+                self._list_of[ids[i]] = list_no
+
+    def _insert(
+            self,
+            ids: list[int],
+            topics: list[str],
+            texts: list[str],
+            rows: np.ndarray,
+    ) -> None:
+        self._distribute(ids, topics, texts, rows)
+        if not self.is_trained and len(self) >= self.train_threshold:
+            self.train()
+
+    def _kmeans(self, rows: np.ndarray) -> np.ndarray:
+        rng = np.random.default_rng(self.seed)
+        nlist = min(self.nlist, rows.shape[0])
+        sample_size = min(rows.shape[0], nlist * 256)
+        sample = rows[rng.choice(rows.shape[0], sample_size, replace=False)]
+        centroids: np.ndarray = sample[rng.choice(sample_size, nlist, replace=False)]
+
+        for _ in range(self.kmeans_iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(assignments, kind='stable')
+            counts = np.bincount(assignments, minlength=nlist)
+            sums = np.zeros_like(centroids)
+            occupied = np.flatnonzero(counts)
+            starts = np.concatenate(([0], np.cumsum(counts[occupied])[:-1]))
+            sums[occupied] = np.add.reduceat(sample[order], starts, axis=0)
+            # Re-seed empty clusters from random sample points.
+            empty = np.flatnonzero(counts == 0)
+            if empty.size:
+                sums[empty] = sample[rng.choice(sample_size, empty.size)]
+            centroids = normalize_rows(sums)
+        return centroids
+
+    def train(self) -> None:
+        """(Re)cluster every stored vector into ``nlist`` buckets."""
+        if not len(self):
+            return
+        stores = [store for store in self._lists if len(store)]
+        ids = [int(i) for store in stores for i in store.ids]
+        topics = [t for store in stores for t in store.topics]
+        texts = [t for store in stores for t in store.texts]
+        rows = np.concatenate([store.vectors for store in stores])
+
+        self.centroids = self._kmeans(rows)
+        self._lists = []
+        self._list_of = {}
+        self._distribute(ids, topics, texts, rows)
+
+    def remove(self, item_id: int) -> bool:
+        list_no = self._list_of.pop(item_id, None)
+        if list_no is None:
+            return False
+        return self._lists[list_no].remove(item_id)
+
+    def search(self, query_vector: ArrayLike, k: int = 1) -> list[KnowledgeMatch]:
+        if not len(self) or k <= 0:
+            return []
+        query = normalize_rows(query_vector)[0]
+        if self.centroids is None:
+            probed = self._lists
+        else:
+            nearest = top_k(self.centroids @ query, self.nprobe)
+            probed = [self._lists[i] for i in nearest]
+
+        candidates = [match for store in probed for match in store.search(query, k)]
+        return heapq.nlargest(k, candidates, key=lambda match: match.score)
+
+    def clear(self) -> None:
+        self.centroids = None
+        self._lists = []
+        self._list_of = {}
+        self.dim = None
+
+    def _state(self) -> dict[str, np.ndarray]:
+        dim = self.dim or 0
+        assignments = [
+            np.full(len(store), list_no, dtype=np.int64)
+            for list_no, store in enumerate(self._lists) if len(store)
+        ]
+        return {
+            'nlist': np.array(self.nlist),
+            'nprobe': np.array(self.nprobe),
+            'train_threshold': np.array(self.train_threshold),
+            'centroids': (
+                self.centroids if self.centroids is not None
+                else np.empty((0, dim), np.float32)
+            ),
+            'assignments': np.concatenate(assignments or [np.empty(0, np.int64)]),
+        }
+
+    def _restore(self, state: Any) -> None:
+        self.nlist = int(state['nlist'])
+        self.nprobe = int(state['nprobe'])
+        self.train_threshold = int(state['train_threshold'])
+        centroids = state['centroids']
+        self.centroids = centroids if centroids.shape[0] else None
+
+
+VECTOR_INDEX_BACKENDS: dict[str, type[VectorIndex]] = {
+    ExactVectorIndex.backend: ExactVectorIndex,
+    IVFFlatVectorIndex.backend: IVFFlatVectorIndex,
+}
+
+
+def create_vector_index(backend: str = 'exact', **params: Any) -> VectorIndex:
+    """Instantiate the index registered under ``backend``."""
+    try:
+        index_class = VECTOR_INDEX_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f'Unknown vector index backend: {backend}')
+    return index_class(**params)
+
+
+def load_vector_index(path: str | os.PathLike[str]) -> VectorIndex:
+    """Load an index previously written with ``VectorIndex.save``."""
+    with np.load(path, allow_pickle=False) as state:
+        index = create_vector_index(str(state['backend']))
+        index._restore(state)
+        vectors = state['vectors']
+        if vectors.shape[0]:
+            index.dim = int(state['dim'])
+            ids = [int(i) for i in state['ids']]
+            topics = _load_strings(state, 'topics')
+            texts = _load_strings(state, 'texts')
+            if isinstance(index, IVFFlatVectorIndex):
+                index._distribute(ids, topics, texts, vectors, state['assignments'])
+            else:
+                index._insert(ids, topics, texts, vectors)
+        index._next_id = int(state['next_id'])
+    return index
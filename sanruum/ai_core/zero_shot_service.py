@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+from typing import Any
+from typing import NamedTuple
+
+import numpy as np
+
+from sanruum.ai_core.micro_batcher import MicroBatcher
+from sanruum.ai_core.model_registry import models
+from sanruum.ai_core.model_registry import ZERO_SHOT
+from sanruum.config.base import BaseConfig
+
+Request = tuple[str, tuple[str, ...]]  # (text, candidate labels)
+Row = tuple[list[int], list[int]]  # (input_ids, token_type_ids) of one pair
+
+HYPOTHESIS_TEMPLATE = 'This example is {}.'  # The pipeline's default
+MAX_INPUT_TOKENS = 1024  # Cap for tokenizers without a usable model_max_length
+
+
+class Hypothesis(NamedTuple):
+    """A label's hypothesis encoded around an empty premise slot."""
+    prefix: list[int]  # Special tokens before the premise
+    suffix: list[int]  # Separator, hypothesis and closing special tokens
+    prefix_types: list[int]  # token_type_ids of the prefix, premise and suffix
+    premise_type: int
+    suffix_types: list[int]
+
+
+class PretokenizedZeroShot:
+    """
+    Zero-shot NLI classification that tokenises each label's hypothesis once.
+
+    The pipeline tokenises every premise/hypothesis pair on every call. Here
+    the ``"This example is {label}."`` side is encoded on first use and
+    reused, so a request only tokenises its premise and runs the model on
+    the assembled pairs. Scores match the pipeline's single-label softmax
+    over the entailment logits. Calls it does not handle (multi-label, other
+    templates or options, slow tokenizers) go to the wrapped pipeline.
+    """
+
+    def __init__(
+            self, pipeline: Any, hypothesis_template: str = HYPOTHESIS_TEMPLATE,
+    ) -> None:
+        self.pipeline = pipeline
+        self.tokenizer = pipeline.tokenizer
+        self.model = pipeline.model
+        self.hypothesis_template = hypothesis_template
+        self.entailment_id = next(
+            (
+                index for label, index in self.model.config.label2id.items()
+                if label.lower().startswith('entail')
+            ),
+            -1,
+        )
+        self.max_length = min(
+            getattr(self.tokenizer, 'model_max_length', None) or MAX_INPUT_TOKENS,
+            MAX_INPUT_TOKENS,
+        )
+        self.uses_token_types = 'token_type_ids' in self.tokenizer.model_input_names
+        self._hypotheses: dict[str, Hypothesis] = {}
+        self._lock = threading.Lock()
+
+    def hypothesis(self, label: str) -> Hypothesis:
+        """The cached encoding of ``label``'s hypothesis."""
+        cached = self._hypotheses.get(label)
+        if cached is not None:
+            return cached
+        # Encode the pair around a one-token probe premise; the tokenizer
+        # marks which positions belong to the premise.
+        encoding = self.tokenizer(
+            'a', self.hypothesis_template.format(label), truncation=False,
+        )
+        sequence_ids = encoding.sequence_ids()
+        premise = [i for i, sequence in enumerate(sequence_ids) if sequence == 0]
+        start, end = premise[0], premise[-1] + 1
+        ids = list(encoding['input_ids'])
+        types = list(encoding.get('token_type_ids') or [0] * len(ids))
+        hypothesis = Hypothesis(
+            ids[:start], ids[end:], types[:start], types[start], types[end:],
+        )
+        with self._lock:
+            self._hypotheses[label] = hypothesis
+        return hypothesis
+
+    def _rows(self, premise: list[int], labels: Sequence[str]) -> list[Row]:
+        rows: list[Row] = []
+        for label in labels:
+            h = self.hypothesis(label)
+            room = self.max_length - len(h.prefix) - len(h.suffix)
+            body = premise[:max(room, 0)]  # Truncate the premise only
+            rows.append((
+                h.prefix + body + h.suffix,
+                h.prefix_types + [h.premise_type] * len(body) + h.suffix_types,
+            ))
+        return rows
+
+    def _entailment_logits(self, rows: list[Row]) -> np.ndarray:
+        import torch
+
+        width = max(len(ids) for ids, _ in rows)
+        pad = self.tokenizer.pad_token_id or 0
+        input_ids = torch.full((len(rows), width), pad, dtype=torch.long)
+        attention_mask = torch.zeros((len(rows), width), dtype=torch.long)
+        token_type_ids = torch.zeros((len(rows), width), dtype=torch.long)
+        for row, (ids, types) in enumerate(rows):
+            input_ids[row, :len(ids)] = torch.tensor(ids)
+            attention_mask[row, :len(ids)] = 1
+            token_type_ids[row, :len(types)] = torch.tensor(types)
+        inputs = {'input_ids': input_ids, 'attention_mask': attention_mask}
+        if self.uses_token_types:
+            inputs['token_type_ids'] = token_type_ids
+        device = getattr(self.model, 'device', None)
+        if device is not None:
+            inputs = {name: tensor.to(device) for name, tensor in inputs.items()}
+        with torch.inference_mode():
+            logits = self.model(**inputs).logits
+        result: np.ndarray = logits.float().cpu().numpy()
+        return result
+
+    def __call__(
+            self,
+            sequences: str | Sequence[str],
+            candidate_labels: str | Sequence[str],
+            hypothesis_template: str | None = None,
+            multi_label: bool = False,
+            batch_size: int | None = None,
+            **kwargs: Any,
+    ) -> Any:
+        labels = [candidate_labels] if isinstance(candidate_labels, str) \
+            else list(candidate_labels)
+        template = hypothesis_template or self.hypothesis_template
+        if (
+                kwargs or multi_label or len(labels) < 2 or self.entailment_id < 0
+                or template != self.hypothesis_template or not self.tokenizer.is_fast
+        ):
+            return self.pipeline(
+                sequences, candidate_labels=candidate_labels,
+                hypothesis_template=template, multi_label=multi_label,
+                **({'batch_size': batch_size} if batch_size else {}), **kwargs,
+            )
+
+        texts = [sequences] if isinstance(sequences, str) else list(sequences)
+        premises = self.tokenizer(texts, add_special_tokens=False)['input_ids']
+        per_call = max(batch_size or 1, 1)
+        results = []
+        for offset in range(0, len(texts), per_call):
+            chunk = premises[offset:offset + per_call]
+            rows = [row for premise in chunk for row in self._rows(premise, labels)]
+            logits = self._entailment_logits(rows)[:, self.entailment_id]
+            logits = logits.reshape(len(chunk), len(labels))
+            scores = np.exp(logits - logits.max(axis=1, keepdims=True))
+            scores /= scores.sum(axis=1, keepdims=True)
+            for position, row_scores in enumerate(scores):
+                order = np.argsort(-row_scores, kind='stable')
+                results.append({
+                    'sequence': texts[offset + position],
+                    'labels': [labels[i] for i in order],
+                    'scores': [float(row_scores[i]) for i in order],
+                })
+        return results[0] if isinstance(sequences, str) else results
+
+    def stats(self) -> dict[str, Any]:
+        """Number of cached hypothesis encodings."""
+        return {'hypotheses': len(self._hypotheses)}
+
+
+class ZeroShotService:
+    """
+    Shared zero-shot worker that batches classification calls across callers.
+
+    Callable like the Hugging Face zero-shot pipeline it wraps. Single texts
+    from concurrent sessions are gathered for up to ``max_wait_ms`` and
+    classified in one pipeline call per distinct label set, with
+    ``batch_size`` set so the model runs them as one batch.
+    """
+
+    def __init__(
+            self, pipeline: Any, max_batch_size: int = 16, max_wait_ms: float = 10.0,
+    ) -> None:
+        self.pipeline = pipeline
+        self.batcher: MicroBatcher[Request, dict[str, Any]] = MicroBatcher(
+            self._classify_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            name='zero-shot-batcher',
+        )
+
+    def _classify_batch(self, requests: list[Request]) -> list[dict[str, Any]]:
+        # Requests normally share one label set; group them just in case.
+        groups: dict[tuple[str, ...], list[int]] = {}
+        for position, (_, labels) in enumerate(requests):
+            groups.setdefault(labels, []).append(position)
+        results: list[dict[str, Any]] = [{}] * len(requests)
+        for labels, positions in groups.items():
+            output = self.pipeline(
+                [requests[position][0] for position in positions],
+                candidate_labels=list(labels),
+                batch_size=len(positions),
+            )
+            if isinstance(output, dict):
+                output = [output]
+            for position, result in zip(positions, output):
+                results[position] = result
+        return results
+
+    def __call__(
+            self,
+            sequences: str | Sequence[str],
+            candidate_labels: Sequence[str],
+            **kwargs: Any,
+    ) -> Any:
+        """
+        Classify one text (one result dict) or several (a list of them).
+
+        Calls with extra pipeline options cannot share a batch with other
+        callers, so they go straight to the pipeline.
+        """
+        if kwargs:
+            return self.pipeline(sequences, candidate_labels=candidate_labels, **kwargs)
+        labels = tuple(candidate_labels)
+        if isinstance(sequences, str):
+            return self.batcher((sequences, labels))
+        return self.batcher.map([(text, labels) for text in sequences])
+
+    def stats(self) -> dict[str, Any]:
+        """Batch-size and queue-wait histograms of the worker."""
+        stats = self.batcher.stats()
+        if hasattr(self.pipeline, 'stats'):
+            stats.update(self.pipeline.stats())
+        return stats
+
+    def close(self) -> None:
+        self.batcher.close()
+
+
+_shared_classifier: Any = None
+_shared_lock = threading.Lock()
+
+
+def shared_zero_shot() -> Any:
+    """
+    The process-wide zero-shot classifier: the registry pipeline with
+    pretokenised hypotheses, behind a ``ZeroShotService`` unless
+    ``ZERO_SHOT_BATCH_SIZE`` is 1.
+    """
+    global _shared_classifier
+    with _shared_lock:
+        if _shared_classifier is None:
+            classifier: Any = PretokenizedZeroShot(models.get(ZERO_SHOT))
+            if BaseConfig.ZERO_SHOT_BATCH_SIZE > 1:
+                classifier = ZeroShotService(
+                    classifier,
+                    max_batch_size=BaseConfig.ZERO_SHOT_BATCH_SIZE,
+                    max_wait_ms=BaseConfig.ZERO_SHOT_BATCH_WINDOW_MS,
+                )
+            _shared_classifier = classifier
+        return _shared_classifier
+
+
+def zero_shot_stats() -> dict[str, Any]:
+    """Batching statistics of the shared classifier, once it exists."""
+    classifier = _shared_classifier
+    return classifier.stats() if classifier is not None else {}
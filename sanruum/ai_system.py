@@ -244,6 +244,7 @@ class SanruumAI:
             except Exception as e:
                 logger.error(f'An error occurred during execution: {e}')
                 print('An error occurred. Please try again.')
+        self.ai.close()
 
 
 def main() -> None:
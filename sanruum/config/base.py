@@ -42,12 +42,94 @@ class BaseConfig:
 
     DB_URL = f"sqlite:///{DATA_DIR / 'sanruum.db'}"
     INTENTS_FILE = directories.INTENTS_DIR / 'intents.json'
+    # Pickled, versioned IntentMatcher built from INTENTS_FILE
+    INTENTS_ARTIFACT_FILE = directories.INTENTS_DIR / 'intents.compiled.pkl'
+    INTENTS_RELOAD_INTERVAL: float | None = 2.0  # Seconds, None = no hot reload
     USER_MEMORY_DIR = directories.USER_MEMORY_DIR
     MEMORY_FILE = USER_MEMORY_DIR / 'memory.json'
+    MEMORY_INDEX_FILE = USER_MEMORY_DIR / 'memory.index.npz'
+    MEMORY_JOURNAL_FILE = USER_MEMORY_DIR / 'memory.journal'
+    MEMORY_VECTORS_FILE = USER_MEMORY_DIR / 'memory.vectors'
+    EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+    ZERO_SHOT_MODEL = 'facebook/bart-large-mnli'
+    WHISPER_MODEL = 'base'
+    EMBEDDING_DTYPE = 'float32'  # "float16" halves embedding storage
+    EMBEDDING_CACHE_SIZE = 4096  # Texts kept in the in-process embedding cache
+    # Concurrent encode requests are merged into batches of up to this size,
+    # waiting at most the window for more to arrive; a size of 1 disables it.
+    EMBEDDING_BATCH_SIZE = 32
+    EMBEDDING_BATCH_WINDOW_MS = 2.0
+    MEMORY_COMPACT_EVERY = 500  # Journal records written before a snapshot
+    MEMORY_JOURNAL_FSYNC = False  # fsync each record to survive power loss
+    # Per-user memory storage: "pickle" (one file per user) or "sqlite" (one
+    # WAL-mode database; run scripts/migrate_user_memory.py before switching)
+    USER_MEMORY_BACKEND = 'pickle'
+    MEMORY_MANAGER_MAX_USERS = 256  # User memories kept resident in RAM
+    MEMORY_MANAGER_RAM_BUDGET: int | None = 512 * 2 ** 20  # Bytes, None = no limit
+    MEMORY_FLUSH_INTERVAL = 5.0  # Seconds between write-backs of dirty memories
     SESSION_HISTORY_FILE = DATA_DIR / 'session_history.json'
 
+    RESPONSE_CACHE_SIZE = 1024  # Cached get_response results
+    RESPONSE_CACHE_MAX_BYTES: int | None = 4 * 2 ** 20
+    RESPONSE_CACHE_TTL: float | None = 3600.0  # Seconds
+    # Threads used to fuzzy-score a question against all intent patterns
+    # (-1 = all cores); one is fastest for small intent files.
+    INTENT_MATCH_WORKERS = 1
+    # The embedding centroid classifier answers intents on its own at or above
+    # this cosine similarity; below it the zero-shot model decides. A share of
+    # confident answers can also be checked against the zero-shot model.
+    INTENT_CLASSIFIER_THRESHOLD = 0.6
+    INTENT_CLASSIFIER_SHADOW_RATE = 0.0
+    # Opt-in int8 dynamic quantisation of the embedder and zero-shot models on
+    # CPU-only hosts (smaller weights, faster, slightly less accurate; see
+    # scripts/benchmark_cpu_inference.py). Whisper only gets the thread
+    # settings: its Linear subclass is not quantised. None leaves torch's
+    # thread defaults alone.
+    FAST_CPU_INFERENCE = False
+    TORCH_NUM_THREADS: int | None = None
+    TORCH_INTEROP_THREADS: int | None = None
+    # Concurrent zero-shot classifications are batched like embeddings
+    ZERO_SHOT_BATCH_SIZE = 16
+    ZERO_SHOT_BATCH_WINDOW_MS = 10.0
+    # Zero-shot rankings are cached per normalised input and label set
+    ZERO_SHOT_CACHE_SIZE = 2048
+    ZERO_SHOT_CACHE_TTL: float | None = 3600.0  # Seconds
+    # VADER scores memoised per text. Batch scoring (~0.1ms a text) switches
+    # to a process pool from this many distinct texts.
+    SENTIMENT_CACHE_SIZE = 4096
+    SENTIMENT_PARALLEL_MIN = 5000
+    # Batch text preprocessing (training data): worker processes (-1 = all
+    # cores) and texts handed to a worker at a time
+    PREPROCESS_WORKERS = -1
+    PREPROCESS_CHUNKSIZE = 256
+    # Tokens whose stem and lemma are memoised. Setting a file keeps the
+    # learned vocabulary across runs (saved at exit, loaded on first use).
+    TOKEN_MEMO_SIZE = 100_000
+    TOKEN_MEMO_FILE: Path | None = None  # e.g. directories.NLP_DATA_DIR / ...
+    # Paraphrases of a cached query at least this similar (cosine) reuse its
+    # response; a size of 0 disables the semantic tier.
+    SEMANTIC_CACHE_SIZE = 0
+    SEMANTIC_CACHE_THRESHOLD = 0.92
+
     PERSONALITY_MODE = 'friendly'  # Options: "formal", "friendly", "professional"
 
+    # Knowledge items whose embedding is at least this similar to an item
+    # already stored are rejected (None disables). Scope "topic" compares
+    # within the item's topic, "global" against all stored knowledge.
+    KNOWLEDGE_DEDUP_THRESHOLD: float | None = 0.97
+    KNOWLEDGE_DEDUP_SCOPE = 'topic'
+    # Eviction, least recently hit first, is off by default: stored knowledge
+    # is only dropped when a limit is set here (e.g. KNOWLEDGE_MAX_ITEMS =
+    # 10_000) before AIMemory is created, or on an instance through
+    # max_items_per_topic, max_knowledge_items and knowledge_ttl.
+    KNOWLEDGE_MAX_PER_TOPIC: int | None = None
+    KNOWLEDGE_MAX_ITEMS: int | None = None
+    KNOWLEDGE_TTL_SECONDS: float | None = None  # Since the last hit (or insert)
+
+    VECTOR_INDEX_BACKEND = 'exact'  # Options: "exact", "ivf"
+    # Backend keyword arguments, e.g. {'nlist': 1024, 'nprobe': 16} for "ivf"
+    VECTOR_INDEX_PARAMS: dict[str, int] = {}
+
     def reload(self) -> None:
         self.directories = ProjectDirectories(
             Path(__file__).resolve().parent.parent.parent,
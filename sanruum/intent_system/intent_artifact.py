@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sanruum.config.base import BaseConfig
+from sanruum.intent_system.intent_matcher import IntentMatcher
+from sanruum.intent_system.intent_matcher import SCORE_CUTOFF
+from sanruum.utils.base.logger import logger
+
+# Bump whenever IntentMatcher or CompiledIntents changes shape; older
+# artifacts are then recompiled instead of unpickled.
+ARTIFACT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CompiledIntents:
+    """The parsed intents file together with the matcher built from it."""
+    version: int
+    source_digest: str
+    document: dict[str, Any]
+    matcher: IntentMatcher
+
+    @property
+    def intents(self) -> list[dict[str, Any]]:
+        return self.matcher.intents
+
+
+def source_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def compile_intents(data: bytes) -> CompiledIntents:
+    """Parse intents.json contents and build the normalised pattern tables."""
+    document = json.loads(data)
+    if not isinstance(document, dict):
+        raise ValueError('intents file must contain a JSON object')
+    matcher = IntentMatcher(
+        document.get('intents', []),
+        score_cutoff=SCORE_CUTOFF,
+        workers=BaseConfig.INTENT_MATCH_WORKERS,
+    )
+    return CompiledIntents(ARTIFACT_VERSION, source_digest(data), document, matcher)
+
+
+def _read_artifact(path: Path, digest: str) -> CompiledIntents | None:
+    try:
+        with path.open('rb') as file:
+            compiled = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # Truncated, foreign or outdated pickles fail in many ways; recompile.
+        logger.warning(f'⚠️ Ignoring unreadable intents artifact {path}: {e}')
+        return None
+    if (
+            not isinstance(compiled, CompiledIntents)
+            or compiled.version != ARTIFACT_VERSION
+            or compiled.source_digest != digest
+    ):
+        return None
+    return compiled
+
+
+def _write_artifact(path: Path, compiled: CompiledIntents) -> None:
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    try:
+        with tmp_path.open('wb') as file:
+            pickle.dump(compiled, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.warning(f'⚠️ Could not write intents artifact {path}: {e}')
+
+
+def load_compiled_intents(
+        source: str | os.PathLike[str] = BaseConfig.INTENTS_FILE,
+        artifact: str | os.PathLike[str] | None = BaseConfig.INTENTS_ARTIFACT_FILE,
+) -> CompiledIntents:
+    """
+    Return the compiled form of ``source``.
+
+    The artifact is only trusted when its format version and the digest of
+    the source it was built from match; otherwise the source is compiled
+    again and the artifact rewritten. Pass ``artifact=None`` to skip it.
+
+    Raises:
+        FileNotFoundError: If ``source`` does not exist.
+        ValueError: If ``source`` is not a valid intents document.
+    """
+    data = Path(source).read_bytes()
+    digest = source_digest(data)
+    if artifact is not None:
+        compiled = _read_artifact(Path(artifact), digest)
+        if compiled is not None:
+            return compiled
+    compiled = compile_intents(data)
+    if artifact is not None:
+        _write_artifact(Path(artifact), compiled)
+    logger.info(f'✅ Compiled {len(compiled.matcher)} intent patterns from {source}')
+    return compiled
+
+
+_shared: dict[Path, CompiledIntents] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_compiled_intents(
+        source: str | os.PathLike[str] = BaseConfig.INTENTS_FILE,
+) -> CompiledIntents:
+    """
+    Process-wide compiled intents for ``source``, so the configuration and
+    every ``IntentHandler`` share one parse and one matcher.
+    """
+    path = Path(source).resolve()
+    with _shared_lock:
+        compiled = _shared.get(path)
+        if compiled is None or compiled.source_digest != source_digest(
+                path.read_bytes(),
+        ):
+            artifact = (
+                BaseConfig.INTENTS_ARTIFACT_FILE
+                if path == Path(BaseConfig.INTENTS_FILE).resolve()
+                else None
+            )
+            compiled = _shared[path] = load_compiled_intents(path, artifact)
+        return compiled
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-import json
 import re
-
-from fuzzywuzzy import fuzz
-from fuzzywuzzy import process
+from collections.abc import Callable
+from pathlib import Path
+from types import TracebackType
+from typing import Any
 
 from sanruum.config import BaseConfig
+from sanruum.intent_system.intent_artifact import compile_intents
+from sanruum.intent_system.intent_artifact import CompiledIntents
+from sanruum.intent_system.intent_artifact import shared_compiled_intents
+from sanruum.intent_system.intent_matcher import IntentMatcher
 from sanruum.utils.base.base_tools import get_current_time
+from sanruum.utils.base.file_watcher import FileWatcher
 from sanruum.utils.base.logger import logger
 
 INTENTS_FILE = BaseConfig.INTENTS_FILE
@@ -27,24 +32,97 @@ def remove_initial_greeting(text: str) -> str:
 
 
 class IntentHandler:
-    def __init__(self) -> None:
+    def __init__(
+            self,
+            reload_interval: float | None = BaseConfig.INTENTS_RELOAD_INTERVAL,
+            on_reload: Callable[[CompiledIntents], None] | None = None,
+    ) -> None:
+        """
+        Load the compiled intents and optionally watch intents.json for edits.
+
+        Parameters:
+            reload_interval (float | None): Seconds between checks of
+             intents.json for edits; None disables hot reload.
+            on_reload (Callable | None): Called with the new intents after a
+             reload, so owners can refresh what they derived from them.
+        """
+        self.on_reload = on_reload
         self.default_responses = {
             'fallback': "I'm not sure about that."
                         ' Would you like me to help you find more information?',
         }
 
         try:
-            with open(INTENTS_FILE, encoding='utf-8') as f:
-                self.intents_data = json.load(f).get('intents', [])
+            self.compiled = shared_compiled_intents(INTENTS_FILE)
             logger.info('✅ Intents Data Loaded Successfully!')
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+        except (FileNotFoundError, ValueError) as e:
             logger.error(
                 f'❌ Failed to Load Intents JSON: {e}. Using default responses.',
             )
-            self.intents_data = []
+            self.compiled = compile_intents(b'{}')
         except Exception as e:
             logger.error(f'❌ Unexpected error loading Intents JSON: {e}')
-            self.intents_data = []
+            self.compiled = compile_intents(b'{}')
+
+        self.watcher: FileWatcher | None = None
+        if reload_interval:
+            self.watcher = FileWatcher(
+                INTENTS_FILE, self._on_intents_changed, reload_interval,
+            ).start()
+
+    # Requests read ``compiled`` once, so a reload swapping it never mixes the
+    # intents of one version with the matcher of another.
+    @property
+    def intents_data(self) -> list[dict[str, Any]]:
+        return self.compiled.intents
+
+    @property
+    def matcher(self) -> IntentMatcher:
+        return self.compiled.matcher
+
+    def reload(self) -> bool:
+        """
+        Recompile intents.json and swap it in; in-flight requests finish with
+        the version they started with. The process-wide compiled intents are
+        replaced too, and ``on_reload`` is told about the new version.
+
+        Returns:
+            bool: False when the file could not be loaded and the current
+            intents were kept.
+        """
+        try:
+            compiled: CompiledIntents = shared_compiled_intents(INTENTS_FILE)
+        except (OSError, ValueError) as e:
+            logger.error(f'❌ Keeping current intents, reload failed: {e}')
+            return False
+        self.compiled = compiled
+        logger.info(f'🔄 Reloaded {len(compiled.matcher)} intent patterns.')
+        if self.on_reload is not None:
+            try:
+                self.on_reload(compiled)
+            except Exception as e:
+                logger.error(f'❌ Intents reload listener failed: {e}')
+        return True
+
+    def _on_intents_changed(self, path: Path) -> None:
+        self.reload()
+
+    def close(self) -> None:
+        """Stop watching intents.json."""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
+    def __enter__(self) -> IntentHandler:
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc: BaseException | None,
+            tb: TracebackType | None,
+    ) -> None:
+        self.close()
 
     def get_intent_response(
             self, user_input: str,
@@ -54,43 +132,40 @@ class IntentHandler:
         questions = [q.strip() for q in re.split(r'[,.?!]', user_input) if q.strip()]
         logger.debug(f'🛠 Split questions: {questions}')
 
-        for question in questions:
-            logger.debug(f"🔎 Processing question: '{question}'")
-            for intent in self.intents_data:
-                best_match, score = process.extractOne(
-                    question, intent.get('patterns', []),
-                    scorer=fuzz.token_set_ratio, score_cutoff=60,
-                ) or (None, 0)
-
-                if best_match:
-                    logger.debug(
-                        f'✅ Best match found in intent: '
-                        f"'{intent['name']}' (Score: {score})",
+        match = self.compiled.matcher.match(questions)
+        if match is not None:
+            intent = match.intent
+            logger.debug(
+                f"✅ Best match found for '{match.question}' in intent: "
+                f"'{intent['name']}' (Pattern: '{match.pattern}', "
+                f'Score: {match.score})',
+            )
+
+            intent_name = intent.get('name')
+
+            # Handle dynamic intents
+            if intent_name in DYNAMIC_INTENTS:
+                dynamic_value = DYNAMIC_INTENTS[intent_name]()  # Call function
+                response_templates = intent.get('response', {})
+
+                if isinstance(response_templates, dict):
+                    chosen_response = str(
+                        response_templates.get(
+                            'friendly', response_templates.get(
+                                list(response_templates.keys())[0],
+                                self.default_responses['fallback'],
+                            ),
+                        ),
                     )
+                    return chosen_response.format(time=dynamic_value)
+
+                if isinstance(response_templates, str):
+                    return response_templates.format(time=dynamic_value)
 
-                    intent_name = intent.get('name')
-
-                    # Handle dynamic intents
-                    if intent_name in DYNAMIC_INTENTS:
-                        dynamic_value = DYNAMIC_INTENTS[intent_name]()  # Call function
-                        response_templates = intent.get('response', {})
-
-                        if isinstance(response_templates, dict):
-                            chosen_response: str = response_templates.get(
-                                'friendly', response_templates.get(
-                                    list(response_templates.keys())[0],
-                                    self.default_responses['fallback'],
-                                ),
-                            )
-                            return chosen_response.format(time=dynamic_value)
-
-                        if isinstance(response_templates, str):
-                            return response_templates.format(time=dynamic_value)
-
-                    # Return normal static response
-                    response = intent.get('response')
-                    if isinstance(response, (str, dict)):
-                        return response
+            # Return normal static response
+            response = intent.get('response')
+            if isinstance(response, (str, dict)):
+                return response
 
         logger.debug('❌ No matching intent found.')
         return self.default_responses['fallback']
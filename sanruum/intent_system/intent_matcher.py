@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from collections.abc import Sequence
+from typing import Any
+from typing import NamedTuple
+
+import numpy as np
+from rapidfuzz import fuzz
+from rapidfuzz import process
+from rapidfuzz import utils
+
+from sanruum.intent_system.pattern_automaton import PatternAutomaton
+
+SCORE_CUTOFF = 60
+EMPTY_IDS = np.empty(0, dtype=np.intp)
+# Postings longer than this share of all patterns (and at least this many
+# ids) are stop-word-like; they are only skipped when the question's rarer
+# tokens already give at least that many candidates.
+COMMON_POSTING_RATIO = 0.02
+COMMON_POSTING_MIN = 64
+
+
+def trigrams(token: str) -> set[str]:
+    """Character trigrams of a token, padded so short tokens have some."""
+    padded = f' {token} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _row_best(row: np.ndarray) -> tuple[int, float]:
+    best = int(np.argmax(row))
+    return best, float(row[best])
+
+
+def _postings(index: dict[str, list[int]]) -> dict[str, np.ndarray]:
+    return {key: np.asarray(ids, dtype=np.intp) for key, ids in index.items()}
+
+
+class IntentMatch(NamedTuple):
+    intent: dict[str, Any]
+    pattern: str
+    score: float
+    question: str
+    exact: bool = False  # Found by the automaton, not by fuzzy scoring
+
+
+class IntentMatcher:
+    """
+    Every pattern of every intent flattened into one table.
+
+    Questions that contain a pattern word for word are answered by an
+    Aho-Corasick automaton over all patterns in one pass over the question,
+    before any fuzzy scoring; the longest contained pattern wins. Otherwise
+    patterns are normalised once at build time and scored with
+    ``rapidfuzz.process.cdist``, which runs in native code and can use several
+    threads. The best-scoring pattern at or above ``score_cutoff`` decides the
+    intent; ties go to the intent listed first.
+
+    With ``use_index`` an inverted index from pattern tokens to pattern ids
+    limits scoring to patterns sharing a token with the question. Question
+    tokens that appear in no pattern (typos, inflections) are looked up by
+    character trigram instead. Tokens found in a large share of patterns are
+    skipped when the rarer ones already yield as many candidates as such a
+    common token would; this is the one approximation, as a pattern sharing
+    only a common token is then not scored. A question without any candidates
+    falls back to the full scan, so lookup cost follows the candidate count
+    rather than the size of the intents file.
+    """
+
+    def __init__(
+            self,
+            intents: Sequence[dict[str, Any]],
+            score_cutoff: int = SCORE_CUTOFF,
+            workers: int = 1,
+            use_index: bool = True,
+    ) -> None:
+        self.intents = list(intents)
+        self.score_cutoff = score_cutoff
+        self.workers = workers
+        self.use_index = use_index
+        self.patterns: list[str] = []
+        self.processed: list[str] = []
+        owners: list[int] = []
+        tokens: dict[str, list[int]] = defaultdict(list)
+        grams: dict[str, list[int]] = defaultdict(list)
+        for position, intent in enumerate(self.intents):
+            for pattern in intent.get('patterns', []):
+                pattern_id = len(self.patterns)
+                processed = utils.default_process(pattern)
+                self.patterns.append(pattern)
+                self.processed.append(processed)
+                owners.append(position)
+                pattern_tokens = set(processed.split())
+                for token in pattern_tokens:
+                    tokens[token].append(pattern_id)
+                for gram in set().union(*map(trigrams, pattern_tokens)):
+                    grams[gram].append(pattern_id)
+        self.owners = np.asarray(owners, dtype=np.intp)
+        self._token_postings = _postings(tokens)
+        self._trigram_postings = _postings(grams)
+        self.automaton = PatternAutomaton(p.split() for p in self.processed)
+        self.exact_hits = 0
+        self.full_scans = 0
+        self._common_posting = max(
+            COMMON_POSTING_MIN, int(COMMON_POSTING_RATIO * len(self.patterns)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _cdist(self, queries: list[str], choices: list[str]) -> np.ndarray:
+        matrix: np.ndarray = process.cdist(
+            queries,
+            choices,
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=self.score_cutoff,
+            dtype=np.uint8,
+            workers=self.workers,
+        )
+        return matrix
+
+    def scores(self, questions: Sequence[str]) -> np.ndarray:
+        """``(len(questions), len(patterns))`` matrix of token-set ratios."""
+        if not questions or not self.patterns:
+            return np.zeros((len(questions), len(self.patterns)), dtype=np.uint8)
+        return self._cdist(
+            [utils.default_process(question) for question in questions],
+            self.processed,
+        )
+
+    def candidates(self, question: str) -> np.ndarray:
+        """Sorted ids of the patterns sharing a token or trigram with it."""
+        postings: list[np.ndarray] = []
+        for token in set(utils.default_process(question).split()):
+            ids = self._token_postings.get(token)
+            if ids is not None:
+                postings.append(ids)
+                continue
+            postings.extend(self._grams_postings(trigrams(token)))
+        if not postings:
+            return EMPTY_IDS
+        rare = [ids for ids in postings if ids.size <= self._common_posting]
+        if rare:
+            ids = np.unique(np.concatenate(rare))
+            if ids.size >= self._common_posting or len(rare) == len(postings):
+                return ids
+        return np.unique(np.concatenate(postings))
+
+    def _grams_postings(self, grams: Iterable[str]) -> list[np.ndarray]:
+        return [
+            ids for gram in grams
+            if (ids := self._trigram_postings.get(gram)) is not None
+        ]
+
+    def _best(self, question: str) -> tuple[int, float]:
+        """Best pattern id and score for one question, using the index."""
+        ids = self.candidates(question)
+        if not ids.size:
+            self.full_scans += 1
+            return _row_best(self.scores([question])[0])
+        best, score = _row_best(
+            self._cdist(
+                [utils.default_process(question)],
+                [self.processed[i] for i in ids],
+            )[0],
+        )
+        return int(ids[best]), score
+
+    def match(self, questions: Sequence[str]) -> IntentMatch | None:
+        """
+        Best intent for the first question that matches anything.
+
+        Earlier questions take precedence, as in a multi-part message the
+        first part is answered. Without the index all questions needing fuzzy
+        scoring are scored in one call.
+        """
+        if not self.patterns:
+            return None
+        matrix: np.ndarray | None = None
+        for position, question in enumerate(questions):
+            hit = self.automaton.best(utils.default_process(question).split())
+            if hit is not None:
+                # Contained word for word: token_set_ratio would score it 100.
+                self.exact_hits += 1
+                best, score = hit.pattern_id, 100.0
+            elif self.use_index:
+                best, score = self._best(question)
+            else:
+                if matrix is None:
+                    matrix = self.scores(questions)
+                best, score = _row_best(matrix[position])
+            if score >= self.score_cutoff:
+                return IntentMatch(
+                    intent=self.intents[self.owners[best]],
+                    pattern=self.patterns[best],
+                    score=score,
+                    question=question,
+                    exact=hit is not None,
+                )
+        return None
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from collections.abc import Sequence
+from typing import NamedTuple
+
+
+class PatternHit(NamedTuple):
+    pattern_id: int
+    start: int  # Token offsets in the searched text
+    end: int
+
+
+class PatternAutomaton:
+    """
+    Aho-Corasick automaton over whole-word token sequences.
+
+    Built once from the normalised patterns, it reports every pattern that
+    occurs as a contiguous run of words in a text in one pass over the text's
+    tokens, however many patterns there are. Matching on word tokens rather
+    than characters keeps "hi" from matching inside "this".
+    """
+
+    def __init__(self, patterns: Iterable[Sequence[str]] = ()) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # (pattern id, pattern length) of every pattern ending at a node,
+        # including those reached through failure links.
+        self._outputs: list[list[tuple[int, int]]] = [[]]
+        self._size = 0
+        for pattern_id, tokens in enumerate(patterns):
+            self._add(pattern_id, tokens)
+        self._link()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _add(self, pattern_id: int, tokens: Sequence[str]) -> None:
+        if not tokens:
+            return
+        node = 0
+        for token in tokens:
+            child = self._goto[node].get(token)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][token] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            node = child
+        self._outputs[node].append((pattern_id, len(tokens)))
+        self._size += 1
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                self._outputs[child].extend(self._outputs[self._fail[child]])
+
+    def find_all(self, tokens: Sequence[str]) -> list[PatternHit]:
+        """Every pattern occurrence in ``tokens``, in order of their end."""
+        hits = []
+        node = 0
+        for position, token in enumerate(tokens):
+            while node and token not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(token, 0)
+            for pattern_id, length in self._outputs[node]:
+                hits.append(PatternHit(pattern_id, position + 1 - length, position + 1))
+        return hits
+
+    def best(self, tokens: Sequence[str]) -> PatternHit | None:
+        """The longest pattern found in ``tokens``; ties go to the lowest id."""
+        hits = self.find_all(tokens)
+        if not hits:
+            return None
+        return min(hits, key=lambda hit: (hit.start - hit.end, hit.pattern_id))
@@ -0,0 +1,66 @@
+# sanruum/monitor/metrics.py
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+
+class Histogram:
+    """
+    Thread-safe histogram with fixed, cumulative-style bucket bounds.
+
+    ``bounds`` are inclusive upper limits; values above the last bound land
+    in an overflow bucket reported as ``inf``.
+    """
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = sorted(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.counts[bisect.bisect_left(self.bounds, value)] += 1
+            self.count += 1
+            self.total += value
+            self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = q * self.count
+            seen = 0
+            for bound, count in zip([*self.bounds, math.inf], self.counts):
+                seen += count
+                if seen >= rank:
+                    return min(bound, self.max)
+            return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        """Counts per bucket plus summary values, for logging or an API."""
+        with self._lock:
+            buckets = dict(zip([*map(str, self.bounds), 'inf'], self.counts))
+            count, total, maximum = self.count, self.total, self.max
+        return {
+            'buckets': buckets,
+            'count': count,
+            'mean': total / count if count else 0.0,
+            'max': maximum,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts = [0] * (len(self.bounds) + 1)
+            self.count = 0
+            self.total = 0.0
+            self.max = 0.0
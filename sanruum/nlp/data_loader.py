@@ -7,7 +7,7 @@ from pathlib import Path
 import pandas as pd
 
 from sanruum.config import BaseConfig
-from sanruum.nlp.utils.preprocessing import preprocess_text
+from sanruum.nlp.utils.preprocessing import preprocess_batch
 from sanruum.utils.base.logger import logger
 
 LABEL_MAP_FILE = BaseConfig.DATA_DIR / 'label_map.json'
@@ -55,7 +55,7 @@ def load_custom_dataset(file_path: str | Path) -> pd.DataFrame:
         raise ValueError("Missing required column: 'text' in dataset.")
 
     try:
-        df['processed_text'] = df['text'].apply(preprocess_text)
+        df['processed_text'] = preprocess_batch(df['text'], preset='training')
     except Exception as e:
         logger.warning(f'Preprocessing failed: {e}')
         df['processed_text'] = df['text']  # Fallback to raw text
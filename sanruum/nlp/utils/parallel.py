@@ -0,0 +1,72 @@
+# sanruum\nlp\utils\parallel.py
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def resolve_jobs(n_jobs: int | None) -> int:
+    """Worker count for ``n_jobs``: None or -1 mean all cores."""
+    cores = os.cpu_count() or 1
+    if n_jobs is None or n_jobs < 0:
+        return cores
+    return max(n_jobs, 1)
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Consecutive lists of up to ``size`` items."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def imap_chunks(
+        func: Callable[[list[T]], list[R]],
+        items: Iterable[T],
+        n_jobs: int | None = None,
+        chunksize: int = 256,
+        initializer: Callable[[], None] | None = None,
+        max_pending: int | None = None,
+) -> Iterator[R]:
+    """
+    Lazily apply ``func`` to chunks of ``items`` on a process pool and yield
+    the results one by one, in input order.
+
+    At most ``max_pending`` chunks (two per worker by default) are in flight,
+    so memory stays bounded however long ``items`` is. ``func`` and
+    ``initializer`` must be picklable module-level callables; the
+    initializer runs once per worker. With one job everything runs in this
+    process.
+    """
+    workers = resolve_jobs(n_jobs)
+    chunks = chunked(items, chunksize)
+    if workers == 1:
+        if initializer is not None:
+            initializer()
+        for chunk in chunks:
+            yield from func(chunk)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=initializer)
+    pending: deque[Future[list[R]]] = deque()
+    limit = max_pending or 2 * workers
+    try:
+        for chunk in chunks:
+            pending.append(pool.submit(func, chunk))
+            if len(pending) >= limit:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # Also reached when the consumer stops early.
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import atexit
+import json
+import math
+import os
 import re
+import string
+import threading
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from functools import partial
 from functools import wraps
 from pathlib import Path
 from typing import Any
@@ -20,6 +30,8 @@ from nltk.tokenize import word_tokenize
 from spellchecker.spellchecker import SpellChecker
 
 from sanruum.config import BaseConfig
+from sanruum.nlp.utils.parallel import imap_chunks
+from sanruum.utils.base.cache import LRUCache
 from sanruum.utils.base.logger import logger
 
 IGNORE_SPELLCHECK_WORD_FILE_PATH = (
@@ -27,7 +39,12 @@ IGNORE_SPELLCHECK_WORD_FILE_PATH = (
     / 'ignore_spellcheck_words.txt'
 )
 
-nltk.download('stopwords')
+# Download only when missing: every process (including each pool worker on
+# spawn-based platforms) imports this module.
+try:
+    stopwords.words('english')
+except LookupError:
+    nltk.download('stopwords')
 
 # Global precompiled regex patterns for performance
 URL_REGEX = re.compile(r'(www|http)\S+')
@@ -41,6 +58,7 @@ SSN_REGEX = re.compile(
     r'(?!0{4})\d{4}|(?!219099999|078051120)(?!666|000|9\d{2})\d{3}(?!00)'
     r'\d{2}(?!0{4})\d{4}',
 )
+NUMBER_REGEX = re.compile(r'\d+')
 CREDIT_CARD_REGEX = re.compile(
     r'(4[0-9]{12}(?:[0-9]{3})?|(?:5[1-5][0-9]{2}|222[1-9]|22[3-9][0-9]|'
     r'2[3-6][0-9]{2}|27[01][0-9]|2720)[0-9]{12}|3[47][0-9]{13}|'
@@ -48,6 +66,19 @@ CREDIT_CARD_REGEX = re.compile(
     r'(?:2131|1800|35\d{3})\d{11})',
 )
 
+SPECIAL_CHARACTERS = (
+    'å¼«¥ª°©ð±§µæ¹¢³¿®ä£'
+    '¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿'
+    '×÷‐‑‒–—―‖‘’‚‛“”„‟†‡•‣․‥…‰′″‴'
+    '‹›‼‽‾⁄⁂⁎⁑⁓⁕⁖⁗⁘⁙⁚⁛⁜⁝⁞'
+    '™℠℡ℤℕℝℚℙℂℵℶℷℸ⅀⅁⅂⅃⅄ⅅⅆⅇⅈⅉ'
+    '←↑→↓↔↕↖↗↘↙↚↛↜↝↞↟↠↡↢↣'
+    '↤↥↦↧↨↩↪↫↬↭↮↯↰↱↲↳↴↵↶↷↸↹'
+)
+# Translation tables for the default character sets, built once
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+_SPECIAL_CHARACTER_TABLE = str.maketrans('', '', SPECIAL_CHARACTERS)
+
 # Cache the NameDataset instance for efficiency
 _NAME_DATASET = None
 
@@ -140,7 +171,7 @@ def to_upper(input_text: str) -> str:
 @_return_empty_string_for_invalid_input
 def remove_number(input_text: str) -> str:
     """Remove numbers from the input text."""
-    return re.sub(r'\d+', '', input_text)
+    return NUMBER_REGEX.sub('', input_text)
 
 
 @_return_empty_string_for_invalid_input
@@ -159,8 +190,7 @@ def remove_url(input_text: str) -> str:
 def remove_punctuation(input_text: str, punctuations: str | None = None) -> str:
     """Remove all punctuations from input text."""
     if punctuations is None:
-        import string
-        punctuations = string.punctuation
+        return input_text.translate(_PUNCTUATION_TABLE)
     return input_text.translate(str.maketrans('', '', punctuations))
 
 
@@ -171,15 +201,7 @@ def remove_special_character(
 ) -> str:
     """Remove special characters from the input text."""
     if special_characters is None:
-        special_characters = (
-            'å¼«¥ª°©ð±§µæ¹¢³¿®ä£'
-            '¢£¤¥¦§¨©ª«¬®¯°±²³´µ¶·¸¹º»¼½¾¿'
-            '×÷‐‑‒–—―‖‘’‚‛“”„‟†‡•‣․‥…‰′″‴'
-            '‹›‼‽‾⁄⁂⁎⁑⁓⁕⁖⁗⁘⁙⁚⁛⁜⁝⁞'
-            '™℠℡ℤℕℝℚℙℂℵℶℷℸ⅀⅁⅂⅃⅄ⅅⅆⅇⅈⅉ'
-            '←↑→↓↔↕↖↗↘↙↚↛↜↝↞↟↠↡↢↣'
-            '↤↥↦↧↨↩↪↫↬↭↮↯↰↱↲↳↴↵↶↷↸↹'
-        )
+        return input_text.translate(_SPECIAL_CHARACTER_TABLE)
     return input_text.translate(str.maketrans('', '', special_characters))
 
 
@@ -333,20 +355,135 @@ def tokenize_sentence(input_text: str) -> list[str]:
     ]
 
 
+# --------------------------
+# Stemming and lemmatization
+# --------------------------
+
+TOKEN_MEMO_VERSION = 1
+
+Stemmer = PorterStemmer | SnowballStemmer | LancasterStemmer
+
+
+class TokenMemo:
+    """
+    Memoised stemming and lemmatization: token -> stem and word -> lemma.
+
+    Word frequencies are Zipfian, so after a short warm-up nearly every
+    token is a dictionary hit instead of a run of the Porter rules or a
+    WordNet lookup. Both tables are bounded LRU caches and can be saved to
+    and loaded from a JSON file; a file written by a different stemmer or
+    lemmatizer is ignored.
+    """
+
+    def __init__(
+            self,
+            stemmer: Stemmer | None = None,
+            lemmatizer: WordNetLemmatizer | None = None,
+            maxsize: int = BaseConfig.TOKEN_MEMO_SIZE,
+    ) -> None:
+        self.stemmer = stemmer if stemmer is not None else PorterStemmer()
+        self.lemmatizer = lemmatizer if lemmatizer is not None else WordNetLemmatizer()
+        self.stems: LRUCache[str, str] = LRUCache(maxsize=maxsize)
+        self.lemmas: LRUCache[str, str] = LRUCache(maxsize=maxsize)
+
+    def stem(self, token: str) -> str:
+        stem: str | None = self.stems.get(token)
+        if stem is None:
+            stem = str(self.stemmer.stem(token))
+            self.stems.set(token, stem)
+        return stem
+
+    def lemmatize(self, word: str) -> str:
+        lemma: str | None = self.lemmas.get(word)
+        if lemma is None:
+            lemma = str(self.lemmatizer.lemmatize(word))
+            self.lemmas.set(word, lemma)
+        return lemma
+
+    def _signature(self) -> dict[str, Any]:
+        return {
+            'version': TOKEN_MEMO_VERSION,
+            'stemmer': repr(self.stemmer),
+            'lemmatizer': type(self.lemmatizer).__name__,
+        }
+
+    def save(self, path: str | Path) -> None:
+        """Write both tables to ``path`` atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            **self._signature(),
+            'stems': self.stems.snapshot(),
+            'lemmas': self.lemmas.snapshot(),
+        }
+        # Per-process name: spawned pool workers save at exit too.
+        temporary = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        temporary.write_text(json.dumps(payload), encoding='utf-8')
+        os.replace(temporary, path)
+
+    def load(self, path: str | Path) -> int:
+        """Merge a saved vocabulary into the tables; returns the entries read."""
+        try:
+            payload = json.loads(Path(path).read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f'⚠️ Could not read token memo {path}: {e}')
+            return 0
+        if any(payload.get(key) != value for key, value in self._signature().items()):
+            logger.warning(f'⚠️ Ignoring token memo {path} from another stemmer.')
+            return 0
+        for token, stem in payload.get('stems', {}).items():
+            self.stems.set(token, stem)
+        for word, lemma in payload.get('lemmas', {}).items():
+            self.lemmas.set(word, lemma)
+        return len(payload.get('stems', {})) + len(payload.get('lemmas', {}))
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        return {'stems': self.stems.stats(), 'lemmas': self.lemmas.stats()}
+
+
+_TOKEN_MEMO: TokenMemo | None = None
+_TOKEN_MEMO_LOCK = threading.Lock()
+
+
+def _save_token_memo(memo: TokenMemo, path: Path) -> None:
+    try:
+        memo.save(path)
+    except OSError as e:
+        logger.warning(f'⚠️ Could not save token memo {path}: {e}')
+
+
+def shared_token_memo() -> TokenMemo:
+    """
+    The process-wide memo around the shared Porter stemmer and WordNet
+    lemmatizer. With ``TOKEN_MEMO_FILE`` set it starts from the saved
+    vocabulary and writes it back when the process exits.
+    """
+    global _TOKEN_MEMO
+    with _TOKEN_MEMO_LOCK:
+        if _TOKEN_MEMO is None:
+            memo = TokenMemo()
+            path = BaseConfig.TOKEN_MEMO_FILE
+            if path is not None:
+                if Path(path).exists():
+                    memo.load(path)
+                atexit.register(_save_token_memo, memo, Path(path))
+            _TOKEN_MEMO = memo
+        return _TOKEN_MEMO
+
+
 @_return_empty_list_for_invalid_input
 def stem_word(
         input_text_or_list: list[str],
         stemmer: PorterStemmer | SnowballStemmer | LancasterStemmer | None = None,
 ) -> list[str]:
-    """Stem each token in the input."""
-    if stemmer is None:
-        stemmer = PorterStemmer()
+    """Stem each token in the input (memoised for the default stemmer)."""
+    stem = shared_token_memo().stem if stemmer is None else stemmer.stem
     if isinstance(input_text_or_list, str):
         tokens = word_tokenize(input_text_or_list)
-        processed_tokens = [stemmer.stem(token) for token in tokens]
+        processed_tokens = [stem(token) for token in tokens]
     else:
         processed_tokens = [
-            stemmer.stem(token)
+            stem(token)
             for token in input_text_or_list
             if token is not None and len(token) > 0
         ]
@@ -358,15 +495,16 @@ def lemmatize_word(
         input_text_or_list: str | list[str],
         lemmatizer: WordNetLemmatizer | None = None,
 ) -> list[str]:
-    """Lemmatize each token in the input."""
-    if lemmatizer is None:
-        lemmatizer = WordNetLemmatizer()
+    """Lemmatize each token in the input (memoised for the default lemmatizer)."""
+    lemmatize = (
+        shared_token_memo().lemmatize if lemmatizer is None else lemmatizer.lemmatize
+    )
     if isinstance(input_text_or_list, str):
         tokens = word_tokenize(input_text_or_list)
-        processed_tokens = [lemmatizer.lemmatize(token) for token in tokens]
+        processed_tokens = [lemmatize(token) for token in tokens]
     else:
         processed_tokens = [
-            lemmatizer.lemmatize(token) for token in input_text_or_list if
+            lemmatize(token) for token in input_text_or_list if
             token is not None and len(token) > 0
         ]
     return processed_tokens
@@ -387,31 +525,254 @@ def preprocess_text(
       - Remove stopwords
       - Apply stemming and lemmatization
 
+    This is the "default" preset of ``PreprocessingPipeline``; callers that
+    need fewer steps should use ``get_pipeline`` with a lighter preset.
+
     Parameters:
         input_text (str): The text to preprocess.
         return_string (bool): If True, return a single string;
          otherwise, return a list of tokens.
     """
-    # Expand contractions and normalize text
-    input_text = expand_contraction(input_text)
-    input_text = normalize_unicode(input_text)
-    input_text = to_lower(input_text)
-    input_text = remove_url(input_text)
-    input_text = remove_email(input_text)
-    input_text = remove_punctuation(input_text)
-    input_text = remove_whitespace(input_text)
-
-    # Tokenize and remove stopwords
-    tokens: list[str] = word_tokenize(input_text)
-    tokens = remove_stopword(tokens)
-
-    # Apply stemming and lemmatization
-    tokens = stem_word(tokens)
-    tokens = lemmatize_word(tokens)
-
-    if return_string:
-        return ' '.join(tokens)
-    return tokens
+    return get_pipeline('default')(input_text, return_string=return_string)
+
+
+# --------------------------
+# Pipelines
+# --------------------------
+
+# Steps in the order they are applied. The string phase runs contraction
+# expansion, unicode normalisation, lowering, one combined regex for the
+# removed patterns and one translate for the removed characters; the token
+# phase is a single loop.
+PIPELINE_STEPS = (
+    'contractions', 'unicode', 'lower', 'urls', 'emails', 'numbers',
+    'punctuation', 'special_characters', 'stopwords', 'stem', 'lemmatize',
+)
+
+PIPELINE_PRESETS: dict[str, tuple[str, ...]] = {
+    # Everything preprocess_text has always done
+    'default': (
+        'contractions', 'unicode', 'lower', 'urls', 'emails', 'punctuation',
+        'stopwords', 'stem', 'lemmatize',
+    ),
+    # Clean, lower-case words for intent and knowledge matching; stop words
+    # carry meaning in short requests and stems confuse the language models
+    'intent-matching': (
+        'contractions', 'unicode', 'lower', 'urls', 'emails', 'punctuation',
+    ),
+    # Dictionary words without noise for the classifier's TF-IDF features
+    'training': (
+        'contractions', 'unicode', 'lower', 'urls', 'emails', 'numbers',
+        'punctuation', 'special_characters', 'stopwords', 'lemmatize',
+    ),
+}
+
+_PATTERN_STEPS = {'urls': URL_REGEX, 'emails': EMAIL_REGEX, 'numbers': NUMBER_REGEX}
+
+# Words NLTK's tokenizer splits although they contain no punctuation, with
+# the split position ("cannot" -> "can", "not").
+_SPLIT_WORDS = {
+    'cannot': 3, 'gimme': 3, 'gonna': 3, 'gotta': 3, 'lemme': 3, 'wanna': 3,
+}
+
+
+class PreprocessingPipeline:
+    """
+    Preprocessing configured once with the chosen steps.
+
+    Regexes and translation tables are combined at construction, so a call
+    makes a handful of passes over the string and one loop over the tokens
+    instead of the dozen rescans of chaining the helper functions, with
+    stems and lemmas looked up in a ``TokenMemo``. Once punctuation is
+    removed, whitespace splitting gives the same tokens as ``word_tokenize``
+    at a fraction of the cost. Steps are always applied in ``PIPELINE_STEPS``
+    order.
+    """
+
+    def __init__(
+            self,
+            steps: Sequence[str] = PIPELINE_PRESETS['default'],
+            stop_words: set[str] | None = None,
+            stemmer: Stemmer | None = None,
+            lemmatizer: WordNetLemmatizer | None = None,
+    ) -> None:
+        unknown = set(steps) - set(PIPELINE_STEPS)
+        if unknown:
+            raise ValueError(f'Unknown preprocessing steps: {sorted(unknown)}')
+        self.steps = tuple(step for step in PIPELINE_STEPS if step in steps)
+        enabled = set(self.steps)
+
+        patterns = [
+            f'(?:{regex.pattern})' for step, regex in _PATTERN_STEPS.items()
+            if step in enabled
+        ]
+        self.remove_regex = re.compile('|'.join(patterns)) if patterns else None
+        removed = ''
+        if 'punctuation' in enabled:
+            removed += string.punctuation
+        if 'special_characters' in enabled:
+            removed += SPECIAL_CHARACTERS
+        self.remove_table = str.maketrans('', '', removed) if removed else None
+        self.split_on_whitespace = 'punctuation' in enabled
+
+        self.stop_words = (
+            (stop_words if stop_words is not None else _DEFAULT_STOP_WORDS)
+            if 'stopwords' in enabled else None
+        )
+        self.stem = 'stem' in enabled
+        self.lemmatize = 'lemmatize' in enabled
+        # Custom instances get a memo of their own
+        self.memo = (
+            shared_token_memo() if stemmer is None and lemmatizer is None
+            else TokenMemo(stemmer, lemmatizer)
+        )
+
+    @classmethod
+    def from_preset(cls, name: str, **kwargs: Any) -> PreprocessingPipeline:
+        try:
+            steps = PIPELINE_PRESETS[name]
+        except KeyError:
+            raise ValueError(
+                f'Unknown preprocessing preset {name!r}; '
+                f'choose from {sorted(PIPELINE_PRESETS)}',
+            ) from None
+        return cls(steps, **kwargs)
+
+    def _clean(self, text: str) -> str:
+        enabled = self.steps
+        if 'contractions' in enabled:
+            text = str(contractions.fix(text))
+        if 'unicode' in enabled:
+            text = normalize('NFKD', text).encode('ASCII', 'ignore').decode('utf8')
+        if 'lower' in enabled:
+            text = text.lower()
+        if self.remove_regex is not None:
+            text = self.remove_regex.sub('', text)
+        if self.remove_table is not None:
+            text = text.translate(self.remove_table)
+        return text
+
+    def _tokenize(self, text: str) -> list[str]:
+        if not self.split_on_whitespace:
+            return [str(token) for token in word_tokenize(text)]
+        tokens = []
+        for token in text.split():
+            split = _SPLIT_WORDS.get(token.lower())
+            if split is None:
+                tokens.append(token)
+            else:
+                tokens.extend((token[:split], token[split:]))
+        return tokens
+
+    def __call__(self, text: str, return_string: bool = False) -> list[str] | str:
+        """Preprocess one text into tokens, or a space-joined string."""
+        if text is None or not str(text).strip():
+            return '' if return_string else []
+
+        stop_words = self.stop_words
+        stem = self.memo.stem if self.stem else None
+        lemmatize = self.memo.lemmatize if self.lemmatize else None
+        tokens = []
+        for token in self._tokenize(self._clean(text)):
+            if stop_words is not None and token in stop_words:
+                continue
+            if stem is not None:
+                token = stem(token)
+            if lemmatize is not None:
+                token = lemmatize(token)
+            if token:
+                tokens.append(token)
+
+        if return_string:
+            return ' '.join(tokens)
+        return tokens
+
+
+_PIPELINES: dict[str, PreprocessingPipeline] = {}
+
+
+def get_pipeline(preset: str = 'default') -> PreprocessingPipeline:
+    """The shared pipeline of a named preset, built on first use."""
+    pipeline = _PIPELINES.get(preset)
+    if pipeline is None:
+        pipeline = _PIPELINES.setdefault(
+            preset, PreprocessingPipeline.from_preset(preset),
+        )
+    return pipeline
+
+
+# --------------------------
+# Batch processing
+# --------------------------
+
+def _init_preprocess_worker(preset: str = 'default') -> None:
+    """Build the pipeline and load its lazily read NLTK resources once."""
+    try:
+        get_pipeline(preset)('warming up the workers')
+    except LookupError as e:
+        logger.warning(f'⚠️ NLTK resource missing in preprocessing worker: {e}')
+
+
+def _preprocess_chunk(
+        texts: list[Any],
+        return_string: bool = False,
+        preset: str = 'default',
+) -> list[list[str] | str]:
+    """Preprocess one chunk; missing values (None, NaN) give empty results."""
+    pipeline = get_pipeline(preset)
+    return [
+        pipeline(
+            '' if text is None or (isinstance(text, float) and math.isnan(text))
+            else str(text),
+            return_string=return_string,
+        )
+        for text in texts
+    ]
+
+
+def iter_preprocess(
+        texts: Iterable[Any],
+        n_jobs: int | None = None,
+        chunksize: int | None = None,
+        return_string: bool = False,
+        preset: str = 'default',
+) -> Iterator[list[str] | str]:
+    """
+    Preprocess a stream of texts, yielding results in input order.
+
+    Chunks of ``chunksize`` texts run on ``n_jobs`` worker processes (-1 or
+    None = all cores, 1 = in this process), each of which loads the NLTK
+    resources once. Only a few chunks per worker are held in memory, so the
+    input can be a generator over a file larger than RAM. ``preset`` names
+    the ``PreprocessingPipeline`` preset to apply.
+    """
+    get_pipeline(preset)  # Fail fast on an unknown preset
+    return imap_chunks(
+        partial(_preprocess_chunk, return_string=return_string, preset=preset),
+        texts,
+        n_jobs=BaseConfig.PREPROCESS_WORKERS if n_jobs is None else n_jobs,
+        chunksize=chunksize or BaseConfig.PREPROCESS_CHUNKSIZE,
+        initializer=partial(_init_preprocess_worker, preset),
+    )
+
+
+def preprocess_batch(
+        texts: Iterable[Any],
+        n_jobs: int | None = None,
+        chunksize: int | None = None,
+        return_string: bool = False,
+        preset: str = 'default',
+) -> list[list[str] | str]:
+    """
+    Preprocess many texts (a list, any iterable or a pandas Series) in
+    parallel; see ``iter_preprocess``. Returns one result per text, in order.
+    Inputs that fit in two chunks are processed in this process.
+    """
+    values = list(texts)
+    chunksize = chunksize or BaseConfig.PREPROCESS_CHUNKSIZE
+    if len(values) <= 2 * chunksize:
+        n_jobs = 1
+    return list(iter_preprocess(values, n_jobs, chunksize, return_string, preset))
 
 
 def convert_str_list_to_lower(input_text_list: list[str]) -> list[str]:
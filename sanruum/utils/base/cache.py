@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Iterator
+from collections.abc import MutableMapping
+from typing import Any
+from typing import NamedTuple
+from typing import TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+_MISSING = object()
+
+
+def approximate_size(key: Any, value: Any) -> int:
+    """Shallow size of a cache entry in bytes."""
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires: float  # time.monotonic() deadline, inf when the entry never expires
+    size: int
+
+
+class LRUCache(MutableMapping[K, V]):
+    """
+    Thread-safe LRU cache bounded by entry count and an optional byte budget,
+    with an optional per-entry TTL.
+
+    It is a drop-in ``MutableMapping`` for plain cache dicts and counts hits,
+    misses, evictions and expirations for ``stats``.
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 1024,
+            max_bytes: int | None = None,
+            ttl: float | None = None,
+            sizeof: Callable[[Any, Any], int] = approximate_size,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bytes = 0
+        self._entries: OrderedDict[K, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[K]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __delitem__(self, key: K) -> None:
+        with self._lock:
+            self._drop(key)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)  # type: ignore[arg-type]
+            return entry is not None and entry.expires > time.monotonic()
+
+    def _drop(self, key: K) -> None:
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """Return the cached value (refreshing its recency) or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if entry.expires <= time.monotonic():
+                self._drop(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def __getitem__(self, key: K) -> V:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value  # type: ignore[no-any-return]
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store ``value``; ``ttl`` overrides the cache-wide default."""
+        ttl = self.ttl if ttl is None else ttl
+        expires = time.monotonic() + ttl if ttl is not None else float('inf')
+        size = self.sizeof(key, value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                # Would evict everything else and still not fit.
+                self.evictions += 1
+                return
+            self._entries[key] = _Entry(value, expires, size)
+            self.bytes += size
+            while len(self._entries) > self.maxsize or (
+                    self.max_bytes is not None and self.bytes > self.max_bytes
+            ):
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.set(key, value)
+
+    def pop(self, key: K, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+            value = self._entries[key].value
+            self._drop(key)
+            return value
+
+    def clear(self) -> None:
+        """Drop every entry; the counters keep running."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def snapshot(self) -> dict[K, V]:
+        """Unexpired entries, least recently used first, without counting hits."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                key: entry.value for key, entry in self._entries.items()
+                if entry.expires > now
+            }
+
+    def purge_expired(self) -> int:
+        """Drop expired entries now instead of on their next lookup."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                key for key, entry in self._entries.items() if entry.expires <= now
+            ]
+            for key in expired:
+                self._drop(key)
+            self.expirations += len(expired)
+            return len(expired)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Size and hit/miss/eviction counters."""
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes or 0,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
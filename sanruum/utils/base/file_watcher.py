@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from sanruum.utils.base.logger import logger
+
+Signature = tuple[int, int] | None  # (mtime_ns, size), None while missing
+
+
+def file_signature(path: Path) -> Signature:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileWatcher:
+    """
+    Calls ``on_change(path)`` from a background thread whenever the file's
+    modification time or size changes.
+
+    Polling keeps it dependency-free and works on every platform and file
+    system; a callback that raises is logged and retried on the next change.
+    """
+
+    def __init__(
+            self,
+            path: str | os.PathLike[str],
+            on_change: Callable[[Path], None],
+            interval: float = 1.0,
+    ) -> None:
+        self.path = Path(path)
+        self.on_change = on_change
+        self.interval = interval
+        self._signature = file_signature(self.path)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def check(self) -> bool:
+        """Poll once; returns True when a change was seen."""
+        signature = file_signature(self.path)
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        if signature is not None:
+            try:
+                self.on_change(self.path)
+            except Exception as e:
+                logger.error(f'❌ Handling change of {self.path} failed: {e}')
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self) -> FileWatcher:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=f'watch-{self.path.name}', daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,139 @@
+# scripts\benchmark_cpu_inference.py
+from __future__ import annotations
+
+import argparse
+import io
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import torch
+
+from sanruum.ai_core.cpu_inference import configure_threads
+from sanruum.ai_core.cpu_inference import quantize_dynamic
+from sanruum.config import BaseConfig
+
+TEST_TEXT = BaseConfig.DATA_DIR / 'test_text.txt'
+
+
+def load_sentences(path: Path, limit: int) -> list[str]:
+    lines = [line.strip() for line in path.read_text(encoding='utf-8').splitlines()]
+    return [line for line in lines if len(line.split()) >= 3][:limit]
+
+
+def model_mb(module: Any) -> float:
+    """Serialised size of the module's weights in MiB."""
+    buffer = io.BytesIO()
+    torch.save(module.state_dict(), buffer)
+    return buffer.tell() / 2 ** 20
+
+
+def timed(fn: Callable[[Any], Any], items: list[Any]) -> tuple[list[Any], np.ndarray]:
+    """Results and per-item latencies in milliseconds."""
+    results, latencies = [], []
+    with torch.inference_mode():
+        for item in items:
+            start = time.perf_counter()
+            results.append(fn(item))
+            latencies.append((time.perf_counter() - start) * 1000)
+    return results, np.array(latencies)
+
+
+def report(name: str, variant: str, latency: np.ndarray, size_mb: float) -> None:
+    print(
+        f'{name:<10} | {variant:<5} | p50 {np.percentile(latency, 50):8.2f}ms '
+        f'| p95 {np.percentile(latency, 95):8.2f}ms | weights {size_mb:8.1f}MiB',
+    )
+
+
+def compare_embedder(sentences: list[str]) -> None:
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(BaseConfig.EMBEDDING_MODEL, device='cpu').eval()
+    baseline, base_latency = timed(model.encode, sentences)
+    quantized = quantize_dynamic(model)
+    fast, fast_latency = timed(quantized.encode, sentences)
+
+    report('embedder', 'fp32', base_latency, model_mb(model))
+    report('embedder', 'int8', fast_latency, model_mb(quantized))
+    a, b = np.stack(baseline), np.stack(fast)
+    cosine = np.sum(a * b, axis=1) / (
+        np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+    )
+    print(
+        f'embedder   | cosine(fp32, int8) mean {cosine.mean():.4f} '
+        f'min {cosine.min():.4f}',
+    )
+
+
+def compare_zero_shot(sentences: list[str]) -> None:
+    from transformers import pipeline
+
+    from sanruum.ai_core.processor import intent_labels
+
+    labels = intent_labels()
+    classifier: Any = pipeline(
+        'zero-shot-classification', model=BaseConfig.ZERO_SHOT_MODEL, device=-1,
+    )
+    baseline, base_latency = timed(
+        lambda text: classifier(text, candidate_labels=labels)['labels'][0], sentences,
+    )
+    base_mb = model_mb(classifier.model)
+    classifier.model = quantize_dynamic(classifier.model.eval())
+    fast, fast_latency = timed(
+        lambda text: classifier(text, candidate_labels=labels)['labels'][0], sentences,
+    )
+
+    report('zero-shot', 'fp32', base_latency, base_mb)
+    report('zero-shot', 'int8', fast_latency, model_mb(classifier.model))
+    agreement = np.mean([x == y for x, y in zip(baseline, fast)])
+    print(f'zero-shot  | top-label agreement {agreement:.3f}')
+
+
+def compare_whisper(audio: Path) -> None:
+    import whisper
+    from rapidfuzz import fuzz
+
+    model = whisper.load_model(BaseConfig.WHISPER_MODEL, device='cpu').eval()
+    base_mb = model_mb(model)
+    [baseline], base_latency = timed(
+        lambda _: model.transcribe(str(audio), fp16=False), [None],
+    )
+    quantized = quantize_dynamic(model)
+    [fast], fast_latency = timed(
+        lambda _: quantized.transcribe(str(audio), fp16=False), [None],
+    )
+
+    report('whisper', 'fp32', base_latency, base_mb)
+    report('whisper', 'int8', fast_latency, model_mb(quantized))
+    similarity = fuzz.ratio(baseline['text'], fast['text'])
+    print(f'whisper    | transcript similarity {similarity:.1f}%')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Compare fp32 and int8 CPU inference on data/test_text.txt.',
+    )
+    parser.add_argument('--text', type=Path, default=TEST_TEXT)
+    parser.add_argument('--limit', type=int, default=100)
+    parser.add_argument('--zero-shot-limit', type=int, default=20)
+    parser.add_argument('--threads', type=int, default=BaseConfig.TORCH_NUM_THREADS)
+    parser.add_argument(
+        '--audio', type=Path, default=None,
+        help='Audio file to compare Whisper on (no audio is bundled).',
+    )
+    args = parser.parse_args()
+
+    configure_threads(args.threads, BaseConfig.TORCH_INTEROP_THREADS)
+    print(f'torch threads: {torch.get_num_threads()}')
+    sentences = load_sentences(args.text, args.limit)
+    compare_embedder(sentences)
+    compare_zero_shot(sentences[:args.zero_shot_limit])
+    if args.audio is not None:
+        compare_whisper(args.audio)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# scripts\benchmark_intent_matcher.py
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any
+
+import numpy as np
+
+from sanruum.intent_system.intent_matcher import IntentMatcher
+
+
+def make_intents(n_patterns: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Synthetic intents with a Zipf-like vocabulary of short patterns."""
+    rng = np.random.default_rng(seed)
+    vocabulary = [f'word{i}' for i in range(max(50, n_patterns // 2))]
+    weights = 1.0 / np.arange(1, len(vocabulary) + 1)
+    weights /= weights.sum()
+    intents = []
+    for start in range(0, n_patterns, 10):
+        patterns = [
+            ' '.join(rng.choice(vocabulary, size=rng.integers(2, 6), p=weights))
+            for _ in range(min(10, n_patterns - start))
+        ]
+        intents.append({'name': f'intent{start}', 'patterns': patterns})
+    return intents
+
+
+def latencies(matcher: IntentMatcher, questions: list[str]) -> np.ndarray:
+    """Per-question lookup latency in milliseconds."""
+    result = []
+    for question in questions:
+        start = time.perf_counter()
+        matcher.match([question])
+        result.append((time.perf_counter() - start) * 1000)
+    return np.array(result)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Compare indexed and full-scan intent matching.',
+    )
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[100, 1_000, 10_000, 50_000],
+    )
+    parser.add_argument('--queries', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    for size in args.sizes:
+        intents = make_intents(size)
+        patterns = [p for intent in intents for p in intent['patterns']]
+        questions = [
+            patterns[i] + ' please'
+            for i in rng.choice(len(patterns), args.queries)
+        ]
+        for name, use_index in (('scan', False), ('index', True)):
+            matcher = IntentMatcher(intents, use_index=use_index)
+            timings = latencies(matcher, questions)
+            print(
+                f'{size:>7,} patterns | {name:<5} '
+                f'| p50 {np.percentile(timings, 50):8.3f}ms '
+                f'| p95 {np.percentile(timings, 95):8.3f}ms',
+            )
+
+
+if __name__ == '__main__':
+    main()
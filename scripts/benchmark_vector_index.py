@@ -0,0 +1,95 @@
+# scripts\benchmark_vector_index.py
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from sanruum.ai_core.vector_index import create_vector_index
+from sanruum.ai_core.vector_index import VectorIndex
+
+
+def make_dataset(size: int, dim: int, seed: int = 0) -> np.ndarray:
+    """Generate clustered float32 vectors that roughly mimic sentence embeddings."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(max(1, size // 500), dim)).astype(np.float32)
+    labels = rng.integers(0, centres.shape[0], size=size)
+    noise = rng.normal(scale=0.35, size=(size, dim)).astype(np.float32)
+    data: np.ndarray = centres[labels] + noise
+    return data
+
+
+def build(index: VectorIndex, data: np.ndarray, batch_size: int = 50_000) -> float:
+    """Insert ``data`` in batches and return the build time in seconds."""
+    start = time.perf_counter()
+    for offset in range(0, data.shape[0], batch_size):
+        batch = data[offset:offset + batch_size]
+        labels = [str(i) for i in range(offset, offset + batch.shape[0])]
+        index.add_many(['bench'] * batch.shape[0], labels, batch)
+    return time.perf_counter() - start
+
+
+def run_queries(
+        index: VectorIndex, queries: np.ndarray, k: int,
+) -> tuple[list[set[str]], np.ndarray]:
+    """Return the result sets and per-query latencies in milliseconds."""
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        matches = index.search(query, k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append({match.text for match in matches})
+    return results, np.array(latencies)
+
+
+def benchmark(
+        size: int, dim: int, k: int, n_queries: int, nlist: int, nprobe: int,
+) -> None:
+    data = make_dataset(size, dim)
+    rng = np.random.default_rng(1)
+    queries = data[rng.choice(size, n_queries, replace=False)]
+    queries = queries + rng.normal(scale=0.1, size=queries.shape).astype(np.float32)
+
+    exact = create_vector_index('exact', initial_capacity=size)
+    exact_build = build(exact, data)
+    truth, exact_latency = run_queries(exact, queries, k)
+    del exact
+
+    ivf = create_vector_index('ivf', nlist=nlist, nprobe=nprobe)
+    ivf_build = build(ivf, data)
+    found, ivf_latency = run_queries(ivf, queries, k)
+
+    recall = np.mean([len(t & f) / k for t, f in zip(truth, found)])
+    print(
+        f'{size:>9,} | exact  | build {exact_build:7.2f}s '
+        f'| p95 {np.percentile(exact_latency, 95):8.3f}ms | recall@{k} 1.000',
+    )
+    print(
+        f'{size:>9,} | ivf    | build {ivf_build:7.2f}s '
+        f'| p95 {np.percentile(ivf_latency, 95):8.3f}ms | recall@{k} {recall:.3f}',
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Compare exact and IVF-flat knowledge search.',
+    )
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+    )
+    parser.add_argument('--dim', type=int, default=384)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--nlist', type=int, default=None)
+    parser.add_argument('--nprobe', type=int, default=16)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        # sqrt(N) buckets is the usual starting point for IVF.
+        nlist = args.nlist or max(16, int(np.sqrt(size)))
+        benchmark(size, args.dim, args.k, args.queries, nlist, args.nprobe)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+# scripts\compile_intents.py
+from __future__ import annotations
+
+import argparse
+import time
+
+from sanruum.config import BaseConfig
+from sanruum.intent_system.intent_artifact import load_compiled_intents
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Compile intents.json into the artifact loaded at startup.',
+    )
+    parser.add_argument('--source', default=str(BaseConfig.INTENTS_FILE))
+    parser.add_argument('--artifact', default=str(BaseConfig.INTENTS_ARTIFACT_FILE))
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    compiled = load_compiled_intents(args.source, args.artifact)
+    print(
+        f'{len(compiled.intents)} intents, {len(compiled.matcher)} patterns '
+        f'-> {args.artifact} ({(time.perf_counter() - start) * 1000:.1f}ms)',
+    )
+
+
+if __name__ == '__main__':
+    main()
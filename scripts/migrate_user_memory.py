@@ -0,0 +1,29 @@
+# scripts\migrate_user_memory.py
+from __future__ import annotations
+
+import argparse
+
+from sanruum.ai_core.user_memory_store import migrate_pickles_to_sqlite
+from sanruum.config import BaseConfig
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Copy per-user pickle memories into the SQLite memory store.',
+    )
+    parser.add_argument('--directory', default=str(BaseConfig.USER_MEMORY_DIR))
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument(
+        '--remove-pickles', action='store_true',
+        help='Delete each pickle file once its user has been committed.',
+    )
+    args = parser.parse_args()
+
+    migrated = migrate_pickles_to_sqlite(
+        args.directory, batch_size=args.batch_size, remove_pickles=args.remove_pickles,
+    )
+    print(f'Migrated {migrated} users. Set USER_MEMORY_BACKEND = "sqlite" to use them.')
+
+
+if __name__ == '__main__':
+    main()
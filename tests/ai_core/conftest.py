@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def memory_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Fixture that keeps every AIMemory storage file in a temporary directory"""
+    for name, file_name in (
+            ('MEMORY_FILE', 'memory.json'),
+            ('MEMORY_JOURNAL_FILE', 'memory.journal'),
+            ('MEMORY_VECTORS_FILE', 'memory.vectors'),
+            ('MEMORY_INDEX_FILE', 'memory.index.npz'),
+    ):
+        monkeypatch.setattr(f'sanruum.ai_core.memory.{name}', tmp_path / file_name)
+    user_dir = tmp_path / 'user_memory'
+    user_dir.mkdir()
+    monkeypatch.setattr(
+        'sanruum.ai_core.persistent_memory.USER_MEMORY_DIR', str(user_dir),
+    )
+    return tmp_path
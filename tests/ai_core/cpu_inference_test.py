@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+import torch
+from torch.ao.nn.quantized.dynamic import Linear as QuantizedLinear
+
+from sanruum.ai_core import cpu_inference
+from sanruum.ai_core.cpu_inference import prepare_for_cpu
+from sanruum.ai_core.cpu_inference import quantizable_layers
+from sanruum.ai_core.cpu_inference import quantize_dynamic
+from sanruum.config.base import BaseConfig
+
+
+class Linear(torch.nn.Linear):
+    """Linear subclass that casts weights in forward, like Whisper's"""
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return torch.nn.functional.linear(x, self.weight.to(x.dtype), self.bias)
+
+
+def test_quantize_dynamic_swaps_linear_layers() -> None:
+    """Test if exact linear layers become int8 and subclasses are left alone"""
+    torch.manual_seed(0)
+    model = torch.nn.Sequential(torch.nn.Linear(8, 16), torch.nn.ReLU(), Linear(16, 4))
+    inputs = torch.randn(5, 8)
+    expected = model(inputs)
+
+    quantized = quantize_dynamic(model)
+
+    assert isinstance(quantized[0], QuantizedLinear)
+    assert type(quantized[2]) is Linear
+    assert torch.allclose(quantized(inputs), expected, atol=0.05)
+
+
+def test_prepare_for_cpu_is_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test if models are left untouched unless fast CPU mode is enabled"""
+    model = torch.nn.Sequential(torch.nn.Linear(4, 4))
+    monkeypatch.setattr(BaseConfig, 'FAST_CPU_INFERENCE', False)
+    assert prepare_for_cpu(model, 'tiny') is model
+
+    monkeypatch.setattr(cpu_inference, 'fast_cpu_enabled', lambda: True)
+    monkeypatch.setattr(BaseConfig, 'TORCH_NUM_THREADS', None)
+    prepared = prepare_for_cpu(model, 'tiny')
+    assert isinstance(prepared[0], QuantizedLinear)
+    assert prepared is model  # quantised in place, not copied
+
+
+def test_prepare_for_cpu_skips_models_without_linear_layers(
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test if a model with nothing to quantise is returned without a copy"""
+    model = torch.nn.Sequential(Linear(4, 4), torch.nn.ReLU())
+    monkeypatch.setattr(cpu_inference, 'fast_cpu_enabled', lambda: True)
+    monkeypatch.setattr(BaseConfig, 'TORCH_NUM_THREADS', None)
+    monkeypatch.setattr(cpu_inference, 'quantize_dynamic', pytest.fail)
+
+    assert quantizable_layers(model) == 0
+    assert prepare_for_cpu(model, 'whisper') is model
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from sanruum.ai_core.embedding_cache import EmbeddingCache
+
+
+@pytest.fixture
+def embedder() -> MagicMock:
+    """Fixture for an embedder that maps text length to a vector"""
+    embedder = MagicMock()
+    embedder.encode.side_effect = lambda text: (
+        np.array([[len(t), 1.0] for t in text])
+        if isinstance(text, list) else np.array([len(text), 1.0])
+    )
+    return embedder
+
+
+def test_encode_hits_normalised_text(embedder: MagicMock) -> None:
+    """Test if texts differing in case and whitespace are encoded once"""
+    cache = EmbeddingCache(embedder)
+    first = cache.encode('Hello  world')
+    second = cache.encode(' hello world ')
+
+    assert embedder.encode.call_count == 1
+    np.testing.assert_array_equal(first, second)
+    assert second.dtype == np.float32
+    assert not second.flags.writeable
+    assert cache.stats()['hits'] == 1
+    assert cache.hit_rate == 0.5
+
+
+def test_encode_many_batches_misses(embedder: MagicMock) -> None:
+    """Test if only unseen texts are encoded, in a single batch"""
+    cache = EmbeddingCache(embedder)
+    cache.encode('a')
+    vectors = cache.encode_many(['a', 'bb', 'ccc', 'bb'])
+
+    assert vectors.shape == (4, 2)
+    assert vectors[:, 0].tolist() == [1.0, 2.0, 3.0, 2.0]
+    embedder.encode.assert_called_with(['bb', 'ccc'])
+    assert embedder.encode.call_count == 2
+
+
+def test_lru_eviction(embedder: MagicMock) -> None:
+    """Test if the least recently used entry is evicted first"""
+    cache = EmbeddingCache(embedder, maxsize=2)
+    cache.encode('a')
+    cache.encode('bb')
+    cache.encode('a')
+    cache.encode('ccc')
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    cache.encode('a')
+    assert cache.hits == 2
+    cache.encode('bb')
+    assert embedder.encode.call_count == 4
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from sanruum.ai_core.embedding_service import EmbeddingService
+
+
+def test_encode_matches_model_shapes() -> None:
+    """Test if single sentences and lists come back in the model's shapes"""
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **kwargs: np.array(
+        [[len(text), 0.0] for text in texts],
+    )
+    service = EmbeddingService(model, max_wait_ms=1)
+
+    vector = service.encode('abc')
+    matrix = service.encode(['a', 'bb'])
+    service.close()
+
+    assert vector.tolist() == [3.0, 0.0]
+    assert matrix[:, 0].tolist() == [1.0, 2.0]
+    assert service.stats()['batch_size']['count'] >= 2
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import gc
+import os
+import weakref
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sanruum.ai_core.embedding_store import EmbeddingStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> EmbeddingStore:
+    """Fixture for an EmbeddingStore holding three vectors"""
+    store = EmbeddingStore(tmp_path / 'memory.vectors')
+    store.add_many(np.arange(12, dtype=np.float32).reshape(3, 4))
+    return store
+
+
+def test_add_and_get(store: EmbeddingStore) -> None:
+    """Test if vectors are returned by id"""
+    assert len(store) == 3
+    assert store.add([1.0, 1.0, 1.0, 1.0]) == 3
+    np.testing.assert_array_equal(store.get(1), [4.0, 5.0, 6.0, 7.0])
+    assert store.get(42) is None
+
+
+def test_get_many_reports_missing(store: EmbeddingStore) -> None:
+    """Test if unknown ids are flagged in the found mask"""
+    vectors, found = store.get_many([2, 7, 0])
+    assert found.tolist() == [True, False, True]
+    np.testing.assert_array_equal(vectors[0], [8.0, 9.0, 10.0, 11.0])
+
+
+def test_reopen_memory_maps_existing_file(store: EmbeddingStore) -> None:
+    """Test if a reopened store sees earlier vectors and continues the ids"""
+    store.close()
+    reopened = EmbeddingStore(store.path)
+    assert len(reopened) == 3
+    assert reopened.dim == 4
+    np.testing.assert_array_equal(reopened.get(0), [0.0, 1.0, 2.0, 3.0])
+    assert reopened.add([0.0, 0.0, 0.0, 1.0]) == 3
+
+
+def test_torn_tail_is_ignored(store: EmbeddingStore) -> None:
+    """Test if a partially written record is dropped on reopen"""
+    store.close()
+    with open(store.path, 'ab') as f:
+        f.write(b'\x01\x02\x03')
+    reopened = EmbeddingStore(store.path)
+    assert len(reopened) == 3
+    assert reopened.add([1.0, 2.0, 3.0, 4.0]) == 3
+    np.testing.assert_array_equal(reopened.get(3), [1.0, 2.0, 3.0, 4.0])
+
+
+def test_compact_keeps_live_and_new_ids(store: EmbeddingStore) -> None:
+    """Test if compaction drops only unreferenced vectors"""
+    store.add([1.0, 1.0, 1.0, 1.0])
+    assert store.compact({0}, keep_from=3) == 2
+    assert len(store) == 2
+    assert store.get(1) is None
+    np.testing.assert_array_equal(store.get(3), [1.0, 1.0, 1.0, 1.0])
+    assert store.add([2.0, 2.0, 2.0, 2.0]) == 4
+
+
+def test_compact_releases_file_before_replace(
+        store: EmbeddingStore, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test if the old file is unmapped and closed when it gets replaced"""
+    view = weakref.ref(store._records())  # maps the file
+    replace = os.replace
+
+    def checked_replace(src: Path, dst: Path) -> None:
+        gc.collect()
+        assert view() is None and store._file is None
+        replace(src, dst)
+
+    monkeypatch.setattr('sanruum.ai_core.embedding_store.os.replace', checked_replace)
+    assert store.compact([1]) == 2
+    np.testing.assert_array_equal(store.get(1), [4.0, 5.0, 6.0, 7.0])
+
+
+def test_float16_storage(tmp_path: Path) -> None:
+    """Test if half precision stores are readable after reopening"""
+    store = EmbeddingStore(tmp_path / 'half.vectors', dtype='float16')
+    store.add([0.5, 0.25])
+    store.close()
+    reopened = EmbeddingStore(tmp_path / 'half.vectors')
+    assert reopened.dtype == np.float16
+    np.testing.assert_array_equal(reopened.get(0), [0.5, 0.25])
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Generous enough for a slow CI machine; loading any model blows far past both.
+IMPORT_TIME_BUDGET_SECONDS = 3.0
+IMPORT_RSS_BUDGET_MB = 300
+HEAVY_MODULES = (
+    'torch', 'transformers', 'sentence_transformers', 'whisper', 'nltk',
+    'vaderSentiment', 'spacy',
+)
+
+PROBE = """
+import json, sys, time
+import psutil
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'seconds': elapsed,
+    'rss_mb': psutil.Process().memory_info().rss / 2 ** 20,
+    'heavy': [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+@pytest.mark.parametrize('module', ['sanruum', 'sanruum.ai_core.response'])
+def test_import_budget(module: str) -> None:
+    """Test if importing the package stays cheap and loads no models"""
+    root = Path(__file__).resolve().parents[2]
+    env = {**os.environ, 'PYTHONPATH': str(root), 'HF_HUB_OFFLINE': '1'}
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True, text=True, env=env, cwd=root, timeout=120, check=True,
+    )
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert probe['heavy'] == []
+    assert probe['seconds'] < IMPORT_TIME_BUDGET_SECONDS
+    assert probe['rss_mb'] < IMPORT_RSS_BUDGET_MB
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from sanruum.ai_core.intent_classifier import CentroidIntentClassifier
+from sanruum.ai_core.intent_classifier import IntentClassifier
+
+VOCABULARY = ['hello', 'hi', 'bye', 'goodbye', 'time', 'clock']
+
+
+class BagOfWords:
+    """Encoder that counts vocabulary words"""
+
+    def encode(self, text: str) -> np.ndarray:
+        words = text.lower().split()
+        return np.array(
+            [words.count(word) for word in VOCABULARY] + [0.1], dtype=np.float32,
+        )
+
+    def encode_many(self, texts: list[str]) -> np.ndarray:
+        return np.stack([self.encode(text) for text in texts])
+
+
+@pytest.fixture
+def intents() -> list[dict[str, Any]]:
+    """Fixture for intents with patterns"""
+    return [
+        {'name': 'greeting', 'patterns': ['hello', 'hi there']},
+        {'name': 'farewell', 'patterns': ['bye', 'goodbye']},
+        {'name': 'time', 'patterns': ['what time is it', 'clock']},
+        {'name': 'no_patterns'},
+    ]
+
+
+def test_centroid_prediction(intents: list[dict[str, Any]]) -> None:
+    """Test if the nearest centroid ranks first"""
+    fast = CentroidIntentClassifier(BagOfWords()).fit(intents)
+    prediction = fast.predict('goodbye then')
+
+    assert fast.labels == ['greeting', 'farewell', 'time']
+    assert prediction.labels[0] == 'farewell'
+    assert prediction.confidence > 0.6
+    assert prediction.scores == sorted(prediction.scores, reverse=True)
+
+
+def test_confident_prediction_skips_zero_shot(intents: list[dict[str, Any]]) -> None:
+    """Test if the zero-shot model only runs below the threshold"""
+    zero_shot = MagicMock(return_value=['time', 'greeting', 'farewell'])
+    classifier = IntentClassifier(
+        CentroidIntentClassifier(BagOfWords()).fit(intents), zero_shot, threshold=0.6,
+    )
+
+    assert classifier.classify('hello') == ['greeting']
+    zero_shot.assert_not_called()
+
+    assert classifier.classify('something unknown') == ['time']
+    zero_shot.assert_called_once_with('something unknown', classifier.fast.labels)
+
+    stats = classifier.stats()
+    assert stats['fast_answers'] == 1
+    assert stats['fallbacks'] == 1
+    assert stats['compared'] == 1
+    assert stats['fast_latency_ms']['count'] == 2
+    assert stats['zero_shot_latency_ms']['count'] == 1
+
+
+def test_shadow_sampling_measures_agreement(intents: list[dict[str, Any]]) -> None:
+    """Test if shadowed confident answers count toward agreement"""
+    zero_shot = MagicMock(return_value=['farewell', 'greeting', 'time'])
+    classifier = IntentClassifier(
+        CentroidIntentClassifier(BagOfWords()).fit(intents),
+        zero_shot, threshold=0.6, shadow_rate=1.0,
+    )
+
+    assert classifier.classify('bye') == ['farewell']
+    assert classifier.classify('hello') == ['greeting']
+    assert classifier.compared == 2
+    assert classifier.agreement_rate == 0.5
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from sanruum.ai_core.memory_journal import MemoryJournal
+
+
+@pytest.fixture
+def journal(tmp_path: Path) -> MemoryJournal:
+    """Fixture for a MemoryJournal in a temporary directory"""
+    return MemoryJournal(tmp_path / 'memory.journal')
+
+
+def test_append_and_replay(journal: MemoryJournal) -> None:
+    """Test if appended records are replayed in order"""
+    journal.append({'op': 'message', 'seq': 1})
+    journal.append({'op': 'knowledge', 'seq': 2})
+    assert journal.records_written == 2
+    assert [record['seq'] for record in journal.records()] == [1, 2]
+
+
+def test_torn_tail_is_skipped(journal: MemoryJournal) -> None:
+    """Test if a partially written last line does not break recovery"""
+    journal.append({'op': 'message', 'seq': 1})
+    journal.close()
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"op": "knowl')
+    assert [record['seq'] for record in journal.records()] == [1]
+
+
+def test_rotate_keeps_records_until_discarded(journal: MemoryJournal) -> None:
+    """Test if rotated records are replayed until a snapshot discards them"""
+    journal.append({'op': 'message', 'seq': 1})
+    journal.rotate()
+    journal.append({'op': 'message', 'seq': 2})
+    assert journal.records_written == 1
+    assert [record['seq'] for record in journal.records()] == [1, 2]
+
+    journal.discard_rotated()
+    assert [record['seq'] for record in journal.records()] == [2]
+
+
+def test_unfinished_rotation_is_merged(journal: MemoryJournal) -> None:
+    """Test if rotating twice without discarding loses nothing"""
+    journal.append({'op': 'message', 'seq': 1})
+    journal.rotate()
+    journal.append({'op': 'message', 'seq': 2})
+    journal.rotate()
+    assert not journal.path.exists()
+    assert [record['seq'] for record in journal.records()] == [1, 2]
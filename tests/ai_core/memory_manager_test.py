@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pickle
+import threading
+from pathlib import Path
+
+import pytest
+
+from sanruum.ai_core.memory_manager import MemoryManager
+from sanruum.ai_core.persistent_memory import PersistentAIMemory
+
+
+@pytest.fixture
+def user_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Fixture that keeps user memory files in a temporary directory"""
+    monkeypatch.setattr(
+        'sanruum.ai_core.persistent_memory.USER_MEMORY_DIR', str(tmp_path),
+    )
+    return tmp_path
+
+
+def load_history(user_dir: Path, user_id: str) -> list[dict[str, str]]:
+    with open(user_dir / f'memory_{user_id}.pkl', 'rb') as file:
+        memory, _ = pickle.load(file)
+    history: list[dict[str, str]] = memory['history']
+    return history
+
+
+def test_hot_user_is_shared(user_dir: Path) -> None:
+    """Test if repeated lookups return the resident memory object"""
+    manager = MemoryManager(flush_interval=None)
+    assert manager.get('alice') is manager.get('alice')
+    assert manager.stats()['loads'] == 1
+    manager.close()
+
+
+def test_write_back_is_deferred_until_flush(user_dir: Path) -> None:
+    """Test if changes only reach disk when flushed"""
+    manager = MemoryManager(flush_interval=None)
+    memory = manager.get('alice')
+    memory.store_message('user', 'Hello!')
+
+    assert memory.dirty
+    assert not (user_dir / 'memory_alice.pkl').exists()
+    assert manager.flush() == 1
+    assert not memory.dirty
+    assert load_history(user_dir, 'alice')[-1]['message'] == 'Hello!'
+    manager.close()
+
+
+def test_eviction_flushes_least_recently_used(user_dir: Path) -> None:
+    """Test if the coldest user is written back and dropped past the limit"""
+    manager = MemoryManager(max_users=2, ram_budget_bytes=None, flush_interval=None)
+    alice = manager.get('alice')
+    alice.store_message('user', 'Remember me')
+    alice.vectors.get(alice.vectors.add([1.0, 0.0]))
+    manager.get('bob')
+    manager.get('alice')
+    manager.get('carol')
+
+    assert 'bob' not in manager
+    assert 'alice' in manager and 'carol' in manager
+    manager.get('dave')
+    assert 'alice' not in manager
+    assert load_history(user_dir, 'alice')[-1]['message'] == 'Remember me'
+    assert alice.write_through
+    assert alice.vectors._file is None and alice.vectors._view is None
+    assert manager.stats()['evictions'] == 2
+    manager.close()
+
+
+def test_ram_budget(user_dir: Path) -> None:
+    """Test if a tiny byte budget keeps only the newest user resident"""
+    manager = MemoryManager(ram_budget_bytes=1, flush_interval=None)
+    manager.get('alice').store_message('user', 'x' * 100)
+    manager.flush()
+    manager.get('bob')
+
+    assert len(manager) == 1 and 'bob' in manager
+    assert load_history(user_dir, 'alice')[-1]['message'] == 'x' * 100
+    manager.close()
+
+
+def test_reload_waits_for_eviction_write_back(
+        user_dir: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test if a user evicted mid-write is reloaded only after the write lands"""
+    manager = MemoryManager(max_users=1, ram_budget_bytes=None, flush_interval=None)
+    alice = manager.get('alice')
+    alice.store_message('user', 'Remember me')
+    writing, release = threading.Event(), threading.Event()
+    flush = alice.flush
+
+    def slow_flush() -> bool:
+        writing.set()
+        release.wait(5)
+        return flush()
+
+    monkeypatch.setattr(alice, 'flush', slow_flush)
+    evicting = threading.Thread(target=manager.get, args=('bob',))
+    evicting.start()
+    assert writing.wait(5)
+
+    reloaded: list[PersistentAIMemory] = []
+    reloading = threading.Thread(target=lambda: reloaded.append(manager.get('alice')))
+    reloading.start()
+    reloading.join(0.2)
+    assert reloading.is_alive()
+
+    release.set()
+    evicting.join(5)
+    reloading.join(5)
+    assert reloaded[0] is not alice
+    assert reloaded[0].get_last_message() == 'Remember me'
+    manager.close()
@@ -2,13 +2,18 @@
 from __future__ import annotations
 
 import json
+from pathlib import Path
 from unittest import mock
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from sanruum.ai_core.memory import AIMemory
 
+# Every test gets its own memory files instead of the developer's data/memory.
+pytestmark = pytest.mark.usefixtures('memory_files')
+
 
 @pytest.fixture
 def memory() -> AIMemory:
@@ -16,8 +21,8 @@ def memory() -> AIMemory:
 
 
 # Test storing a message
-@mock.patch('sanruum.ai_core.memory.AIMemory.save_memory')
-def test_store_message(mock_save_memory: MagicMock) -> None:
+@mock.patch('sanruum.ai_core.memory.AIMemory.append_to_journal')
+def test_store_message(mock_append_to_journal: MagicMock) -> None:
     memory = AIMemory()
     memory.memory['history'] = []  # Ensure fresh memory state
 
@@ -28,7 +33,7 @@ def test_store_message(mock_save_memory: MagicMock) -> None:
 
     assert len(memory.memory['history']) == 1
     assert memory.memory['history'][0]['message'] == message
-    mock_save_memory.assert_called_once()
+    mock_append_to_journal.assert_called_once()
 
 
 # Test loading memory with a valid filea
@@ -54,30 +59,24 @@ def test_load_memory_corrupted(
         mock_logger_error: MagicMock,
         mock_json_load: MagicMock,
         mock_open_file: MagicMock,
+        memory_files: Path,
 ) -> None:
+    (memory_files / 'memory.json').touch()
     memory = AIMemory()
     mock_logger_error.assert_any_call(mock.ANY)  # Ensure an error was logged
     assert memory.memory == {'history': []}
 
 
 # Test finding relevant knowledge
-@mock.patch(
-    'sanruum.ai_core.memory.AIMemory.get_all_knowledge',
-    return_value={'topic1': ['info1', 'info2']},
-)
-def test_find_relevant_knowledge(mock_get_all_knowledge: MagicMock) -> None:
+@mock.patch('sanruum.ai_core.memory.AIMemory.append_to_journal')
+def test_find_relevant_knowledge(mock_append_to_journal: MagicMock) -> None:
     memory = AIMemory()
-    query = 'info1'
+    memory.reset_memory()
+    memory.store_knowledge('topic1', 'info1')
+    memory.store_knowledge('topic1', 'info2')
 
-    # Debug: Manually check if data retrieval works
     knowledge_data = memory.get_all_knowledge()
-    print('Knowledge from AIMemory:', knowledge_data)
-
-    # Check if the function retrieves relevant data
-    result = memory.find_relevant_knowledge(query)
-
-    print('Query:', query)
-    print('Function output:', result)
+    result = memory.find_relevant_knowledge('info1')
 
     assert result is not None, 'find_relevant_knowledge returned None'
     assert result in knowledge_data[
@@ -85,6 +84,31 @@ def test_find_relevant_knowledge(mock_get_all_knowledge: MagicMock) -> None:
     ], f'Expected info from topic1, but got {result}'
 
 
+# Test the scored top-k variant against a deterministic embedder
+@mock.patch('sanruum.ai_core.memory.AIMemory.append_to_journal')
+def test_find_relevant_knowledge_top_k(mock_append_to_journal: MagicMock) -> None:
+    vectors = {
+        'sleep': [1.0, 0.0, 0.0],
+        'sleep well': [0.9, 0.1, 0.0],
+        'nap': [0.7, 0.7, 0.0],
+        'insulin': [0.0, 0.0, 1.0],
+    }
+    memory = AIMemory()
+    memory.embedder = MagicMock()
+    memory.embedder.encode.side_effect = lambda text: np.array(vectors[text])
+    memory.reset_memory()
+    for text in ('sleep well', 'nap', 'insulin'):
+        memory.store_knowledge('health', text)
+
+    matches = memory.find_relevant_knowledge('sleep', k=3)
+
+    assert [match.text for match in matches] == ['sleep well', 'nap']
+    assert matches[0].topic == 'health'
+    assert matches[0].score > matches[1].score
+    assert memory.find_relevant_knowledge('sleep') == 'sleep well'
+    assert memory.find_relevant_knowledge('sleep', k=0) == []
+
+
 # Test getting the last message
 def test_get_last_message() -> None:
     memory = AIMemory()
@@ -95,6 +119,7 @@ def test_get_last_message() -> None:
 # Test storing and retrieving knowledge
 def test_store_and_retrieve_knowledge() -> None:
     memory = AIMemory()
+    memory.reset_memory()
     memory.store_knowledge('topic1', 'data1')
     assert memory.retrieve_knowledge('topic1') == ['data1']
 
@@ -102,6 +127,7 @@ def test_store_and_retrieve_knowledge() -> None:
 # Test retrieving non-existent knowledge
 def test_retrieve_non_existent_knowledge() -> None:
     memory = AIMemory()
+    memory.reset_memory()
     assert memory.retrieve_knowledge('unknown') is None
 
 
@@ -131,3 +157,197 @@ def test_set_and_get_last_intent() -> None:
     memory = AIMemory()
     memory.set_last_intent('greeting')
     assert memory.get_last_intent() == 'greeting'
+
+
+# Test that deleting knowledge removes it from memory and the index
+@mock.patch('sanruum.ai_core.memory.AIMemory.append_to_journal')
+def test_forget_knowledge(mock_append_to_journal: MagicMock) -> None:
+    memory = AIMemory()
+    memory.embedder = MagicMock()
+    memory.embedder.encode.side_effect = lambda text: np.array(
+        [1.0, 0.0] if text.startswith('a') else [0.0, 1.0],
+    )
+    memory.reset_memory()
+    memory.store_knowledge('topic1', 'apple')
+    memory.store_knowledge('topic1', 'banana')
+
+    assert memory.forget_knowledge('topic1', 'apple') == 1
+    assert memory.retrieve_knowledge('topic1') == ['banana']
+    assert memory.find_relevant_knowledge('apricot') is None
+    assert memory.forget_knowledge('topic1') == 1
+    assert memory.retrieve_knowledge('topic1') is None
+
+
+# Test that journaled changes survive a restart and fold into the snapshot
+def test_journal_recovery_and_compaction(memory_files: Path) -> None:
+    memory = AIMemory()
+    memory.store_message('user', 'Hello, AI!')
+    memory.store_knowledge('Topic1', 'data1')
+    memory.store_knowledge('topic1', 'data2')
+    memory.forget_knowledge('topic1', 'data1')
+    memory.journal.close()
+
+    assert not (memory_files / 'memory.json').exists()
+    recovered = AIMemory()
+    assert recovered.get_last_message() == 'Hello, AI!'
+    assert recovered.retrieve_knowledge('topic1') == ['data2']
+
+    recovered.save_memory()
+    assert (memory_files / 'memory.json').exists()
+    assert not (memory_files / 'memory.journal').exists()
+    recovered.store_knowledge('topic2', 'data3')
+    recovered.journal.close()
+
+    reloaded = AIMemory()
+    assert reloaded.retrieve_knowledge('topic1') == ['data2']
+    assert reloaded.retrieve_knowledge('topic2') == ['data3']
+    assert len(reloaded.memory['history']) == 1
+
+
+# Test that embeddings live in the binary store rather than the memory dict
+def test_vectors_stored_out_of_line(memory_files: Path) -> None:
+    (memory_files / 'memory.json').write_text(
+        json.dumps({'topic1': [{'data': 'legacy', 'vector': [0.0, 1.0]}]}),
+    )
+    memory = AIMemory(memory_limit=1)
+    memory.embedder = MagicMock()
+    memory.embedder.encode.side_effect = lambda text: np.array([1.0, 0.0])
+
+    (legacy,) = memory.memory['topic1']
+    assert 'vector' not in legacy
+    np.testing.assert_array_equal(memory.vectors.get(legacy['vector_id']), [0.0, 1.0])
+
+    memory.store_knowledge('topic1', 'fresh')
+    for turn in range(10):
+        memory.store_message('user', f'message {turn}')
+    memory.save_memory()
+
+    snapshot = json.loads((memory_files / 'memory.json').read_text())
+    assert all('vector' not in item for item in snapshot['topic1'])
+    # Vectors of trimmed history messages are dropped at compaction.
+    assert len(memory.vectors) == len(memory.live_vector_ids()) == 3
+
+
+# Test that migrated inline vectors are not added to the store again on restart
+def test_vector_migration_is_saved(memory_files: Path) -> None:
+    (memory_files / 'memory.json').write_text(
+        json.dumps({'topic1': [{'data': 'legacy', 'vector': [0.0, 1.0]}]}),
+    )
+    memory = AIMemory()
+    memory.journal.close()
+    migrated = len(memory.vectors)
+
+    memory = AIMemory()
+    memory.journal.close()
+    assert len(memory.vectors) == migrated == 1
+    snapshot = json.loads((memory_files / 'memory.json').read_text())
+    (legacy,) = snapshot['topic1']
+    assert 'vector' not in legacy and legacy['vector_id'] == 0
+
+
+# Test that the same text is only encoded once across store and lookup
+@mock.patch('sanruum.ai_core.memory.AIMemory.append_to_journal')
+def test_embeddings_cached_between_calls(mock_append_to_journal: MagicMock) -> None:
+    memory = AIMemory()
+    memory.embedder = MagicMock()
+    memory.embedder.encode.side_effect = lambda text: np.array([1.0, 0.0])
+    memory.reset_memory()
+
+    memory.store_message('user', 'What is the price?')
+    memory.store_knowledge('pricing', 'It depends on the package.')
+    memory.find_relevant_knowledge('What is the price?')
+    memory.find_relevant_knowledge('what is the  price?')
+
+    assert memory.embedder.encode.call_count == 2
+    assert memory.embeddings is not None
+    assert memory.embeddings.hits == 2
+
+
+# Test that near-duplicate knowledge is rejected within a topic
+@mock.patch('sanruum.ai_core.memory.AIMemory.append_to_journal')
+def test_duplicate_knowledge_rejected(mock_append_to_journal: MagicMock) -> None:
+    vectors = {
+        'Opening hours are 9-5.': [1.0, 0.0],
+        'We are open 9-5.': [0.99, 0.01],
+        'Call us any time.': [0.0, 1.0],
+    }
+    memory = AIMemory()
+    memory.embedder = MagicMock()
+    memory.embedder.encode.side_effect = lambda text: np.array(vectors[text])
+    memory.reset_memory()
+
+    assert memory.store_knowledge('hours', 'Opening hours are 9-5.')
+    assert not memory.store_knowledge('hours', 'Opening hours are 9-5.')
+    assert not memory.store_knowledge('hours', 'We are open 9-5.')
+    assert memory.store_knowledge('hours', 'Call us any time.')
+    assert memory.store_knowledge('schedule', 'We are open 9-5.')
+    assert len(memory.retrieve_knowledge('hours') or []) == 2
+
+
+# Test that the least recently hit knowledge is evicted past the limits
+@mock.patch('sanruum.ai_core.memory.AIMemory.append_to_journal')
+def test_knowledge_eviction(mock_append_to_journal: MagicMock) -> None:
+    memory = AIMemory()
+    memory.embedder = MagicMock()
+    memory.embedder.encode.side_effect = lambda text: np.array(
+        [1.0, float(text[-1])],
+    )
+    memory.reset_memory()
+    memory.dedup_threshold = None
+    memory.max_items_per_topic = 3
+    memory.max_knowledge_items = 4
+
+    for i in range(3):
+        memory.store_knowledge('a', f'a{i}')
+    memory.record_knowledge_hits(
+        [match for match in memory.knowledge_index.search([1.0, 0.0], 3)
+         if match.text == 'a0'],
+    )
+    memory.store_knowledge('a', 'a3')
+    assert memory.retrieve_knowledge('a') == ['a0', 'a3']
+
+    for i in range(3):
+        memory.store_knowledge('b', f'b{i}')
+    assert memory.retrieve_knowledge('a') is None
+    assert memory.retrieve_knowledge('b') == ['b0', 'b1', 'b2']
+    assert len(memory.knowledge_index) == 3
+
+    memory.knowledge_ttl = 3600.0
+    memory.memory['b'][0]['created'] = 0.0
+    assert memory.evict_knowledge() == 1
+    assert memory.retrieve_knowledge('b') == ['b1', 'b2']
+
+
+# Test that knowledge saved before timestamps existed is not expired on load
+def test_unstamped_knowledge_survives_ttl(memory_files: Path) -> None:
+    (memory_files / 'memory.json').write_text(
+        json.dumps({'topic1': [{'data': 'legacy'}, 'plain legacy']}),
+    )
+    memory = AIMemory()
+    memory.knowledge_ttl = 3600.0
+
+    assert all(item['created'] > 0 for item in memory.memory['topic1'])
+    assert memory.evict_knowledge() == 0
+    assert memory.retrieve_knowledge('topic1') == ['legacy', 'plain legacy']
+
+
+# Test that changes made while a snapshot is written do not leak into it
+def test_snapshot_is_isolated_from_changes(
+        memory_files: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    memory = AIMemory()
+    memory.store_knowledge('topic1', 'data1')
+    dump = json.dump
+
+    def dump_while_hit(obj: object, file: object) -> None:
+        memory.memory['topic1'][0]['last_hit'] = 123.0
+        memory.memory['topic1'].append({'data': 'data2'})
+        dump(obj, file)
+
+    monkeypatch.setattr('sanruum.ai_core.memory.json.dump', dump_while_hit)
+    memory.save_memory()
+    memory.journal.close()
+
+    snapshot = json.loads((memory_files / 'memory.json').read_text())
+    assert [item['data'] for item in snapshot['topic1']] == ['data1']
+    assert 'last_hit' not in snapshot['topic1'][0]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from sanruum.ai_core.micro_batcher import MicroBatcher
+
+
+def test_concurrent_requests_share_a_batch() -> None:
+    """Test if requests arriving within the window run as one batch"""
+    batches: list[list[int]] = []
+
+    def double(items: list[int]) -> list[int]:
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    batcher: MicroBatcher[int, int] = MicroBatcher(
+        double, max_batch_size=8, max_wait_ms=200,
+    )
+    results: dict[int, int] = {}
+    threads = [
+        threading.Thread(target=lambda i=i: results.update({i: batcher(i)}))
+        for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    assert results == {0: 0, 1: 2, 2: 4, 3: 6}
+    assert sum(len(batch) for batch in batches) == 4
+    assert len(batches) < 4
+    stats = batcher.stats()
+    assert stats['batch_size']['count'] == len(batches)
+    assert stats['queue_wait_ms']['count'] == 4
+
+
+def test_max_batch_size() -> None:
+    """Test if batches never exceed the configured size"""
+    batches: list[list[str]] = []
+
+    def echo(items: list[str]) -> list[str]:
+        batches.append(items)
+        return items
+
+    batcher: MicroBatcher[str, str] = MicroBatcher(echo, max_batch_size=3)
+    assert batcher.map(list('abcdefg')) == list('abcdefg')
+    batcher.close()
+    assert max(len(batch) for batch in batches) <= 3
+
+
+def test_batch_failure_reaches_every_caller() -> None:
+    """Test if an exception in the batch is raised for each request"""
+    def fail(items: list[int]) -> list[int]:
+        raise RuntimeError('model unavailable')
+
+    batcher: MicroBatcher[int, int] = MicroBatcher(fail)
+    futures = [batcher.submit(i) for i in range(3)]
+    for future in futures:
+        with pytest.raises(RuntimeError, match='model unavailable'):
+            future.result(timeout=5)
+    batcher.close()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from sanruum.ai_core.model_registry import ModelRegistry
+
+
+@pytest.fixture
+def registry() -> ModelRegistry:
+    """Fixture for a registry with one cheap model"""
+    registry = ModelRegistry()
+    registry.register('tiny', MagicMock(side_effect=lambda: object()))
+    return registry
+
+
+def test_model_loaded_once_and_shared(registry: ModelRegistry) -> None:
+    """Test if concurrent callers get the same lazily loaded instance"""
+    assert not registry.is_loaded('tiny')
+    results: list[object] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get('tiny')))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(model) for model in results}) == 1
+    assert registry.stats()['tiny']['uses'] == 8
+    assert registry.stats()['tiny']['load_seconds'] >= 0
+
+
+def test_warm_up_skips_failures(registry: ModelRegistry) -> None:
+    """Test if warm-up loads registered models and survives broken loaders"""
+    registry.register('broken', MagicMock(side_effect=OSError('no weights')))
+    stats = registry.warm_up()
+
+    assert set(stats) == {'tiny'}
+    assert registry.is_loaded('tiny')
+    assert not registry.is_loaded('broken')
+
+
+def test_unknown_model(registry: ModelRegistry) -> None:
+    """Test if asking for an unregistered model raises KeyError"""
+    with pytest.raises(KeyError):
+        registry.get('missing')
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import json
 import os
 import pickle
+from pathlib import Path
+from unittest import mock
 
 import pytest
 
 from sanruum.ai_core.persistent_memory import PersistentAIMemory
 
+pytestmark = pytest.mark.usefixtures('memory_files')
+
 
 @pytest.fixture
 def memory() -> PersistentAIMemory:  # Annotated return type for the fixture
@@ -49,3 +54,19 @@ def test_reset_memory(memory: PersistentAIMemory) -> None:
     memory.reset_memory()
     assert memory.memory['history'] == []
     assert not os.path.exists(memory.memory_file)
+
+
+def test_new_user_starts_empty(memory_files: Path) -> None:
+    """Test if a new user does not inherit the shared memory"""
+    (memory_files / 'memory.json').write_text(
+        json.dumps({'history': [{'role': 'user', 'message': 'shared'}],
+                    'topic1': [{'data': 'shared knowledge', 'vector_id': 0}]}),
+    )
+
+    with mock.patch('sanruum.ai_core.memory.AIMemory.load_memory') as load_memory:
+        user = PersistentAIMemory('new_user')
+
+    load_memory.assert_not_called()
+    assert user.memory == {'history': []}
+    assert user.get_all_knowledge() == {}
+    assert len(user.vectors) == 0
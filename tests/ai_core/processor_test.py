@@ -3,8 +3,11 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
+from sanruum.ai_core import ai_config
+from sanruum.ai_core import processor as processor_module
 from sanruum.ai_core.memory import AIMemory
 from sanruum.ai_core.processor import AIProcessor
 
@@ -111,6 +114,39 @@ def test_process_input_sentiment_negative(
     assert "I'm sorry you're feeling that way." in response
 
 
+def test_process_input_through_classifier(
+        processor: AIProcessor, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test if only the classified intent answers and other text reaches sentiment"""
+    vocabulary = ['hello', 'hi', 'book', 'appointment', 'joke']
+
+    def encode(text: str) -> np.ndarray:
+        words = text.lower().split()
+        return np.array([words.count(word) for word in vocabulary] + [0.1])
+
+    embeddings = MagicMock()
+    embeddings.encode.side_effect = encode
+    embeddings.encode_many.side_effect = lambda texts: np.stack(
+        [encode(text) for text in texts],
+    )
+    processor.memory.embeddings = embeddings
+    processor.memory.get_reminders.return_value = []
+    monkeypatch.setattr(ai_config, 'INTENTS', {'intents': [
+        {'name': 'greeting', 'patterns': ['hello', 'hi']},
+        {'name': 'appointment', 'patterns': ['book an appointment']},
+        {'name': 'joke', 'patterns': ['tell me a joke']},
+    ]})
+    # The zero-shot fallback ranks a response-less intent first.
+    zero_shot = MagicMock(return_value=['joke', 'appointment', 'greeting'])
+    monkeypatch.setattr(processor_module, 'zero_shot_rank', zero_shot)
+
+    assert processor.process_input('Hello') == 'Hello!'
+    zero_shot.assert_not_called()
+    response = processor.process_input('I feel terrible and sad today')
+    assert "I'm sorry you're feeling that way." in response
+    zero_shot.assert_called_once()
+
+
 def test_extract_intents(
         processor: AIProcessor,
         monkeypatch: pytest.MonkeyPatch,
@@ -120,3 +156,18 @@ def test_extract_intents(
     monkeypatch.setattr(processor, 'extract_intents', lambda x: ['appointment'])
     response = processor.extract_intents('I want to book an appointment')
     assert 'appointment' in response
+
+
+def test_zero_shot_rank_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test if zero-shot rankings are cached per normalised text and labels"""
+    classifier = MagicMock(return_value={'labels': ['b', 'a']})
+    monkeypatch.setattr(processor_module, 'shared_zero_shot', lambda: classifier)
+    processor_module.zero_shot_cache.clear()
+
+    first = processor_module.zero_shot_rank('Hello  there', ['a', 'b'])
+    second = processor_module.zero_shot_rank('hello there', ['a', 'b'])
+    processor_module.zero_shot_rank('hello there', ['a', 'b', 'c'])
+
+    assert first == second == ['b', 'a']
+    assert classifier.call_count == 2
+    processor_module.zero_shot_cache.clear()
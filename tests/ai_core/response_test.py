@@ -4,23 +4,29 @@ from typing import cast
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 from pytest_mock import MockerFixture
 
 from sanruum.ai_core.memory import AIMemory
 from sanruum.ai_core.processor import AIProcessor
 from sanruum.ai_core.response import AIResponse
+from sanruum.ai_core.semantic_cache import SemanticCache
 from sanruum.intent_system.intent_handler import IntentHandler
 from sanruum.utils.base.logger import logger
 
 # Disable logger to prevent noise in test output
 logger.disabled = True
+# AIResponse() opens AIMemory; keep its files out of data/memory.
+pytestmark = pytest.mark.usefixtures('memory_files')
 
 
 @pytest.fixture
 def ai_response() -> AIResponse:
     """Fixture to provide an AIResponse instance with proper mocks."""
     ai = AIResponse()
+    # Stop the real intents watcher and memory files before swapping in mocks.
+    ai.close()
 
     # Use MagicMock with spec to have proper method signatures
     ai.memory = MagicMock(spec=AIMemory)
@@ -141,3 +147,66 @@ def test_personality_selection(ai_response: AIResponse) -> None:
 
     result = ai_response.get_response('personality_question')
     assert result == 'Friendly intent response'
+
+
+def test_cache_invalidated_when_knowledge_changes(ai_response: AIResponse) -> None:
+    """A new knowledge version empties the response cache."""
+    ai_response.memory.knowledge_version = 1
+    ai_response.get_response('hello')
+    assert ai_response.stats()['response_cache']['size'] == 1
+
+    ai_response.memory.knowledge_version = 2
+    ai_response.get_response('other')
+    assert 'hello' not in ai_response.response_cache
+
+
+@pytest.fixture
+def semantic_response(ai_response: AIResponse) -> AIResponse:
+    """Fixture enabling the semantic tier with a deterministic embedder"""
+    vectors = {
+        'how much does it cost': [1.0, 0.0],
+        'what does it cost': [0.98, 0.2],
+        'where are you': [0.0, 1.0],
+    }
+    ai_response.semantic_cache = SemanticCache(maxsize=8, threshold=0.9)
+    ai_response.memory.embeddings = MagicMock()
+    ai_response.memory.embeddings.encode.side_effect = lambda text: np.array(
+        vectors[text],
+    )
+    ai_response.memory.knowledge_version = 1
+    return ai_response
+
+
+def test_semantic_cache_hit(semantic_response: AIResponse) -> None:
+    """A paraphrase of a cached query reuses its response."""
+    get_intent_response = cast(
+        MagicMock, semantic_response.intent_handler.get_intent_response,
+    )
+    get_intent_response.return_value = 'Prices start at 10 EUR.'
+
+    assert semantic_response.get_response('how much does it cost') == (
+        'Prices start at 10 EUR.'
+    )
+    assert semantic_response.get_response('what does it cost') == (
+        'Prices start at 10 EUR.'
+    )
+    semantic_response.get_response('where are you')
+
+    assert get_intent_response.call_count == 2
+    assert semantic_response.semantic_cache is not None
+    assert semantic_response.semantic_cache.hits == 1
+
+
+def test_semantic_cache_invalidated(semantic_response: AIResponse) -> None:
+    """Entries cached before a knowledge change are not served afterwards."""
+    get_intent_response = cast(
+        MagicMock, semantic_response.intent_handler.get_intent_response,
+    )
+    get_intent_response.return_value = 'Prices start at 10 EUR.'
+    semantic_response.get_response('how much does it cost')
+
+    semantic_response.memory.knowledge_version = 2
+    get_intent_response.return_value = 'Prices start at 12 EUR.'
+    assert semantic_response.get_response('what does it cost') == (
+        'Prices start at 12 EUR.'
+    )
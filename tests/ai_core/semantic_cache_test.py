@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from sanruum.ai_core.semantic_cache import SemanticCache
+
+
+def test_paraphrase_hits_above_threshold() -> None:
+    """A nearby vector returns the cached response; a distant one misses."""
+    cache = SemanticCache(maxsize=4, threshold=0.9)
+    cache.add('what time is it', [1.0, 0.0, 0.0], 'It is noon.')
+
+    hit = cache.lookup([0.95, 0.1, 0.0])
+    assert hit is not None
+    assert hit.query == 'what time is it'
+    assert hit.response == 'It is noon.'
+    assert hit.score == pytest.approx(0.9945, abs=1e-3)
+
+    assert cache.lookup([0.0, 1.0, 0.0]) is None
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_least_recently_used_row_is_replaced() -> None:
+    """When full, the entry not looked up longest makes room."""
+    cache = SemanticCache(maxsize=2, threshold=0.99)
+    cache.add('a', [1.0, 0.0], 'A')
+    cache.add('b', [0.0, 1.0], 'B')
+    assert cache.lookup([1.0, 0.0]) is not None
+    cache.add('c', [-1.0, 0.0], 'C')
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.lookup([0.0, 1.0]) is None
+    hit = cache.lookup([-1.0, 0.0])
+    assert hit is not None and hit.response == 'C'
+
+
+def test_clear_and_readd() -> None:
+    """Re-adding a query updates it in place; clear empties the cache."""
+    cache = SemanticCache(maxsize=2)
+    cache.add('a', np.array([1.0, 0.0]), 'old')
+    cache.add('a', np.array([1.0, 0.0]), 'new')
+    assert len(cache) == 1
+    hit = cache.lookup([1.0, 0.0])
+    assert hit is not None and hit.response == 'new'
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.lookup([1.0, 0.0]) is None
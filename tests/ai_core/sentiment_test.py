@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sanruum.ai_core import sentiment
+from sanruum.ai_core.sentiment import compound_scores
+from sanruum.ai_core.sentiment import polarity_scores
+from sanruum.ai_core.sentiment import sentiment_label
+
+NOTES = [
+    'I feel great today!', 'Terrible night, no sleep.', 'Went for a walk.',
+    'I feel great today!',
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> None:
+    """Start every test with an empty score cache"""
+    sentiment.score_cache.clear()
+
+
+def test_polarity_scores_memoised() -> None:
+    """Test if a text is scored once and later calls hit the cache"""
+    first = polarity_scores('I love this!')
+    first['compound'] = 0.0  # Callers get copies
+    second = polarity_scores('I love this!')
+
+    assert second['compound'] > 0
+    assert sentiment.score_cache.hits == 1
+    assert sentiment_label(second) == 'positive'
+    assert sentiment_label({'compound': 0.0}) == 'neutral'
+
+
+def test_compound_scores_series() -> None:
+    """Test if a Series with duplicates and gaps scores in input order"""
+    notes = pd.Series(NOTES + [None, np.nan])
+
+    scores = compound_scores(notes)
+
+    assert scores.dtype == np.float64
+    assert scores.shape == (6,)
+    assert scores[0] > 0 > scores[1]
+    assert scores[0] == scores[3]
+    assert np.isnan(scores[4:]).all()
+    assert scores[0] == pytest.approx(polarity_scores(NOTES[0])['compound'])
+
+
+def test_compound_scores_process_pool() -> None:
+    """Test if the process pool gives the same scores as scoring in-process"""
+    serial = compound_scores(NOTES, n_jobs=1)
+    parallel = compound_scores(NOTES, n_jobs=2, chunksize=1, parallel_min=1)
+
+    np.testing.assert_array_equal(parallel, serial)
+    assert compound_scores([]).shape == (0,)
+
+
+def test_compound_scores_all_cores(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test if n_jobs=-1 spreads the texts over every core"""
+    pools: list[int] = []
+
+    class RecordingPool(ThreadPoolExecutor):
+        def __init__(self, max_workers: int) -> None:
+            pools.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr('sanruum.nlp.utils.parallel.os.cpu_count', lambda: 2)
+    monkeypatch.setattr(sentiment, 'ProcessPoolExecutor', RecordingPool)
+    scores = compound_scores(NOTES, n_jobs=-1, chunksize=1, parallel_min=1)
+
+    assert pools == [2]
+    np.testing.assert_array_equal(scores, compound_scores(NOTES, n_jobs=1))
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sanruum.ai_core.embedding_store import EmbeddingStore
+from sanruum.ai_core.user_memory_store import migrate_pickles_to_sqlite
+from sanruum.ai_core.user_memory_store import open_user_memory_store
+from sanruum.ai_core.user_memory_store import PickleUserMemoryStore
+from sanruum.ai_core.user_memory_store import SQLiteUserMemoryStore
+from sanruum.ai_core.user_memory_store import user_vectors_path
+
+MEMORY = {
+    'history': [
+        {'role': 'user', 'message': 'Hi', 'vector_id': 3},
+        {'role': 'ai', 'message': 'Hello!'},
+    ],
+    'pricing': [
+        {'data': 'It depends.', 'vector_id': 4, 'created': 1.5, 'last_hit': 2.5},
+        {'data': 'Ask us.'},
+    ],
+}
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> SQLiteUserMemoryStore:
+    """Fixture for an SQLite user memory store in a temporary directory"""
+    return SQLiteUserMemoryStore(tmp_path / 'memory.sqlite3')
+
+
+def test_round_trip(store: SQLiteUserMemoryStore) -> None:
+    """Test if history, knowledge and last intent are restored per user"""
+    store.save('alice', MEMORY, 'pricing')
+    store.save('bob', {'history': []}, None)
+
+    assert store.load('alice') == (MEMORY, 'pricing')
+    assert store.load('bob') == ({'history': []}, None)
+    assert store.load('carol') is None
+    assert sorted(store.user_ids()) == ['alice', 'bob']
+
+
+def test_save_replaces_and_delete(store: SQLiteUserMemoryStore) -> None:
+    """Test if saving overwrites earlier rows and delete removes the user"""
+    store.save('alice', MEMORY, 'pricing')
+    store.save('alice', {'history': [{'role': 'user', 'message': 'Bye'}]}, None)
+    memory, last_intent = store.load('alice') or ({}, 'missing')
+
+    assert memory == {'history': [{'role': 'user', 'message': 'Bye'}]}
+    assert last_intent is None
+    store.delete('alice')
+    assert store.load('alice') is None
+
+
+def test_failed_batch_is_rolled_back(store: SQLiteUserMemoryStore) -> None:
+    """Test if a batch that fails part-way writes nothing"""
+    broken = {'history': [{'role': 'user', 'message': object()}]}
+    with pytest.raises(Exception):
+        store.save_many([('alice', (MEMORY, None)), ('bob', (broken, None))])
+    assert store.load('alice') is None
+
+
+def test_migrate_pickles(tmp_path: Path) -> None:
+    """Test if the migrator copies every pickle and skips unreadable files"""
+    PickleUserMemoryStore(tmp_path).save('alice', MEMORY, 'pricing')
+    with open(tmp_path / 'memory_bob.pkl', 'wb') as file:
+        pickle.dump(({'history': []}, None), file)
+    (tmp_path / 'memory_broken.pkl').write_bytes(b'not a pickle')
+
+    assert migrate_pickles_to_sqlite(tmp_path, batch_size=1, remove_pickles=True) == 2
+    store = open_user_memory_store('sqlite', tmp_path)
+    assert store.load('alice') == (MEMORY, 'pricing')
+    assert not (tmp_path / 'memory_alice.pkl').exists()
+    assert (tmp_path / 'memory_broken.pkl').exists()
+
+
+def test_migrate_moves_inline_vectors(tmp_path: Path) -> None:
+    """Test if inline vectors of old pickles land in the user's embedding store"""
+    legacy = {
+        'history': [{'role': 'user', 'message': 'Hi', 'vector': [1.0, 0.0]}],
+        'pricing': [{'data': 'It depends.', 'vector': [0.0, 1.0]}],
+    }
+    PickleUserMemoryStore(tmp_path).save('alice', legacy, None)
+
+    assert migrate_pickles_to_sqlite(tmp_path) == 1
+    memory, _ = open_user_memory_store('sqlite', tmp_path).load('alice') or ({}, None)
+    vectors = EmbeddingStore(user_vectors_path(tmp_path, 'alice'))
+    np.testing.assert_array_equal(
+        vectors.get(memory['pricing'][0]['vector_id']), [0.0, 1.0],
+    )
+    np.testing.assert_array_equal(
+        vectors.get(memory['history'][0]['vector_id']), [1.0, 0.0],
+    )
+    vectors.close()
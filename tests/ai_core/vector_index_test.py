@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sanruum.ai_core.vector_index import create_vector_index
+from sanruum.ai_core.vector_index import ExactVectorIndex
+from sanruum.ai_core.vector_index import IVFFlatVectorIndex
+from sanruum.ai_core.vector_index import load_vector_index
+
+
+@pytest.fixture
+def index() -> ExactVectorIndex:
+    """Fixture for a small ExactVectorIndex"""
+    index = ExactVectorIndex(initial_capacity=2)
+    index.add_many(
+        ['health', 'health', 'food'],
+        ['sleep', 'exercise', 'apples'],
+        np.array([[1.0, 0.0], [0.6, 0.8], [0.0, 2.0]]),
+    )
+    return index
+
+
+def test_vectors_are_normalised(index: ExactVectorIndex) -> None:
+    """Test if stored rows have unit length"""
+    assert index.vectors.dtype == np.float32
+    np.testing.assert_allclose(np.linalg.norm(index.vectors, axis=1), 1.0, rtol=1e-6)
+
+
+def test_search_returns_best_first(index: ExactVectorIndex) -> None:
+    """Test if search orders matches by cosine similarity"""
+    matches = index.search([1.0, 0.1], k=2)
+    assert [match.text for match in matches] == ['sleep', 'exercise']
+    assert matches[0].topic == 'health'
+    assert matches[0].score > matches[1].score
+
+
+def test_search_clamps_k(index: ExactVectorIndex) -> None:
+    """Test if asking for more matches than items returns every item"""
+    assert len(index.search([0.0, 1.0], k=10)) == 3
+
+
+def test_add_grows_capacity(index: ExactVectorIndex) -> None:
+    """Test if incremental adds extend the matrix"""
+    index.add('food', 'pears', [0.1, 1.0])
+    assert len(index) == 4
+    assert index.search([0.1, 1.0])[0].text == 'pears'
+
+
+def test_dimension_mismatch(index: ExactVectorIndex) -> None:
+    """Test if vectors of a different size are rejected"""
+    with pytest.raises(ValueError):
+        index.add('food', 'bread', [1.0, 0.0, 0.0])
+
+
+def test_clear(index: ExactVectorIndex) -> None:
+    """Test if clear empties the index"""
+    index.clear()
+    assert len(index) == 0
+    assert index.search([1.0, 0.0]) == []
+
+
+def test_remove(index: ExactVectorIndex) -> None:
+    """Test if removed items no longer match"""
+    (item_id,) = index.find_ids('health', 'sleep')
+    assert index.remove(item_id)
+    assert not index.remove(item_id)
+    assert len(index) == 2
+    assert 'sleep' not in [match.text for match in index.search([1.0, 0.0], k=3)]
+
+
+def test_save_and_load(index: ExactVectorIndex, tmp_path: Path) -> None:
+    """Test if a saved index round-trips through disk"""
+    index.remove(index.find_ids('food')[0])
+    path = tmp_path / 'index.npz'
+    index.save(path)
+
+    loaded = load_vector_index(path)
+    assert isinstance(loaded, ExactVectorIndex)
+    assert sorted(loaded.items()) == sorted(index.items())
+    assert loaded.search([1.0, 0.1], k=2) == index.search([1.0, 0.1], k=2)
+    next_id = index.add('food', 'pears', [0.0, 1.0])
+    assert loaded.add('food', 'pears', [0.0, 1.0]) == next_id
+
+
+def test_saved_texts_are_not_padded(tmp_path: Path) -> None:
+    """Test if one long text does not pad every stored text on disk"""
+    index = ExactVectorIndex()
+    texts = ['x' * 10_000, '', 'süß 🍎', *[f'short {i}' for i in range(200)]]
+    index.add_many(['topic'] * len(texts), texts, np.ones((len(texts), 2)))
+    path = tmp_path / 'index.npz'
+    index.save(path)
+
+    assert path.stat().st_size < len(texts) * 10_000
+    assert sorted(load_vector_index(path).items()) == sorted(index.items())
+
+
+def test_create_unknown_backend() -> None:
+    """Test if an unknown backend name is rejected"""
+    with pytest.raises(ValueError):
+        create_vector_index('annoy')
+
+
+@pytest.fixture
+def clustered() -> np.ndarray:
+    """Fixture for 2000 vectors spread around 20 cluster centres"""
+    rng = np.random.default_rng(42)
+    centres = rng.normal(size=(20, 16))
+    labels = rng.integers(0, 20, size=2000)
+    return np.asarray(centres[labels] + 0.1 * rng.normal(size=(2000, 16)))
+
+
+def test_ivf_trains_and_finds_neighbours(clustered: np.ndarray) -> None:
+    """Test if the IVF index clusters its items and keeps recall high"""
+    exact = ExactVectorIndex()
+    ivf = IVFFlatVectorIndex(nlist=20, nprobe=4, train_threshold=1000)
+    texts = [str(i) for i in range(len(clustered))]
+    exact.add_many(['t'] * len(texts), texts, clustered)
+    ivf.add_many(['t'] * len(texts), texts, clustered)
+    assert ivf.is_trained
+
+    hits = 0
+    for query in clustered[:50]:
+        expected = {match.text for match in exact.search(query, k=10)}
+        hits += len(expected & {match.text for match in ivf.search(query, k=10)})
+    assert hits / 500 > 0.9
+
+
+def test_ivf_remove_and_reload(clustered: np.ndarray, tmp_path: Path) -> None:
+    """Test if IVF deletes and persistence keep the bucket layout"""
+    ivf = IVFFlatVectorIndex(nlist=8, nprobe=8, train_threshold=100)
+    ids = ivf.add_many(['t'] * 200, [str(i) for i in range(200)], clustered[:200])
+    assert ivf.remove(ids[0])
+    assert ivf.search(clustered[0], k=1)[0].text != '0'
+
+    path = tmp_path / 'ivf.npz'
+    ivf.save(path)
+    loaded = load_vector_index(path)
+    assert isinstance(loaded, IVFFlatVectorIndex)
+    assert loaded.is_trained and len(loaded) == 199
+    assert loaded.search(clustered[5], k=3) == ivf.search(clustered[5], k=3)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from sanruum.ai_core.zero_shot_service import PretokenizedZeroShot
+from sanruum.ai_core.zero_shot_service import ZeroShotService
+
+VOCAB = (
+    '[PAD] [UNK] [CLS] [SEP] this example is . greeting farewell weather '
+    'hello there goodbye see you it rains today'
+).split()
+
+
+def fake_pipeline(
+        texts: str | list[str], candidate_labels: list[str], **kwargs: Any,
+) -> Any:
+    """Ranks labels by how often their first letter occurs in the text"""
+    def classify(text: str) -> dict[str, Any]:
+        labels = sorted(candidate_labels, key=lambda label: -text.count(label[0]))
+        return {'sequence': text, 'labels': labels, 'scores': [0.5] * len(labels)}
+    if isinstance(texts, str):
+        return classify(texts)
+    return [classify(text) for text in texts]
+
+
+def test_concurrent_calls_share_a_batch() -> None:
+    """Test if concurrent callers are served by one batched pipeline call"""
+    pipeline = MagicMock(side_effect=fake_pipeline)
+    service = ZeroShotService(pipeline, max_batch_size=8, max_wait_ms=200)
+    results: dict[str, list[str]] = {}
+
+    def classify(text: str) -> None:
+        results[text] = service(text, candidate_labels=['a', 'b'])['labels']
+
+    threads = [threading.Thread(target=classify, args=(text,)) for text in 'ab']
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    service.close()
+
+    assert results == {'a': ['a', 'b'], 'b': ['b', 'a']}
+    assert pipeline.call_count == 1
+    assert pipeline.call_args.kwargs['batch_size'] == 2
+
+
+def test_label_sets_and_passthrough() -> None:
+    """Test if label sets are grouped and extra options bypass the batcher"""
+    pipeline = MagicMock(side_effect=fake_pipeline)
+    service = ZeroShotService(pipeline, max_wait_ms=1)
+
+    results = service(['ab', 'bb'], candidate_labels=['a', 'b'])
+    direct = service('xyz', candidate_labels=['x', 'y'], multi_label=True)
+    service.close()
+
+    assert [result['labels'][0] for result in results] == ['a', 'b']
+    assert direct['labels'][0] == 'x'
+    assert pipeline.call_args.kwargs == {
+        'candidate_labels': ['x', 'y'], 'multi_label': True,
+    }
+
+
+@pytest.fixture
+def nli_pipeline(tmp_path: Path) -> Any:
+    """Zero-shot pipeline over a tiny, randomly initialised BERT"""
+    torch = pytest.importorskip('torch')
+    transformers = pytest.importorskip('transformers')
+    vocab = tmp_path / 'vocab.txt'
+    vocab.write_text('\n'.join(VOCAB), encoding='utf-8')
+    config = transformers.BertConfig(
+        vocab_size=len(VOCAB), hidden_size=16, num_hidden_layers=1,
+        num_attention_heads=2, intermediate_size=32, initializer_range=0.5,
+        id2label={0: 'contradiction', 1: 'neutral', 2: 'entailment'},
+        label2id={'contradiction': 0, 'neutral': 1, 'entailment': 2},
+    )
+    torch.manual_seed(0)
+    model = transformers.BertForSequenceClassification(config).eval()
+    return transformers.pipeline(
+        'zero-shot-classification', model=model,
+        tokenizer=transformers.BertTokenizer(str(vocab)), device=-1,
+    )
+
+
+def test_pretokenized_matches_pipeline(nli_pipeline: Any) -> None:
+    """Test if reusing hypothesis encodings gives the pipeline's ranking"""
+    labels = ['greeting', 'farewell', 'weather']
+    texts = ['hello there', 'goodbye see you', 'it rains today']
+    classifier = PretokenizedZeroShot(nli_pipeline)
+
+    results = classifier(texts, candidate_labels=labels, batch_size=2)
+    single = classifier(texts[0], candidate_labels=labels)
+
+    for text, result in zip(texts, results):
+        expected = nli_pipeline(text, candidate_labels=labels)
+        assert result['labels'] == expected['labels']
+        assert result['scores'] == pytest.approx(expected['scores'], abs=1e-5)
+    assert single == results[0]
+    assert classifier.stats() == {'hypotheses': 3}
+
+
+def test_pretokenized_passthrough() -> None:
+    """Test if options the fast path does not cover go to the pipeline"""
+    pipeline = MagicMock()
+    pipeline.model.config.label2id = {'entailment': 0}
+    pipeline.tokenizer.model_max_length = 512
+    classifier = PretokenizedZeroShot(pipeline)
+
+    classifier('text', candidate_labels=['a', 'b'], multi_label=True)
+
+    assert pipeline.call_args.kwargs['multi_label'] is True
+    assert pipeline.call_args.kwargs['hypothesis_template'] == 'This example is {}.'
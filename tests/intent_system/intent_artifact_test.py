@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import pickle
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sanruum.intent_system import intent_artifact
+from sanruum.intent_system.intent_artifact import load_compiled_intents
+
+
+def write_intents(path: Path, *patterns: str) -> Path:
+    document: dict[str, Any] = {
+        'intents': [{'name': 'greeting', 'patterns': list(patterns), 'response': 'Hi'}],
+    }
+    path.write_text(json.dumps(document), encoding='utf-8')
+    return path
+
+
+def test_artifact_is_reused(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test if an up-to-date artifact is loaded instead of recompiling"""
+    source = write_intents(tmp_path / 'intents.json', 'hello')
+    artifact = tmp_path / 'intents.pkl'
+    compiled = load_compiled_intents(source, artifact)
+    assert artifact.exists()
+
+    def fail(data: bytes) -> None:
+        raise AssertionError('recompiled')
+
+    monkeypatch.setattr(intent_artifact, 'compile_intents', fail)
+    loaded = load_compiled_intents(source, artifact)
+    assert loaded.source_digest == compiled.source_digest
+    assert loaded.matcher.match(['hello']) is not None
+
+
+def test_stale_artifact_is_rebuilt(tmp_path: Path) -> None:
+    """Test if a changed source or format version triggers a recompile"""
+    source = write_intents(tmp_path / 'intents.json', 'hello')
+    artifact = tmp_path / 'intents.pkl'
+    load_compiled_intents(source, artifact)
+
+    write_intents(source, 'good morning')
+    compiled = load_compiled_intents(source, artifact)
+    assert compiled.matcher.patterns == ['good morning']
+
+    with artifact.open('wb') as file:
+        pickle.dump(replace(compiled, version=0), file)
+    assert load_compiled_intents(source, artifact).version == (
+        intent_artifact.ARTIFACT_VERSION
+    )
+
+
+def test_invalid_source(tmp_path: Path) -> None:
+    """Test if malformed intents files raise ValueError"""
+    source = tmp_path / 'intents.json'
+    source.write_text('[1, 2]', encoding='utf-8')
+    with pytest.raises(ValueError):
+        load_compiled_intents(source, None)
+
+
+def test_broken_artifact_is_rebuilt(tmp_path: Path) -> None:
+    """Test if an artifact that fails to unpickle in any way is recompiled"""
+    source = write_intents(tmp_path / 'intents.json', 'hello')
+    artifact = tmp_path / 'intents.pkl'
+    # References a module that does not exist, so unpickling raises ImportError.
+    artifact.write_bytes(b'cno_such_module\nCompiledIntents\n.')
+
+    compiled = load_compiled_intents(source, artifact)
+    assert compiled.matcher.patterns == ['hello']
+    assert load_compiled_intents(source, artifact).source_digest == (
+        compiled.source_digest
+    )
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from sanruum.config import BaseConfig
+from sanruum.intent_system.intent_artifact import CompiledIntents
+from sanruum.intent_system.intent_artifact import shared_compiled_intents
+from sanruum.intent_system.intent_handler import IntentHandler
+
+
+@pytest.fixture
+def intents_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Fixture that points the handler at a temporary intents file"""
+    path = tmp_path / 'intents.json'
+    path.write_text(json.dumps({
+        'intents': [{'name': 'farewell', 'patterns': ['bye'], 'response': 'Bye!'}],
+    }))
+    monkeypatch.setattr('sanruum.intent_system.intent_handler.INTENTS_FILE', path)
+    monkeypatch.setattr(BaseConfig, 'INTENTS_ARTIFACT_FILE', tmp_path / 'intents.pkl')
+    return path
+
+
+def test_reload_swaps_intents(intents_file: Path) -> None:
+    """Test if a reload picks up edits to the intents file"""
+    handler = IntentHandler(reload_interval=None)
+    assert handler.get_intent_response('bye') == 'Bye!'
+
+    intents_file.write_text(json.dumps({
+        'intents': [{'name': 'farewell', 'patterns': ['bye'], 'response': 'Ciao!'}],
+    }))
+    assert handler.reload()
+    assert handler.get_intent_response('bye') == 'Ciao!'
+    handler.close()
+
+
+def test_failed_reload_keeps_intents(intents_file: Path) -> None:
+    """Test if a broken edit leaves the loaded intents in place"""
+    handler = IntentHandler(reload_interval=None)
+    intents_file.write_text('{"intents": [')
+
+    assert not handler.reload()
+    assert handler.get_intent_response('bye') == 'Bye!'
+    handler.close()
+
+
+def test_reload_notifies_listener(intents_file: Path) -> None:
+    """Test if a reload updates the shared intents and calls on_reload"""
+    reloaded: list[CompiledIntents] = []
+    handler = IntentHandler(reload_interval=None, on_reload=reloaded.append)
+
+    intents_file.write_text(json.dumps({
+        'intents': [{'name': 'farewell', 'patterns': ['bye'], 'response': 'Ciao!'}],
+    }))
+    assert handler.reload()
+    assert reloaded == [handler.compiled]
+    assert shared_compiled_intents(intents_file) is handler.compiled
+    handler.close()
+
+
+def test_close_stops_watcher(intents_file: Path) -> None:
+    """Test if leaving the handler's context stops its watcher thread"""
+    with IntentHandler(reload_interval=60) as handler:
+        watcher = handler.watcher
+        assert watcher is not None and watcher._thread is not None
+        thread = watcher._thread
+    assert handler.watcher is None
+    assert not thread.is_alive()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from sanruum.intent_system.intent_matcher import IntentMatcher
+
+
+@pytest.fixture
+def intents() -> list[dict[str, Any]]:
+    """Fixture for a small intents table"""
+    return [
+        {'name': 'greeting', 'patterns': ['hello', 'good morning'], 'response': 'Hi!'},
+        {'name': 'time', 'patterns': ['what time is it'], 'response': 'Noon.'},
+        {'name': 'empty', 'response': 'Never matched.'},
+    ]
+
+
+def test_match_returns_best_intent(intents: list[dict[str, Any]]) -> None:
+    """Test if the highest scoring pattern across all intents wins"""
+    match = IntentMatcher(intents).match(['tell me what time is it'])
+
+    assert match is not None
+    assert match.intent['name'] == 'time'
+    assert match.pattern == 'what time is it'
+    assert match.score == 100
+
+
+def test_match_respects_cutoff(intents: list[dict[str, Any]]) -> None:
+    """Test if questions scoring below the cutoff do not match"""
+    matcher = IntentMatcher(intents)
+
+    assert matcher.match(['completely unrelated']) is None
+    assert matcher.match([]) is None
+    assert IntentMatcher([]).match(['hello']) is None
+
+
+def test_first_matching_question_wins(intents: list[dict[str, Any]]) -> None:
+    """Test if earlier questions take precedence over later ones"""
+    match = IntentMatcher(intents).match(['blah blah', 'Good Morning!', 'hello'])
+
+    assert match is not None
+    assert match.question == 'Good Morning!'
+    assert match.intent['name'] == 'greeting'
+    assert IntentMatcher(intents).scores(['hello']).shape == (1, 3)
+
+
+def test_index_prunes_candidates(intents: list[dict[str, Any]]) -> None:
+    """Test if only patterns sharing a token or trigram are candidates"""
+    matcher = IntentMatcher(intents)
+
+    assert matcher.candidates('what is the time').tolist() == [2]
+    # "helo" is in no pattern, so its trigrams find "hello"
+    assert matcher.candidates('helo').tolist() == [0]
+
+    match = matcher.match(['helo'])
+    assert match is not None and match.intent['name'] == 'greeting'
+    assert matcher.full_scans == 0
+
+
+def test_full_scan_fallback(intents: list[dict[str, Any]]) -> None:
+    """Test if questions without candidates are scored against every pattern"""
+    matcher = IntentMatcher(intents)
+
+    assert matcher.candidates('xyz').size == 0
+    assert matcher.match(['xyz']) is None
+    assert matcher.full_scans == 1
+
+
+def test_index_agrees_with_full_scan(intents: list[dict[str, Any]]) -> None:
+    """Test if pruning does not change the chosen pattern"""
+    indexed = IntentMatcher(intents)
+    scanned = IntentMatcher(intents, use_index=False)
+
+    for question in ['good morning to you', 'what time', 'hello there', 'nope']:
+        assert indexed.match([question]) == scanned.match([question])
+
+
+def test_exact_fast_path(intents: list[dict[str, Any]]) -> None:
+    """Test if questions containing a pattern skip fuzzy scoring"""
+    matcher = IntentMatcher(intents)
+    match = matcher.match(['well hello'])
+
+    assert match is not None
+    assert match.exact and match.score == 100
+    assert match.intent['name'] == 'greeting'
+    assert matcher.exact_hits == 1
+
+    fuzzy = matcher.match(['helo'])
+    assert fuzzy is not None and not fuzzy.exact
+
+
+def test_common_tokens_join_small_candidate_sets() -> None:
+    """Test if common-token patterns are kept unless rare tokens suffice"""
+    intents = [
+        {'name': 'zebra', 'patterns': ['zebra crossing'], 'response': 'Stop.'},
+        {
+            'name': 'filler',
+            'patterns': [f'please item{i}' for i in range(70)],
+            'response': 'Sure.',
+        },
+        {
+            'name': 'lions',
+            'patterns': [f'lion pride {i}' for i in range(64)],
+            'response': 'Roar.',
+        },
+    ]
+    matcher = IntentMatcher(intents)
+
+    # "zebra" alone yields one candidate, so the common "please" still counts
+    assert matcher.candidates('please zebra').tolist() == list(range(71))
+    # "lion" already yields a common posting's worth, so "please" is skipped
+    assert matcher.candidates('please lion').tolist() == list(range(71, 135))
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from sanruum.intent_system.pattern_automaton import PatternAutomaton
+from sanruum.intent_system.pattern_automaton import PatternHit
+
+
+def automaton() -> PatternAutomaton:
+    return PatternAutomaton(
+        p.split() for p in ['hi', 'good morning', 'morning', 'what can you do', '']
+    )
+
+
+def test_find_all_overlapping_patterns() -> None:
+    """Test if every contained pattern is reported with its token span"""
+    hits = automaton().find_all('well good morning to you'.split())
+
+    assert hits == [PatternHit(1, 1, 3), PatternHit(2, 2, 3)]
+    assert len(automaton()) == 4
+
+
+def test_whole_words_only() -> None:
+    """Test if patterns do not match inside longer words"""
+    assert automaton().find_all('this is high'.split()) == []
+    assert automaton().best([]) is None
+
+
+def test_best_prefers_longest_pattern() -> None:
+    """Test if the longest pattern wins, including after a failed prefix"""
+    tokens = 'what can i say good morning what can you do'.split()
+
+    assert automaton().best(tokens) == PatternHit(3, 6, 10)
+    assert automaton().best('morning'.split()) == PatternHit(2, 0, 1)
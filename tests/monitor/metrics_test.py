@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from sanruum.monitor.metrics import Histogram
+
+
+def test_histogram_buckets_and_quantiles() -> None:
+    """Test if values land in the right buckets and quantiles are bounded"""
+    histogram = Histogram([1, 5, 10])
+    for value in (0.5, 1, 3, 7, 20):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot['buckets'] == {'1': 2, '5': 1, '10': 1, 'inf': 1}
+    assert snapshot['count'] == 5
+    assert snapshot['max'] == 20
+    assert histogram.quantile(0.5) == 5
+    assert histogram.quantile(1.0) == 20
+
+    histogram.reset()
+    assert histogram.snapshot()['count'] == 0
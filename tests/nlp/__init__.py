@@ -0,0 +1,2 @@
+# tests\nlp\__init__.py
+from __future__ import annotations
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+
+from sanruum.nlp.utils.parallel import chunked
+from sanruum.nlp.utils.parallel import imap_chunks
+from sanruum.nlp.utils.parallel import resolve_jobs
+
+
+def double(chunk: list[int]) -> list[int]:
+    return [2 * item for item in chunk]
+
+
+def tag_pid(chunk: list[int]) -> list[tuple[int, int]]:
+    return [(item, os.getpid()) for item in chunk]
+
+
+def test_chunked_and_jobs() -> None:
+    """Test if items are split into ordered chunks and job counts resolve"""
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 2)) == []
+    assert resolve_jobs(None) == resolve_jobs(-1) == (os.cpu_count() or 1)
+    assert resolve_jobs(0) == 1
+
+
+def test_imap_chunks_keeps_order() -> None:
+    """Test if pool results come back in input order"""
+    results = list(imap_chunks(double, range(100), n_jobs=2, chunksize=7))
+
+    assert results == [2 * item for item in range(100)]
+
+
+def test_imap_chunks_in_process() -> None:
+    """Test if a single job runs in this process"""
+    results = list(imap_chunks(tag_pid, [1, 2, 3], n_jobs=1))
+
+    assert {pid for _, pid in results} == {os.getpid()}
+
+
+def test_imap_chunks_streams_lazily() -> None:
+    """Test if only a bounded number of chunks is read ahead"""
+    consumed = 0
+
+    def numbers() -> Iterator[int]:
+        nonlocal consumed
+        for item in range(10_000):
+            consumed += 1
+            yield item
+
+    stream = imap_chunks(double, numbers(), n_jobs=2, chunksize=10, max_pending=3)
+    first = [next(stream) for _ in range(5)]
+    stream.close()
+
+    assert first == [0, 2, 4, 6, 8]
+    assert consumed <= 40
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from sanruum.nlp.utils.preprocessing import get_pipeline
+from sanruum.nlp.utils.preprocessing import normalize_unicode
+from sanruum.nlp.utils.preprocessing import PIPELINE_PRESETS
+from sanruum.nlp.utils.preprocessing import PreprocessingPipeline
+from sanruum.nlp.utils.preprocessing import remove_punctuation
+from sanruum.nlp.utils.preprocessing import remove_whitespace
+from sanruum.nlp.utils.preprocessing import tokenize_word
+from sanruum.nlp.utils.preprocessing import TokenMemo
+
+
+def test_unknown_steps_and_presets() -> None:
+    """Test if unknown steps and presets are rejected"""
+    with pytest.raises(ValueError):
+        PreprocessingPipeline(['lower', 'shout'])
+    with pytest.raises(ValueError):
+        PreprocessingPipeline.from_preset('nonexistent')
+    assert set(PIPELINE_PRESETS) >= {'default', 'intent-matching', 'training'}
+
+
+def test_steps_run_in_canonical_order() -> None:
+    """Test if steps are applied in a fixed order however they are given"""
+    pipeline = PreprocessingPipeline(['punctuation', 'lower'])
+
+    assert pipeline.steps == ('lower', 'punctuation')
+    assert pipeline('Hello, World!') == ['hello', 'world']
+
+
+def test_intent_matching_preset() -> None:
+    """Test if the intent-matching preset cleans without dropping words"""
+    pipeline = get_pipeline('intent-matching')
+
+    result = pipeline(
+        "I can't reach www.example.com, mail me@example.com!", return_string=True,
+    )
+
+    assert result == 'i can not reach mail'
+    assert pipeline('   ', return_string=True) == ''
+    assert pipeline(None) == []
+    assert get_pipeline('intent-matching') is pipeline
+
+
+@pytest.mark.parametrize(
+    'text', ['I cannot stay', 'Naïve café — “quoted” text', 'Line one.\nLine two?'],
+)
+def test_whitespace_split_matches_word_tokenize(text: str) -> None:
+    """Test if the fast tokenizer gives word_tokenize's tokens"""
+    pipeline = PreprocessingPipeline(['unicode', 'lower', 'punctuation'])
+    expected = tokenize_word(
+        remove_whitespace(remove_punctuation(normalize_unicode(text).lower())),
+    )
+
+    assert pipeline(text) == expected
+
+
+@pytest.fixture
+def lemmatizer() -> MagicMock:
+    """Lemmatizer that strips a plural s"""
+    fake = MagicMock()
+    fake.lemmatize.side_effect = lambda word: word.removesuffix('s')
+    return fake
+
+
+def test_token_memo_hits(lemmatizer: MagicMock) -> None:
+    """Test if repeated tokens are stemmed and lemmatized once"""
+    memo = TokenMemo(lemmatizer=lemmatizer, maxsize=10)
+
+    stems = [memo.stem(token) for token in ['running', 'running', 'runs']]
+    lemmas = [memo.lemmatize(word) for word in ['cats', 'cats', 'dog']]
+
+    assert stems == ['run', 'run', 'run']
+    assert lemmas == ['cat', 'cat', 'dog']
+    assert memo.stems.hits == 1
+    assert lemmatizer.lemmatize.call_count == 2
+
+
+def test_token_memo_is_bounded(lemmatizer: MagicMock) -> None:
+    """Test if the memo keeps at most maxsize tokens"""
+    memo = TokenMemo(lemmatizer=lemmatizer, maxsize=2)
+    for word in ['cats', 'dogs', 'birds']:
+        memo.lemmatize(word)
+
+    assert len(memo.lemmas) == 2
+    assert memo.stats()['lemmas']['evictions'] == 1
+
+
+def test_token_memo_persistence(tmp_path: Path, lemmatizer: MagicMock) -> None:
+    """Test if a saved vocabulary is reloaded and foreign files are ignored"""
+    path = tmp_path / 'token_memo.json'
+    memo = TokenMemo(lemmatizer=lemmatizer)
+    memo.stem('running')
+    memo.lemmatize('cats')
+    memo.save(path)
+
+    restored = TokenMemo(lemmatizer=lemmatizer)
+    other = TokenMemo(stemmer=MagicMock(), lemmatizer=lemmatizer)
+
+    assert restored.load(path) == 2
+    assert restored.stems.snapshot() == {'running': 'run'}
+    assert restored.lemmas.snapshot() == {'cats': 'cat'}
+    assert other.load(path) == 0
+    assert restored.load(tmp_path / 'missing.json') == 0
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from sanruum.utils.base.cache import LRUCache
+
+
+def test_evicts_least_recently_used() -> None:
+    """The entry not touched longest goes first once maxsize is exceeded."""
+    cache: LRUCache[str, str] = LRUCache(maxsize=2)
+    cache['a'] = '1'
+    cache['b'] = '2'
+    assert cache.get('a') == '1'
+    cache['c'] = '3'
+
+    assert 'a' in cache and 'c' in cache
+    assert 'b' not in cache
+    assert cache.evictions == 1
+
+
+def test_byte_budget() -> None:
+    """Entries are evicted to stay within max_bytes; oversized ones are refused."""
+    cache: LRUCache[str, str] = LRUCache(
+        maxsize=100, max_bytes=10, sizeof=lambda key, value: len(value),
+    )
+    cache['a'] = 'x' * 4
+    cache['b'] = 'x' * 4
+    cache['c'] = 'x' * 4
+    assert list(cache) == ['b', 'c']
+    assert cache.bytes == 8
+
+    cache['big'] = 'x' * 11
+    assert 'big' not in cache
+    assert cache.evictions == 2
+
+
+def test_ttl_expiry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Entries older than their TTL are reported as misses."""
+    now = [100.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    cache: LRUCache[str, str] = LRUCache(ttl=10)
+    cache['a'] = '1'
+    cache.set('b', '2', ttl=60)
+
+    now[0] += 30
+    assert cache.get('a') is None
+    assert cache.get('b') == '2'
+    assert cache.expirations == 1
+
+    now[0] += 60
+    assert cache.purge_expired() == 1
+    assert len(cache) == 0
+
+
+def test_stats_and_clear() -> None:
+    """Counters survive clear()."""
+    cache: LRUCache[str, int] = LRUCache()
+    cache['a'] = 1
+    cache.get('a')
+    cache.get('missing')
+    cache.clear()
+
+    stats = cache.stats()
+    assert stats['size'] == 0
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['hit_rate'] == 0.5
+    with pytest.raises(KeyError):
+        cache['a']
+
+
+def test_snapshot() -> None:
+    """Snapshots list live entries oldest first without counting hits."""
+    cache: LRUCache[str, int] = LRUCache(maxsize=3)
+    cache['a'] = 1
+    cache['b'] = 2
+    cache.get('a')
+    cache.set('c', 3, ttl=-1)
+
+    assert list(cache.snapshot().items()) == [('b', 2), ('a', 1)]
+    assert cache.hits == 1
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from sanruum.utils.base.file_watcher import FileWatcher
+
+
+def test_check_reports_changes(tmp_path: Path) -> None:
+    """Test if modifications and re-creation trigger the callback"""
+    path = tmp_path / 'watched.json'
+    path.write_text('{}')
+    seen: list[Path] = []
+    watcher = FileWatcher(path, seen.append)
+
+    assert not watcher.check()
+    path.write_text('{"a": 1}')
+    assert watcher.check()
+    assert seen == [path]
+
+    path.unlink()
+    assert watcher.check()
+    assert seen == [path]
+
+    path.write_text('{}')
+    os.utime(path, ns=(1, 1))
+    assert watcher.check()
+    assert len(seen) == 2
+
+
+def test_failing_callback_is_contained(tmp_path: Path) -> None:
+    """Test if an exception in the callback does not escape"""
+    path = tmp_path / 'watched.json'
+    path.write_text('{}')
+
+    def fail(changed: Path) -> None:
+        raise ValueError('broken')
+
+    watcher = FileWatcher(path, fail)
+    path.write_text('{"a": 1}')
+    assert watcher.check()